@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Command line interface of the Oozie to Airflow converter"""
+import argparse
+import logging
+import os
+
+# pylint: disable=no-name-in-module
+from distutils.spawn import find_executable
+from subprocess import CalledProcessError, check_call
+from typing import List, Type
+
+from o2a.converter.asset_manager import AssetManager, LINK_MODES, LINK_MODE_REFLINK
+from o2a.converter.mappers import ACTION_MAP
+from o2a.converter.oozie_converter import OozieConverter
+from o2a.converter.constants import HDFS_FOLDER
+from o2a.converter.conversion_options import ConversionOptions
+from o2a.converter.renderers import BaseRenderer, PythonRenderer, DotRenderer, JsonRenderer
+from o2a.transformers.base_transformer import BaseWorkflowTransformer
+from o2a.transformers.batch_ssh_transformer import BatchSshTransformer
+from o2a.transformers.collapse_dummy_transformer import CollapseDummyTransformer
+from o2a.transformers.inline_subworkflow_transformer import InlineSubworkflowTransformer
+from o2a.transformers.merge_prepare_transformer import MergePrepareTransformer
+from o2a.transformers.remove_end_transformer import RemoveEndTransformer
+from o2a.transformers.remove_inaccessible_node_transformer import RemoveInaccessibleNodeTransformer
+from o2a.transformers.remove_kill_transformer import RemoveKillTransformer
+from o2a.transformers.remove_start_transformer import RemoveStartTransformer
+from o2a.transformers.reschedule_job_transformer import DEFAULT_POKE_INTERVAL, RescheduleJobTransformer
+from o2a.transformers.transitive_reduction_transformer import TransitiveReductionTransformer
+from o2a.utils import file_watcher
+from o2a.utils.constants import CONFIG, WORKFLOW_XML
+
+PROJECT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
+
+
+def get_o2a_validate_workflows_script():
+    # If the o2a-validate-workflows script is present in the project or on the path
+    # use it to validate the workflow
+    validate_workflows_script = os.path.join(PROJECT_PATH, "bin", "o2a-validate-workflows")
+    if not os.path.isfile(validate_workflows_script):
+        validate_workflows_script = find_executable("o2a-validate-workflows")
+        if not os.path.isfile(validate_workflows_script):
+            logging.info(f"Skipping workflow validation as the {validate_workflows_script} is missing")
+            return None
+    logging.info(f"Found o2a-validate-workflows script at {validate_workflows_script}. Validating workflow")
+    return validate_workflows_script
+
+
+def convert(args: argparse.Namespace) -> OozieConverter:
+    """
+    Converts the workflow as described by the parsed command line arguments.
+    """
+    input_directory_path = args.input_directory_path
+    output_directory_path = args.output_directory_path
+
+    start_days_ago = args.start_days_ago
+    schedule_interval = args.schedule_interval
+    dag_name = args.dag_name
+
+    if not dag_name:
+        dag_name = os.path.basename(input_directory_path)
+
+    conf_path = os.path.join(input_directory_path, CONFIG)
+    if not os.path.isfile(conf_path):
+        logging.warning(
+            f"""
+
+#################################### WARNING ###########################################
+
+The '{CONFIG}' file was not detected in {input_directory_path}.
+It may be necessary to provide input parameters for the workflow.
+
+In case of any conversion errors make sure this configuration file is really not needed.
+Otherwise please provide it.
+
+########################################################################################
+        """
+        )
+    validate_workflows_script = get_o2a_validate_workflows_script()
+    if validate_workflows_script:
+        try:
+            check_call([validate_workflows_script, f"{input_directory_path}/{HDFS_FOLDER}/{WORKFLOW_XML}"])
+        except CalledProcessError:
+            logging.error(
+                "Workflow failed schema validation. " "Please correct the workflow XML and try again."
+            )
+            exit(1)
+    os.makedirs(output_directory_path, exist_ok=True)
+
+    renderer = get_renderer_class(args)(
+        output_directory_path=output_directory_path,
+        schedule_interval=schedule_interval,
+        start_days_ago=start_days_ago,
+    )
+
+    transformers = [
+        RemoveInaccessibleNodeTransformer(),
+        RemoveEndTransformer(),
+        RemoveKillTransformer(),
+        RemoveStartTransformer(),
+    ]
+    task_transformers: List[BaseWorkflowTransformer] = []
+    if args.merge_prepare:
+        task_transformers.append(MergePrepareTransformer())
+    relation_transformers: List[BaseWorkflowTransformer] = []
+    if args.inline_subworkflows:
+        relation_transformers.append(InlineSubworkflowTransformer())
+    if args.reschedule_jobs:
+        relation_transformers.append(RescheduleJobTransformer(poke_interval=args.poke_interval))
+    if args.batch_ssh:
+        relation_transformers.append(BatchSshTransformer())
+    if args.collapse_dummy_tasks:
+        relation_transformers.append(CollapseDummyTransformer())
+    if args.transitive_reduction:
+        relation_transformers.append(TransitiveReductionTransformer())
+
+    converter = OozieConverter(
+        dag_name=dag_name,
+        input_directory_path=input_directory_path,
+        output_directory_path=output_directory_path,
+        action_mapper=ACTION_MAP,
+        renderer=renderer,
+        transformers=transformers,
+        user=args.user,
+        asset_manager=AssetManager(link_mode=args.link_mode),
+        options=ConversionOptions(
+            task_transformers=tuple(task_transformers),
+            relation_transformers=tuple(relation_transformers),
+            inline_subworkflows=args.inline_subworkflows,
+            single_fs_job=args.single_fs_job,
+        ),
+    )
+    converter.recreate_output_directory()
+    converter.convert()
+    return converter
+
+
+def get_renderer_class(args: argparse.Namespace) -> Type[BaseRenderer]:
+    """
+    Returns the renderer of the output format chosen by the command line arguments.
+    """
+    if args.dot:
+        return DotRenderer
+    if args.json:
+        return JsonRenderer
+    return PythonRenderer
+
+
+def watch(args: argparse.Namespace, converter: OozieConverter) -> None:
+    """
+    Converts the workflow again every time the files of the workflow or of its subworkflows change.
+
+    The whole top-level workflow is converted again, as the sub-DAGs are rendered with their parents.
+    """
+    app_paths = [args.input_directory_path] + converter.get_subworkflow_app_paths()
+
+    def on_change(changed_paths):
+        nonlocal app_paths
+        changed_apps = sorted(
+            {app_path for app_path in app_paths for path in changed_paths if _is_in_directory(path, app_path)}
+        )
+        logging.info(f"Files of {', '.join(changed_apps)} changed. Converting {args.input_directory_path}")
+        try:
+            app_paths = [args.input_directory_path] + convert(args).get_subworkflow_app_paths()
+        except (Exception, SystemExit):  # pylint: disable=broad-except
+            logging.exception("The conversion failed. Waiting for further changes.")
+
+    logging.info(f"Watching {', '.join(app_paths)} for changes")
+    file_watcher.watch(
+        get_directories=lambda: app_paths,
+        on_change=on_change,
+        excluded_directories=[args.output_directory_path],
+    )
+
+
+def _is_in_directory(path: str, directory: str) -> bool:
+    directory = os.path.abspath(directory)
+    return path == directory or path.startswith(directory + os.sep)
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(
+        description="Convert Apache Oozie workflows to Apache Airflow workflows."
+    )
+    parser.add_argument("-i", "--input-directory-path", help="Path to input directory", required=True)
+    parser.add_argument("-o", "--output-directory-path", help="Desired output directory", required=True)
+    parser.add_argument("-n", "--dag-name", help="Desired DAG name [defaults to input directory name]")
+    parser.add_argument(
+        "-u",
+        "--user",
+        help="The user to be used in place of all " "${user.name} [defaults to user who ran the conversion]",
+    )
+    parser.add_argument("-s", "--start-days-ago", help="Desired DAG start as number of days ago", default=0)
+    parser.add_argument(
+        "-v", "--schedule-interval", help="Desired DAG schedule interval as number of days", default=0
+    )
+    output_format = parser.add_mutually_exclusive_group()
+    output_format.add_argument(
+        "-d", "--dot", help="Renders workflow files in DOT format", action="store_true"
+    )
+    output_format.add_argument(
+        "-j", "--json", help="Renders workflow files in newline-delimited JSON format", action="store_true"
+    )
+    parser.add_argument(
+        "-w",
+        "--watch",
+        help="Watches the workflow and its subworkflows and converts the whole workflow again "
+        "when any of them changes",
+        action="store_true",
+    )
+    parser.add_argument(
+        "-l",
+        "--link-mode",
+        help="How the assets are created in the output directory. "
+        "The hardlink mode shares the assets with the input directory",
+        choices=LINK_MODES,
+        default=LINK_MODE_REFLINK,
+    )
+    parser.add_argument(
+        "-t",
+        "--transitive-reduction",
+        help="Removes the relations between tasks that are implied by other relations",
+        action="store_true",
+    )
+    parser.add_argument(
+        "-b",
+        "--inline-subworkflows",
+        help="Inlines the tasks of the subworkflows into the DAG instead of running them in sub-DAGs",
+        action="store_true",
+    )
+    parser.add_argument(
+        "-r",
+        "--reschedule-jobs",
+        help="Waits for the Dataproc jobs with sensors in the reschedule mode, "
+        "so the jobs do not occupy worker slots while they run",
+        action="store_true",
+    )
+    parser.add_argument(
+        "-p",
+        "--poke-interval",
+        help="Number of seconds between the checks of the state of the jobs waited for with sensors "
+        f"[defaults to {DEFAULT_POKE_INTERVAL}]",
+        type=int,
+        default=DEFAULT_POKE_INTERVAL,
+    )
+    parser.add_argument(
+        "-f",
+        "--single-fs-job",
+        help="Runs all the operations of a FS action in a single Dataproc job",
+        action="store_true",
+    )
+    parser.add_argument(
+        "-c",
+        "--batch-ssh",
+        help="Runs the consecutive SSH commands sent to the same host as the same user in one SSH session",
+        action="store_true",
+    )
+    parser.add_argument(
+        "-m",
+        "--merge-prepare",
+        help="Merges the prepare steps of the actions started by the same fork into one task run by the fork",
+        action="store_true",
+    )
+    parser.add_argument(
+        "-k",
+        "--collapse-dummy-tasks",
+        help="Removes the dummy tasks of forks, joins, starts and ends that do not change when the other "
+        "tasks run",
+        action="store_true",
+    )
+    return parser.parse_args(args)
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Copies extra assets required by the generated DAGs"""
+import hashlib
+import logging
+import os
+import shutil
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None  # type: ignore
+
+LINK_MODE_COPY = "copy"
+LINK_MODE_REFLINK = "reflink"
+LINK_MODE_HARDLINK = "hardlink"
+
+LINK_MODES = [LINK_MODE_COPY, LINK_MODE_REFLINK, LINK_MODE_HARDLINK]
+
+# ioctl request cloning a whole file on copy-on-write filesystems (Linux only)
+FICLONE = 0x40049409
+
+HASH_CHUNK_SIZE = 1024 * 1024
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+class Asset(NamedTuple):
+    """
+    File that should be copied to the output directory.
+
+    :param source_path: path of the file in the input directory
+    :param destination_path: path of the file in the output directory
+    :param header: optional text written to the destination before the content of the source file
+    """
+
+    source_path: str
+    destination_path: str
+    header: Optional[str] = None
+
+
+class AssetManager:
+    """
+    Collects the assets of all the converted workflows and copies them at once.
+
+    Assets with the same content and header are copied only once. The remaining destinations
+    are created from the first copy. Copying is done in a thread pool.
+
+    :param link_mode: how the files without a header are created:
+        ``copy`` - always copy the content,
+        ``reflink`` - clone the file on copy-on-write filesystems and copy the content otherwise,
+        ``hardlink`` - create a hard link and copy the content if it is not possible.
+        Note that hard links share the content with the files in the input directory.
+    :param max_workers: maximum number of threads used to copy the files
+    """
+
+    def __init__(self, link_mode: str = LINK_MODE_REFLINK, max_workers: Optional[int] = None):
+        if link_mode not in LINK_MODES:
+            raise ValueError(f"Unknown link mode: {link_mode}. Allowed values: {LINK_MODES}")
+        self.link_mode = link_mode
+        self.max_workers = max_workers
+        self.assets: Dict[str, Asset] = OrderedDict()
+
+    def add_asset(self, source_path: str, destination_path: str, header: Optional[str] = None) -> None:
+        """
+        Registers the file to copy. If another file was registered with the same destination,
+        it is replaced.
+        """
+        destination_path = os.path.abspath(destination_path)
+        self.assets[destination_path] = Asset(
+            source_path=os.path.abspath(source_path), destination_path=destination_path, header=header
+        )
+
+    def copy_assets(self) -> None:
+        """
+        Copies all the registered files and forgets them.
+        """
+        groups = self._group_by_content(list(self.assets.values()))
+        self.assets = OrderedDict()
+        logging.info(f"Copying {len(groups)} unique assets")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Copy the first asset of each group from the input directory
+            list(executor.map(lambda group: self._copy_asset(group[0]), groups))
+            # Create the other assets of each group from the first copy
+            duplicates = [(group[0], duplicate) for group in groups for duplicate in group[1:]]
+            list(executor.map(lambda args: self._copy_duplicate(*args), duplicates))
+
+    def _group_by_content(self, assets: List[Asset]) -> List[List[Asset]]:
+        """
+        Groups the assets producing the same content.
+
+        Assets are grouped by the source path first. Content hashes are computed only for the sources
+        that have the same size and header as another source.
+        """
+        by_source: Dict[Tuple[str, Optional[str]], List[Asset]] = OrderedDict()
+        for asset in assets:
+            by_source.setdefault((asset.source_path, asset.header), []).append(asset)
+
+        by_size: Dict[Tuple[int, Optional[str]], List[List[Asset]]] = defaultdict(list)
+        for (source_path, header), group in by_source.items():
+            by_size[(os.path.getsize(source_path), header)].append(group)
+
+        groups: List[List[Asset]] = []
+        for candidates in by_size.values():
+            if len(candidates) == 1:
+                groups.extend(candidates)
+                continue
+            by_hash: Dict[str, List[Asset]] = OrderedDict()
+            for group in candidates:
+                by_hash.setdefault(self._hash_file(group[0].source_path), []).extend(group)
+            groups.extend(by_hash.values())
+        return groups
+
+    @staticmethod
+    def _hash_file(path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _copy_asset(self, asset: Asset) -> None:
+        logging.info(f"Copying {asset.source_path} to {asset.destination_path}")
+        self._prepare_destination(asset.destination_path)
+        if asset.header is None:
+            self._link_or_copy(asset.source_path, asset.destination_path)
+            return
+        with open(asset.destination_path, "wb") as destination_file:
+            destination_file.write(asset.header.encode())
+            with open(asset.source_path, "rb") as source_file:
+                self._append_file(source_file, destination_file)
+
+    @staticmethod
+    def _append_file(source_file: BinaryIO, destination_file: BinaryIO) -> None:
+        """
+        Appends the content of the source file to the destination file using constant memory.
+
+        The content is copied by the kernel with ``copy_file_range`` or ``sendfile`` where possible
+        and in fixed-size chunks otherwise.
+        """
+        destination_file.flush()
+        source_fd, destination_fd = source_file.fileno(), destination_file.fileno()
+        if AssetManager._copy_in_kernel(source_fd, destination_fd):
+            return
+        logging.debug(f"Unable to copy {source_file.name} in the kernel. Copying it in chunks.")
+        # Continue from the place where the kernel stopped
+        source_file.seek(os.lseek(source_fd, 0, os.SEEK_CUR))
+        destination_file.seek(os.lseek(destination_fd, 0, os.SEEK_CUR))
+        shutil.copyfileobj(source_file, destination_file, COPY_CHUNK_SIZE)
+
+    @staticmethod
+    def _copy_in_kernel(source_fd: int, destination_fd: int) -> bool:
+        """
+        Copies the rest of the source file without passing it through the user space.
+        Returns False if it is not possible.
+        """
+        if hasattr(os, "copy_file_range"):
+            try:
+                while os.copy_file_range(source_fd, destination_fd, COPY_CHUNK_SIZE):
+                    pass
+                return True
+            except OSError:
+                pass
+        if hasattr(os, "sendfile"):
+            try:
+                while os.sendfile(destination_fd, source_fd, None, COPY_CHUNK_SIZE):
+                    pass
+                return True
+            except OSError:
+                pass
+        return False
+
+    def _copy_duplicate(self, original: Asset, duplicate: Asset) -> None:
+        logging.info(f"Copying {original.destination_path} to {duplicate.destination_path}")
+        self._prepare_destination(duplicate.destination_path)
+        self._link_or_copy(original.destination_path, duplicate.destination_path)
+
+    @staticmethod
+    def _prepare_destination(destination_path: str) -> None:
+        os.makedirs(os.path.dirname(destination_path), exist_ok=True)
+        if os.path.lexists(destination_path):
+            os.remove(destination_path)
+
+    def _link_or_copy(self, source_path: str, destination_path: str) -> None:
+        if self.link_mode == LINK_MODE_HARDLINK:
+            try:
+                os.link(source_path, destination_path)
+                return
+            except OSError:
+                logging.debug(f"Unable to create a hard link to {source_path}. Copying it.")
+        elif self.link_mode == LINK_MODE_REFLINK:
+            if self._clone_file(source_path, destination_path):
+                return
+        shutil.copy(source_path, destination_path)
+
+    @staticmethod
+    def _clone_file(source_path: str, destination_path: str) -> bool:
+        """
+        Clones the file on filesystems supporting copy-on-write. Returns False if it is not possible.
+        """
+        if fcntl is None:
+            return False
+        with open(source_path, "rb") as source_file, open(destination_path, "wb") as destination_file:
+            try:
+                fcntl.ioctl(destination_file.fileno(), FICLONE, source_file.fileno())
+            except OSError:
+                cloned = False
+            else:
+                cloned = True
+        if cloned:
+            shutil.copymode(source_path, destination_path)
+        else:
+            os.remove(destination_path)
+        return cloned
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Options of the conversion"""
+from typing import NamedTuple, Tuple
+
+from o2a.transformers.base_transformer import BaseWorkflowTransformer
+
+
+class ConversionOptions(NamedTuple):
+    """
+    Optional behaviour of the conversion, passed from the command line to the converters and the mappers.
+
+    :param task_transformers: transformers that transform a workflow after its nodes are converted to tasks
+    :param relation_transformers: transformers that transform a workflow after the relations between
+        the tasks are converted
+    :param inline_subworkflows: whether the subworkflows are converted to be inlined into the DAG
+        instead of being rendered as separate sub-DAGs
+    :param single_fs_job: whether all the operations of a FS action are run in a single Dataproc job
+    """
+
+    task_transformers: Tuple[BaseWorkflowTransformer, ...] = ()
+    relation_transformers: Tuple[BaseWorkflowTransformer, ...] = ()
+    inline_subworkflows: bool = False
+    single_fs_job: bool = False
+
+    def for_subworkflow(self) -> "ConversionOptions":
+        """
+        Returns the options of the subworkflows. The transformers are applied only to the top-level
+        workflow, which includes the inlined subworkflows.
+        """
+        return ConversionOptions(
+            inline_subworkflows=self.inline_subworkflows, single_fs_job=self.single_fs_job
+        )
@@ -21,3 +21,7 @@ class O2AException(Exception):
 
 class ParseException(O2AException):
     """Raised when an error occurs in the parsing phase."""
+
+
+class SnapshotException(O2AException):
+    """Raised when a snapshot of the converted workflow cannot be loaded."""
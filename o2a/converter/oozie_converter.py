@@ -15,7 +15,7 @@
 """Converts Oozie application workflow into Airflow's DAG
 """
 import shutil
-from typing import Dict, Type, List
+from typing import Dict, Optional, Type, List
 
 import os
 
@@ -23,7 +23,9 @@ import logging
 
 
 from o2a.converter import parser
+from o2a.converter.asset_manager import AssetManager
 from o2a.converter.constants import HDFS_FOLDER
+from o2a.converter.conversion_options import ConversionOptions
 from o2a.converter.parsed_action_node import ParsedActionNode
 from o2a.converter.property_parser import PropertyParser
 from o2a.converter.relation import Relation
@@ -51,6 +53,8 @@ class OozieConverter:
     :param transformers: List of transformers that will transform a workflow
     :param user: Username.  # TODO remove me and use real ${user} EL
     :param initial_props: Initial PropertySet object
+    :param asset_manager: Asset manager collecting the assets of the workflow and all its subworkflows
+    :param options: Optional behaviour of the conversion
     """
 
     def __init__(
@@ -63,6 +67,8 @@ class OozieConverter:
         transformers: List[BaseWorkflowTransformer] = None,
         user: str = None,
         initial_props: PropertySet = None,
+        asset_manager: Optional[AssetManager] = None,
+        options: ConversionOptions = ConversionOptions(),
     ):
         self.workflow = Workflow(
             dag_name=dag_name,
@@ -70,14 +76,21 @@ class OozieConverter:
             output_directory_path=output_directory_path,
         )
         self.renderer = renderer
+        self.asset_manager = asset_manager or AssetManager()
         self.transformers = transformers or []
+        self.options = options
         # Propagate the configuration in case initial property set is passed
         job_properties = {} if not initial_props else initial_props.job_properties
         job_properties["user.name"] = user or os.environ["USER"]
         self.props = PropertySet(job_properties=job_properties)
         self.property_parser = PropertyParser(props=self.props, workflow=self.workflow)
         self.parser = parser.OozieParser(
-            props=self.props, action_mapper=action_mapper, renderer=self.renderer, workflow=self.workflow
+            props=self.props,
+            action_mapper=action_mapper,
+            renderer=self.renderer,
+            workflow=self.workflow,
+            asset_manager=self.asset_manager,
+            options=options,
         )
 
     def recreate_output_directory(self):
@@ -85,21 +98,41 @@ class OozieConverter:
         os.makedirs(self.workflow.output_directory_path, exist_ok=True)
 
     def convert(self, as_subworkflow=False):
+        self.convert_workflow()
+
+        if as_subworkflow:
+            self.renderer.create_subworkflow_file(workflow=self.workflow, props=self.props)
+        else:
+            self.renderer.create_workflow_file(workflow=self.workflow, props=self.props)
+        self.copy_extra_assets(self.workflow.nodes)
+        if not as_subworkflow:
+            # Assets of subworkflows are copied together with the assets of the top-level workflow
+            self.asset_manager.copy_assets()
+
+    def convert_workflow(self):
+        """
+        Converts the workflow to tasks and relations without rendering it.
+        """
         self.property_parser.parse_property()
         self.parser.parse_workflow()
         self.apply_transformers()
 
         self.convert_nodes()
+        self.apply_task_transformers()
         self.update_trigger_rules()
 
         self.convert_relations()
+        self.apply_relation_transformers()
         self.convert_dependencies()
 
-        if as_subworkflow:
-            self.renderer.create_subworkflow_file(workflow=self.workflow, props=self.props)
-        else:
-            self.renderer.create_workflow_file(workflow=self.workflow, props=self.props)
-        self.copy_extra_assets(self.workflow.nodes)
+    def get_subworkflow_app_paths(self) -> List[str]:
+        """
+        Returns the paths of all the subworkflow applications converted together with the workflow.
+        """
+        app_paths: List[str] = []
+        for node in self.workflow.nodes.values():
+            app_paths.extend(getattr(node.mapper, "subworkflow_app_paths", []))
+        return app_paths
 
     def convert_nodes(self):
         """
@@ -111,8 +144,7 @@ class OozieConverter:
         logging.info("Converting nodes to tasks and inner relations")
         for p_node in self.workflow.nodes.values():
             tasks, relations = p_node.mapper.to_tasks_and_relations()
-            p_node.tasks = tasks
-            p_node.relations = relations
+            self.workflow.replace_tasks(p_node, tasks, relations)
 
     def convert_dependencies(self) -> None:
         logging.info("Converting dependencies.")
@@ -126,7 +158,7 @@ class OozieConverter:
                 relation = Relation(
                     from_task_id=p_node.last_task_id, to_task_id=self.workflow.nodes[downstream].first_task_id
                 )
-                self.workflow.relations.add(relation)
+                self.workflow.add_relation(relation)
             error_downstream = p_node.get_error_downstream_name()
             if error_downstream:
                 relation = Relation(
@@ -134,7 +166,7 @@ class OozieConverter:
                     to_task_id=self.workflow.nodes[error_downstream].first_task_id,
                     is_error=True,
                 )
-                self.workflow.relations.add(relation)
+                self.workflow.add_relation(relation)
 
     def update_trigger_rules(self) -> None:
         logging.info("Updating trigger rules.")
@@ -152,16 +184,27 @@ class OozieConverter:
 
     def copy_extra_assets(self, nodes: Dict[str, ParsedActionNode]):
         """
-        Copies additional assets needed to execute a workflow, eg. Pig scripts.
+        Collects additional assets needed to execute a workflow, eg. Pig scripts.
         """
         for node in nodes.values():
-            logging.info(f"Copies additional assets for the node: {node.mapper.name}")
+            logging.info(f"Collects additional assets for the node: {node.mapper.name}")
             node.mapper.copy_extra_assets(
                 input_directory_path=os.path.join(self.workflow.input_directory_path, HDFS_FOLDER),
                 output_directory_path=self.workflow.output_directory_path,
+                asset_manager=self.asset_manager,
             )
 
     def apply_transformers(self):
         logging.info(f"Applying transformers")
         for transformer in self.transformers:
             transformer.process_workflow(self.workflow)
+
+    def apply_task_transformers(self):
+        logging.info("Applying task transformers")
+        for transformer in self.options.task_transformers:
+            transformer.process_workflow(self.workflow)
+
+    def apply_relation_transformers(self):
+        logging.info("Applying relation transformers")
+        for transformer in self.options.relation_transformers:
+            transformer.process_workflow(self.workflow)
@@ -25,6 +25,8 @@ from o2a.mappers.base_mapper import BaseMapper
 class ParsedActionNode:
     """Class for parsed Oozie workflow node"""
 
+    __slots__ = ("mapper", "downstream_names", "is_error", "is_ok", "error_xml", "tasks", "relations")
+
     def __init__(self, mapper: BaseMapper, tasks=None, relations=None):
         from o2a.converter.task import Task
         from o2a.converter.relation import Relation
@@ -117,5 +119,5 @@ class ParsedActionNode:
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            return self.__dict__ == other.__dict__
+            return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
         return False
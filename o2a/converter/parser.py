@@ -22,10 +22,12 @@ import xml.etree.ElementTree as ET
 import uuid
 
 # noinspection PyPackageRequirements
-from typing import Dict, Type
+from typing import Dict, Optional, Type
 
 from airflow.utils.trigger_rule import TriggerRule
 
+from o2a.converter.asset_manager import AssetManager
+from o2a.converter.conversion_options import ConversionOptions
 from o2a.converter.renderers import BaseRenderer
 from o2a.mappers.decision_mapper import DecisionMapper
 from o2a.mappers.dummy_mapper import DummyMapper
@@ -39,6 +41,16 @@ from o2a.converter.parsed_action_node import ParsedActionNode
 from o2a.converter.workflow import Workflow
 from o2a.mappers.action_mapper import ActionMapper
 
+# The kinds of the workflow nodes, in the order in which they are matched against the tags
+NODE_KINDS = ["action", "start", "kill", "end", "fork", "join", "decision"]
+
+
+def get_node_kind(node: ET.Element) -> Optional[str]:
+    """
+    Returns the kind of the workflow node, or None if the element is not a node the parser handles.
+    """
+    return next((kind for kind in NODE_KINDS if kind in node.tag), None)
+
 
 # noinspection PyDefaultArgument
 class OozieParser:
@@ -50,12 +62,16 @@ class OozieParser:
         action_mapper: Dict[str, Type[ActionMapper]],
         renderer: BaseRenderer,
         workflow: Workflow,
+        asset_manager: Optional[AssetManager] = None,
+        options: ConversionOptions = ConversionOptions(),
     ):
         self.workflow = workflow
         self.workflow_file = os.path.join(workflow.input_directory_path, HDFS_FOLDER, "workflow.xml")
         self.props = props
         self.action_map = action_mapper
         self.renderer = renderer
+        self.asset_manager = asset_manager or AssetManager()
+        self.options = options
 
     def parse_kill_node(self, kill_node: ET.Element):
         """
@@ -209,6 +225,8 @@ class OozieParser:
             dag_name=self.workflow.dag_name,
             action_mapper=self.action_map,
             renderer=self.renderer,
+            asset_manager=self.asset_manager,
+            options=self.options,
             input_directory_path=self.workflow.input_directory_path,
             output_directory_path=self.workflow.output_directory_path,
         )
@@ -265,19 +283,20 @@ class OozieParser:
         :param root:  The root node of the XML tree.
         :param node: The node to parse.
         """
-        if "action" in node.tag:
+        kind = get_node_kind(node)
+        if kind == "action":
             self.parse_action_node(node)
-        elif "start" in node.tag:
+        elif kind == "start":
             self.parse_start_node(node)
-        elif "kill" in node.tag:
+        elif kind == "kill":
             self.parse_kill_node(node)
-        elif "end" in node.tag:
+        elif kind == "end":
             self.parse_end_node(node)
-        elif "fork" in node.tag:
+        elif kind == "fork":
             self.parse_fork_node(root, node)
-        elif "join" in node.tag:
+        elif kind == "join":
             self.parse_join_node(node)
-        elif "decision" in node.tag:
+        elif kind == "decision":
             self.parse_decision_node(node)
 
     def parse_workflow(self):
@@ -13,12 +13,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Relation between tasks"""
+import sys
 from typing import NamedTuple
 
 
-class Relation(NamedTuple):
-    """Class for Airflow relation"""
-
+class _RelationFields(NamedTuple):
     from_task_id: str
     to_task_id: str
     is_error: bool = False
+
+
+class Relation(_RelationFields):
+    """
+    Class for Airflow relation
+
+    Relations are immutable tuples, so hashing and comparison are done natively. Task IDs are interned,
+    so that equal IDs share a single string and are compared by identity in the relation sets.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, from_task_id: str, to_task_id: str, is_error: bool = False):
+        return super().__new__(cls, sys.intern(from_task_id), sys.intern(to_task_id), is_error)
@@ -13,19 +13,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Classes responsible for generating files based on Workflow"""
+import json
 import logging
 import os
 import sys
 from abc import ABC, abstractmethod
 from collections import namedtuple
 from pathlib import Path
-from typing import Union, Dict, List
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 from isort import SortImports
 
 import black
 from autoflake import fix_file
 
+from o2a.converter.relation import Relation
 from o2a.converter.workflow import Workflow
 from o2a.o2a_libs.property_utils import PropertySet
 from o2a.utils.el_utils import comma_separated_string_to_list
@@ -185,3 +187,75 @@ class DotRenderer(BaseRenderer):
             nodes=list(workflow.nodes.values()),
         )
         return content
+
+
+class JsonRenderer(BaseRenderer):
+    """
+    Renderer responsible for generating files with the converted graph in the newline-delimited JSON format.
+
+    Every line is a single record - the workflow, a node, a task or a relation - and contains the name
+    of the DAG, so the files of many workflows can be concatenated and analyzed together.
+    """
+
+    def create_workflow_file(self, workflow: Workflow, props: PropertySet):
+        output_file_name = os.path.join(self.output_directory_path, workflow.dag_name) + ".ndjson"
+        self._create_file(output_file_name=output_file_name, workflow=workflow, is_subworkflow=False)
+
+    def create_subworkflow_file(self, workflow: Workflow, props: PropertySet):
+        output_file_name = os.path.join(self.output_directory_path, f"subdag_{workflow.dag_name}.ndjson")
+        self._create_file(output_file_name=output_file_name, workflow=workflow, is_subworkflow=True)
+
+    def _create_file(self, output_file_name: str, workflow: Workflow, is_subworkflow: bool):
+        with open(output_file_name, "w") as file:
+            logging.info(f"Saving to file: {output_file_name}")
+            for record in self._iter_records(workflow, is_subworkflow):
+                file.write(json.dumps(record))
+                file.write("\n")
+
+    @staticmethod
+    def _iter_records(workflow: Workflow, is_subworkflow: bool) -> Iterator[Dict[str, Any]]:
+        """
+        Generates the records describing the workflow.
+        """
+        dag_name = workflow.dag_name
+        yield {
+            "type": "workflow",
+            "dag_name": dag_name,
+            "is_subworkflow": is_subworkflow,
+            "dependencies": sorted(workflow.dependencies),
+        }
+        for node in workflow.nodes.values():
+            yield {
+                "type": "node",
+                "dag_name": dag_name,
+                "name": node.name,
+                "mapper_type": node.mapper.mapper_type,
+                "downstream_names": node.downstream_names,
+                "error_downstream_name": node.error_xml,
+                "is_ok": node.is_ok,
+                "is_error": node.is_error,
+            }
+            for task in node.tasks:
+                yield {
+                    "type": "task",
+                    "dag_name": dag_name,
+                    "node": node.name,
+                    "task_id": task.task_id,
+                    "template_name": task.template_name,
+                    "trigger_rule": task.trigger_rule,
+                }
+            for relation in node.relations:
+                yield JsonRenderer._relation_record(dag_name, relation, node=node.name)
+        for relation in sorted(workflow.relations):
+            yield JsonRenderer._relation_record(dag_name, relation, node=None)
+
+    @staticmethod
+    def _relation_record(dag_name: str, relation: Relation, node: Optional[str]) -> Dict[str, Any]:
+        return {
+            "type": "relation",
+            "dag_name": dag_name,
+            "node": node,
+            "from_task_id": relation.from_task_id,
+            "to_task_id": relation.to_task_id,
+            "is_error": relation.is_error,
+        }
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Snapshots of converted workflows
+
+A snapshot holds the intermediate representation (IR) of a workflow after its nodes, relations
+and dependencies have been converted - that is everything the renderers need. It does not hold the
+mappers, nor the parsed XML, so it can be cached, sent to another process and rendered again
+without parsing the workflow.
+
+The IR is built from plain Python types only:
+
+.. code-block:: python
+
+    {
+        "version": 1,
+        "dag_name": "...",
+        "input_directory_path": "...",
+        "output_directory_path": "...",
+        "props": PropertySet(...),
+        "nodes": [
+            {
+                "name": "...",
+                "mapper_type": "...",
+                "downstream_names": ["..."],
+                "error_xml": "..." or None,
+                "is_ok": bool,
+                "is_error": bool,
+                "tasks": [(task_id, template_name, trigger_rule, template_params)],
+                "relations": [(from_task_id, to_task_id, is_error)],
+            }
+        ],
+        "relations": [(from_task_id, to_task_id, is_error)],
+        "dependencies": ["..."],
+    }
+
+The template parameters can contain only built-in types, ordered dictionaries and property sets.
+
+The binary format is a short header followed by the IR pickled with the highest protocol. It is loaded
+with an unpickler that refuses any global other than the property set and the ordered dictionary.
+"""
+import io
+import pickle
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, BinaryIO, Dict, List, NamedTuple, Set, Tuple
+from xml.etree.ElementTree import Element
+
+from o2a.converter.exceptions import SnapshotException
+from o2a.converter.parsed_action_node import ParsedActionNode
+from o2a.converter.relation import Relation
+from o2a.converter.task import Task
+from o2a.converter.workflow import Workflow
+from o2a.mappers.base_mapper import BaseMapper
+from o2a.o2a_libs.property_utils import PropertySet
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = b"O2A-IR" + bytes([SNAPSHOT_VERSION])
+
+_ALLOWED_GLOBALS = {
+    ("collections", "OrderedDict"): OrderedDict,
+    ("o2a.o2a_libs.property_utils", "PropertySet"): PropertySet,
+}
+
+
+class WorkflowSnapshot(NamedTuple):
+    """Workflow restored from a snapshot together with its properties"""
+
+    workflow: Workflow
+    props: PropertySet
+
+
+class RestoredMapper(BaseMapper):
+    """
+    Mapper of the nodes restored from a snapshot. It returns the tasks and relations stored in the snapshot.
+    The XML of the node is not stored, so its Oozie node is an empty placeholder.
+
+    :param mapper_type: name of the class of the original mapper
+    """
+
+    def __init__(
+        self, name: str, dag_name: str, mapper_type: str, tasks: List[Task], relations: List[Relation]
+    ):
+        super().__init__(
+            oozie_node=Element("action", name=name),
+            name=name,
+            dag_name=dag_name,
+            props=PropertySet(job_properties={}),
+        )
+        self.restored_mapper_type = mapper_type
+        self.tasks = tasks
+        self.relations = relations
+
+    @property
+    def mapper_type(self) -> str:
+        return self.restored_mapper_type
+
+    def to_tasks_and_relations(self) -> Tuple[List[Task], List[Relation]]:
+        return self.tasks, self.relations
+
+    def required_imports(self) -> Set[str]:
+        return set()
+
+
+def _normalize_trigger_rule(trigger_rule: Any) -> str:
+    # Trigger rules are enums in newer versions of Airflow
+    return str(trigger_rule.value if isinstance(trigger_rule, Enum) else trigger_rule)
+
+
+def _relation_to_ir(relation: Relation) -> Tuple[str, str, bool]:
+    return relation.from_task_id, relation.to_task_id, relation.is_error
+
+
+def workflow_to_ir(workflow: Workflow, props: PropertySet) -> Dict[str, Any]:
+    """
+    Creates the IR of the converted workflow.
+    """
+    nodes = []
+    for node in workflow.nodes.values():
+        nodes.append(
+            {
+                "name": node.name,
+                "mapper_type": node.mapper.mapper_type,
+                "downstream_names": list(node.downstream_names),
+                "error_xml": node.error_xml,
+                "is_ok": node.is_ok,
+                "is_error": node.is_error,
+                "tasks": [
+                    (
+                        task.task_id,
+                        task.template_name,
+                        _normalize_trigger_rule(task.trigger_rule),
+                        task.template_params,
+                    )
+                    for task in node.tasks
+                ],
+                "relations": [_relation_to_ir(relation) for relation in node.relations],
+            }
+        )
+    return {
+        "version": SNAPSHOT_VERSION,
+        "dag_name": workflow.dag_name,
+        "input_directory_path": workflow.input_directory_path,
+        "output_directory_path": workflow.output_directory_path,
+        "props": props,
+        "nodes": nodes,
+        "relations": sorted(_relation_to_ir(relation) for relation in workflow.relations),
+        "dependencies": sorted(workflow.dependencies),
+    }
+
+
+def workflow_from_ir(ir: Dict[str, Any]) -> WorkflowSnapshot:
+    """
+    Restores the converted workflow from the IR.
+    """
+    if ir.get("version") != SNAPSHOT_VERSION:
+        raise SnapshotException(f"Unsupported snapshot version: {ir.get('version')}")
+    workflow = Workflow(
+        input_directory_path=ir["input_directory_path"],
+        output_directory_path=ir["output_directory_path"],
+        dag_name=ir["dag_name"],
+        relations={Relation(*relation) for relation in ir["relations"]},
+        dependencies=set(ir["dependencies"]),
+    )
+    for node_ir in ir["nodes"]:
+        tasks = [
+            Task(
+                task_id=task_id,
+                template_name=template_name,
+                trigger_rule=trigger_rule,
+                template_params=params,
+            )
+            for task_id, template_name, trigger_rule, params in node_ir["tasks"]
+        ]
+        relations = [Relation(*relation) for relation in node_ir["relations"]]
+        mapper = RestoredMapper(
+            name=node_ir["name"],
+            dag_name=workflow.dag_name,
+            mapper_type=node_ir["mapper_type"],
+            tasks=tasks,
+            relations=relations,
+        )
+        node = ParsedActionNode(mapper, tasks=tasks, relations=relations)
+        node.downstream_names = list(node_ir["downstream_names"])
+        node.error_xml = node_ir["error_xml"]
+        node.is_ok = node_ir["is_ok"]
+        node.is_error = node_ir["is_error"]
+        workflow.nodes[node.name] = node
+    return WorkflowSnapshot(workflow=workflow, props=ir["props"])
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def find_class(self, module: str, name: str):
+        if (module, name) not in _ALLOWED_GLOBALS:
+            raise SnapshotException(f"Forbidden type in snapshot: {module}.{name}")
+        return _ALLOWED_GLOBALS[(module, name)]
+
+
+def dump(workflow: Workflow, props: PropertySet, file: BinaryIO) -> None:
+    """
+    Writes the snapshot of the converted workflow to the binary file.
+    """
+    file.write(SNAPSHOT_HEADER)
+    pickle.dump(workflow_to_ir(workflow, props), file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load(file: BinaryIO) -> WorkflowSnapshot:
+    """
+    Reads the snapshot of the converted workflow from the binary file.
+    """
+    header = file.read(len(SNAPSHOT_HEADER))
+    if header != SNAPSHOT_HEADER:
+        raise SnapshotException("The file is not a workflow snapshot or it was created by another version")
+    try:
+        ir = _SnapshotUnpickler(file).load()
+    except (pickle.UnpicklingError, EOFError) as ex:
+        raise SnapshotException(f"The snapshot is corrupted: {ex}") from ex
+    return workflow_from_ir(ir)
+
+
+def dumps(workflow: Workflow, props: PropertySet) -> bytes:
+    """
+    Returns the snapshot of the converted workflow.
+    """
+    file = io.BytesIO()
+    dump(workflow, props, file)
+    return file.getvalue()
+
+
+def loads(data: bytes) -> WorkflowSnapshot:
+    """
+    Restores the converted workflow from the snapshot.
+    """
+    return load(io.BytesIO(data))
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Representation of Airflow tasks"""
+import sys
 from typing import Dict, Any
 
 from airflow.utils.trigger_rule import TriggerRule
@@ -24,6 +25,8 @@ from o2a.utils.template_utils import render_template
 class Task:  # pylint: disable=too-few-public-methods
     """Class for Airflow Task"""
 
+    __slots__ = ("task_id", "template_name", "trigger_rule", "template_params")
+
     def __init__(
         self,
         task_id: str,
@@ -31,8 +34,8 @@ class Task:  # pylint: disable=too-few-public-methods
         trigger_rule: str = TriggerRule.ALL_SUCCESS,
         template_params: Dict[str, Any] = None,
     ):
-        self.task_id = task_id
-        self.template_name = template_name
+        self.task_id = sys.intern(task_id)
+        self.template_name = sys.intern(template_name)
         self.trigger_rule = trigger_rule
         self.template_params: Dict[str, Any] = template_params or {}
 
@@ -55,5 +58,5 @@ class Task:  # pylint: disable=too-few-public-methods
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            return self.__dict__ == other.__dict__
+            return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
         return False
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Graph of the converted tasks"""
+from collections import OrderedDict, defaultdict
+from typing import Dict, Set
+
+from o2a.converter.parsed_action_node import ParsedActionNode
+from o2a.converter.relation import Relation
+from o2a.converter.task import Task
+from o2a.converter.workflow import Workflow
+
+
+class TaskGraph:
+    """
+    Graph of the tasks of the workflow connected by the relations inside and between the nodes.
+
+    All the changes made through the graph are applied to the workflow.
+
+    :param workflow: workflow which nodes are already converted to tasks and relations
+    """
+
+    def __init__(self, workflow: Workflow):
+        self.workflow = workflow
+        self.tasks: Dict[str, Task] = OrderedDict()
+        self.task_nodes: Dict[str, ParsedActionNode] = {}
+        self.upstream_relations: Dict[str, Set[Relation]] = defaultdict(set)
+        self.downstream_relations: Dict[str, Set[Relation]] = defaultdict(set)
+        for node in workflow.nodes.values():
+            for task in node.tasks:
+                self.tasks[task.task_id] = task
+                self.task_nodes[task.task_id] = node
+        for node in workflow.nodes.values():
+            for relation in node.relations:
+                self._link(relation)
+        for relation in workflow.relations:
+            self._link(relation)
+
+    def upstream_task_ids(self, task_id: str) -> Set[str]:
+        return {relation.from_task_id for relation in self.upstream_relations[task_id]}
+
+    def downstream_task_ids(self, task_id: str) -> Set[str]:
+        return {relation.to_task_id for relation in self.downstream_relations[task_id]}
+
+    def add_relation(self, from_task_id: str, to_task_id: str, is_error: bool = False) -> Relation:
+        """
+        Adds the relation to the node containing both tasks or to the workflow.
+        """
+        relation = Relation(from_task_id=from_task_id, to_task_id=to_task_id, is_error=is_error)
+        node = self.task_nodes[from_task_id]
+        if node is self.task_nodes[to_task_id]:
+            if relation not in node.relations:
+                self.workflow.replace_tasks(node, node.tasks, [*node.relations, relation])
+        else:
+            self.workflow.add_relation(relation)
+        self._link(relation)
+        return relation
+
+    def remove_relation(self, relation: Relation) -> None:
+        node = self.task_nodes[relation.from_task_id]
+        if relation in node.relations:
+            self.workflow.replace_tasks(
+                node,
+                node.tasks,
+                [node_relation for node_relation in node.relations if node_relation != relation],
+            )
+        else:
+            self.workflow.remove_relation(relation)
+        self.upstream_relations[relation.to_task_id].discard(relation)
+        self.downstream_relations[relation.from_task_id].discard(relation)
+
+    def remove_task(self, task_id: str) -> None:
+        """
+        Removes the task with all its relations. The node is removed together with its last task.
+        """
+        for relation in [*self.upstream_relations[task_id], *self.downstream_relations[task_id]]:
+            self.remove_relation(relation)
+        node = self.task_nodes.pop(task_id)
+        del self.tasks[task_id]
+        del self.upstream_relations[task_id]
+        del self.downstream_relations[task_id]
+        remaining_tasks = [task for task in node.tasks if task.task_id != task_id]
+        if remaining_tasks:
+            self.workflow.replace_tasks(node, remaining_tasks, node.relations)
+        else:
+            self.workflow.remove_node(node)
+
+    def replace_task(self, task: Task) -> None:
+        """
+        Replaces the task having the same task id in its node.
+        """
+        node = self.task_nodes[task.task_id]
+        tasks = [task if node_task.task_id == task.task_id else node_task for node_task in node.tasks]
+        self.workflow.replace_tasks(node, tasks, node.relations)
+        self.tasks[task.task_id] = task
+
+    def _link(self, relation: Relation) -> None:
+        self.upstream_relations[relation.to_task_id].add(relation)
+        self.downstream_relations[relation.from_task_id].add(relation)
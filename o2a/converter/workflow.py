@@ -14,15 +14,36 @@
 # limitations under the License.
 """Workflow"""
 from collections import OrderedDict
-from typing import Set, Dict, Type
+from contextlib import contextmanager
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional, Set, Type
 
 from o2a.converter.parsed_action_node import ParsedActionNode
 from o2a.converter.relation import Relation
+from o2a.converter.task import Task
 
 
 # This is a container for data, so it does not contain public methods intentionally.
 class Workflow:  # pylint: disable=too-few-public-methods
-    """Class for Workflow"""
+    """
+    Class for Workflow
+
+    The changes made with the methods of the workflow can be undone. When a savepoint is set, every change
+    records a function reverting it in the undo log, so transformers can try a change and back out
+    of it in time and memory proportional to the size of the change. Nothing is recorded when there
+    is no savepoint.
+    """
+
+    __slots__ = (
+        "input_directory_path",
+        "output_directory_path",
+        "dag_name",
+        "relations",
+        "nodes",
+        "dependencies",
+        "_undo_log",
+        "_savepoints",
+    )
 
     def __init__(
         self,
@@ -52,6 +73,8 @@ class Workflow:  # pylint: disable=too-few-public-methods
             "from airflow.utils.trigger_rule import TriggerRule",
             "from airflow.utils import dates",
         }
+        self._undo_log: List[Callable[[], None]] = []
+        self._savepoints: List[int] = []
 
     def get_nodes_by_type(self, mapper_type: Type):
         return [node for node in self.nodes.values() if isinstance(node.mapper, mapper_type)]
@@ -63,14 +86,139 @@ class Workflow:  # pylint: disable=too-few-public-methods
                 result.append(node)
         return result
 
+    def savepoint(self) -> int:
+        """
+        Starts recording the changes and returns the savepoint to roll back to.
+        """
+        savepoint = len(self._undo_log)
+        self._savepoints.append(savepoint)
+        return savepoint
+
+    def rollback(self, savepoint: Optional[int] = None) -> None:
+        """
+        Reverts the changes made after the savepoint - or after the last savepoint if none is given.
+        The savepoint stays active, while the later ones are discarded.
+        """
+        if not self._savepoints:
+            raise ValueError("There is no savepoint to roll back to")
+        if savepoint is None:
+            savepoint = self._savepoints[-1]
+        if savepoint not in self._savepoints:
+            raise ValueError(f"Unknown savepoint: {savepoint}")
+        while len(self._undo_log) > savepoint:
+            undo = self._undo_log.pop()
+            undo()
+        while self._savepoints[-1] > savepoint:
+            self._savepoints.pop()
+
+    def commit(self) -> None:
+        """
+        Accepts all the changes, discards the savepoints and stops recording the changes.
+        """
+        self._undo_log.clear()
+        self._savepoints.clear()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Reverts the changes made in the block if it raises an exception. The changes are committed
+        at the end of the block unless there is an outer savepoint.
+        """
+        savepoint = self.savepoint()
+        try:
+            yield
+        except BaseException:
+            self.rollback(savepoint)
+            raise
+        finally:
+            self._savepoints.pop()
+        if not self._savepoints:
+            self.commit()
+
+    def _record(self, undo: Callable[[], None]) -> None:
+        if self._savepoints:
+            self._undo_log.append(undo)
+
+    def add_node(self, node: ParsedActionNode) -> None:
+        name = node.name
+        previous_node = self.nodes.get(name)
+        self.nodes[name] = node
+
+        def undo_add_node():
+            if previous_node is None:
+                del self.nodes[name]
+            else:
+                # The replaced node keeps its position
+                self.nodes[name] = previous_node
+
+        self._record(undo_add_node)
+
     def remove_node(self, node_to_delete: ParsedActionNode):
-        del self.nodes[node_to_delete.name]
+        """
+        Removes the node and all the references to it from other nodes.
+        """
+        name = node_to_delete.name
+        if self._savepoints:
+            index = next(index for index, node_name in enumerate(self.nodes) if node_name == name)
+
+            def undo_remove_node():
+                self.nodes[name] = node_to_delete
+                # Restore the original order of the nodes by moving the following ones after the node
+                for following_name in list(islice(self.nodes, index, len(self.nodes) - 1)):
+                    self.nodes[following_name] = self.nodes.pop(following_name)
+
+            self._record(undo_remove_node)
+        del self.nodes[name]
 
         for node in self.nodes.values():
-            if node_to_delete.name in node.downstream_names:
-                node.downstream_names.remove(node_to_delete.name)
-            if node.error_xml == node_to_delete.name:
-                node.error_xml = None
+            if name in node.downstream_names:
+                self.remove_downstream(node, name)
+            if node.error_xml == name:
+                self.set_error_downstream(node, None)
+
+    def add_downstream(self, node: ParsedActionNode, downstream_name: str) -> None:
+        node.downstream_names.append(downstream_name)
+
+        def undo_add_downstream():
+            node.downstream_names.pop()
+
+        self._record(undo_add_downstream)
+
+    def remove_downstream(self, node: ParsedActionNode, downstream_name: str) -> None:
+        index = node.downstream_names.index(downstream_name)
+        del node.downstream_names[index]
+        self._record(lambda: node.downstream_names.insert(index, downstream_name))
+
+    def set_error_downstream(self, node: ParsedActionNode, error_name: Optional[str]) -> None:
+        previous_error_name = node.error_xml
+        node.error_xml = error_name
+
+        def undo_set_error_downstream():
+            node.error_xml = previous_error_name
+
+        self._record(undo_set_error_downstream)
+
+    def add_relation(self, relation: Relation) -> None:
+        if relation not in self.relations:
+            self.relations.add(relation)
+            self._record(lambda: self.relations.discard(relation))
+
+    def remove_relation(self, relation: Relation) -> None:
+        if relation in self.relations:
+            self.relations.remove(relation)
+            self._record(lambda: self.relations.add(relation))
+
+    def replace_tasks(self, node: ParsedActionNode, tasks: List[Task], relations: List[Relation]) -> None:
+        """
+        Replaces the tasks and the inner relations of the node.
+        """
+        previous_tasks, previous_relations = node.tasks, node.relations
+        node.tasks, node.relations = tasks, relations
+
+        def undo_replace_tasks():
+            node.tasks, node.relations = previous_tasks, previous_relations
+
+        self._record(undo_replace_tasks)
 
     def __repr__(self) -> str:
         return (
@@ -81,5 +229,9 @@ class Workflow:  # pylint: disable=too-few-public-methods
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            return self.__dict__ == other.__dict__
+            return all(
+                getattr(self, name) == getattr(other, name)
+                for name in self.__slots__
+                if not name.startswith("_")
+            )
         return False
@@ -19,6 +19,7 @@ from typing import Any, List, Set, Tuple
 from xml.etree.ElementTree import Element
 
 
+from o2a.converter.asset_manager import AssetManager
 from o2a.converter.relation import Relation
 from o2a.converter.task import Task
 from o2a.o2a_libs.property_utils import PropertySet
@@ -49,18 +50,31 @@ class BaseMapper(ABC):
         """
         raise NotImplementedError("Not Implemented")
 
+    @property
+    def mapper_type(self) -> str:
+        """
+        Name of the class of the mapper that converted the node.
+        """
+        return type(self).__name__
+
     def on_parse_node(self):
         """
         Called when processing a node.
         """
 
     # pylint: disable=unused-argument,no-self-use
-    def copy_extra_assets(self, input_directory_path: str, output_directory_path: str) -> None:
+    def copy_extra_assets(
+        self, input_directory_path: str, output_directory_path: str, asset_manager: AssetManager
+    ) -> None:
         """
         Copies extra assets required by the generated DAG - such as script files, jars etc.
 
+        The assets are not copied immediately, but registered in the asset manager
+        that copies assets of all the workflows at once.
+
         :param input_directory_path: oozie workflow application directory
         :param output_directory_path: output directory for the generated DAG and assets
+        :param asset_manager: asset manager to register the assets in
         :return: None
         """
         return None
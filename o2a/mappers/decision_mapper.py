@@ -14,16 +14,18 @@
 # limitations under the License.
 """Maps decision node to Airflow's DAG"""
 import collections
+import logging
 from typing import Dict, List, Set, Tuple
 
 from xml.etree.ElementTree import Element
 
+from lark.exceptions import LarkError
 
 from o2a.converter.task import Task
 from o2a.converter.relation import Relation
 from o2a.mappers.base_mapper import BaseMapper
+from o2a.o2a_libs import el_parser
 from o2a.o2a_libs.property_utils import PropertySet
-from o2a.utils.el_utils import convert_el_to_jinja
 
 
 # noinspection PyAbstractClass
@@ -51,6 +53,10 @@ class DecisionMapper(BaseMapper):
     </decision>
     ...
     </workflow-app>
+
+    The cases are translated to Python expressions evaluated over the dictionary of the workflow
+    properties named ``props``, so no Jinja is rendered when the decision is made. The cases which cannot
+    be translated raise an error when evaluated.
     """
 
     def __init__(
@@ -71,11 +77,25 @@ class DecisionMapper(BaseMapper):
         self.case_dict: Dict[str, str] = collections.OrderedDict()
         for case in switch_node:
             if "case" in case.tag:
-                case_text = convert_el_to_jinja(case.text.strip(), quote=True)
-                self.case_dict[case_text] = case.attrib["to"]
+                # The first matching case is taken
+                self.case_dict.setdefault(self._translate_case(case.text.strip()), case.attrib["to"])
             else:  # Default return value
                 self.case_dict["default"] = case.attrib["to"]
 
+    def _translate_case(self, case_text: str) -> str:
+        if "${" not in case_text and "#{" not in case_text:
+            # As in Oozie, only the "true" text ignoring case is true
+            return str(case_text.lower() == "true")
+        try:
+            expression = el_parser.translate_to_python(case_text, properties="props")
+        except (LarkError, ValueError) as ex:
+            logging.warning(
+                f"Unable to translate the case of the decision {self.name}: {ex}. "
+                f"The decision fails when the case is evaluated."
+            )
+            return f"el_operators.unsupported({case_text!r})"
+        return f"el_operators.to_boolean({expression})"
+
     def to_tasks_and_relations(self) -> Tuple[List[Task], List[Relation]]:
         tasks = [
             Task(
@@ -91,5 +111,7 @@ class DecisionMapper(BaseMapper):
         return {
             "from airflow.operators import python_operator",
             "from airflow.utils import dates",
-            "from o2a.o2a_libs.el_basic_functions import first_not_null",
+            "from o2a.o2a_libs import el_basic_functions",
+            "from o2a.o2a_libs import el_operators",
+            "from o2a.o2a_libs.property_utils import PropertySet",
         }
@@ -14,11 +14,13 @@
 # limitations under the License.
 """ DistCp Mapper module """
 
+import logging
 import shlex
 from typing import Dict, List, Set, Tuple
 from xml.etree.ElementTree import Element
 
 
+from o2a.converter.exceptions import ParseException
 from o2a.mappers.extensions.prepare_mapper_extension import PrepareMapperExtension
 from o2a.converter.relation import Relation
 from o2a.converter.task import Task
@@ -27,10 +29,34 @@ from o2a.o2a_libs.property_utils import PropertySet
 from o2a.utils import xml_utils, el_utils
 from o2a.utils.file_archive_extractors import ArchiveExtractor, FileExtractor
 
+# DistCp options and the configuration properties they are translated from, in order of precedence
+DISTCP_CONFIGURATION_OPTIONS: List[Tuple[str, List[str]]] = [
+    ("-m", ["distcp.max.maps", "mapreduce.job.maps"]),
+    ("-strategy", ["distcp.copy.strategy"]),
+    ("-bandwidth", ["distcp.map.bandwidth.mb"]),
+    ("-numListstatusThreads", ["distcp.liststatus.threads"]),
+]
+# The properties with this prefix configure the dynamic copy strategy
+DISTCP_DYNAMIC_STRATEGY_PREFIX = "distcp.dynamic."
+
+CONFIG_OPTIONS_PRECEDENCE = "distcp_options_precedence"
+PRECEDENCE_ARGUMENTS = "arguments"
+PRECEDENCE_CONFIGURATION = "configuration"
+PRECEDENCE_IGNORE = "ignore"
+
 
 class DistCpMapper(ActionMapper):
     """
-    Converts a Pig Oozie node to an Airflow task.
+    Converts a DistCp Oozie node to an Airflow task.
+
+    The parallelism and copy strategy set in the action configuration are translated into the explicit
+    ``-m``, ``-strategy``, ``-bandwidth`` and ``-numListstatusThreads`` options of DistCp. The
+    ``distcp_options_precedence`` option of the configuration.properties file decides what happens when
+    an option is set both ways:
+
+    - ``arguments`` (default) - the value from the ``<arg>`` elements is kept,
+    - ``configuration`` - the value from the action configuration replaces it,
+    - ``ignore`` - the action configuration is not translated at all.
     """
 
     def __init__(self, oozie_node: Element, name: str, dag_name: str, props: PropertySet, **kwargs):
@@ -56,9 +82,50 @@ class DistCpMapper(ActionMapper):
                     # The full URL should be preserved when replacing the EL (and not just the path)
                     #   to enable copying files between two different clusters.
                     value = el_utils.replace_url_el(value, props=self.props)
-                value = shlex.quote(value)
                 args.append(value)
-        return " ".join(args)
+        args = self._add_configuration_options(args)
+        return " ".join(shlex.quote(arg) for arg in args)
+
+    def _get_configuration_options(self) -> Dict[str, str]:
+        properties = self.props.action_node_properties
+        options: Dict[str, str] = {}
+        uses_dynamic_strategy = any(name.startswith(DISTCP_DYNAMIC_STRATEGY_PREFIX) for name in properties)
+        for option, property_names in DISTCP_CONFIGURATION_OPTIONS:
+            values = [properties[name] for name in property_names if properties.get(name)]
+            if values:
+                options[option] = values[0]
+            elif option == "-strategy" and uses_dynamic_strategy:
+                options[option] = "dynamic"
+        return options
+
+    def _add_configuration_options(self, args: List[str]) -> List[str]:
+        precedence = self.props.config.get(CONFIG_OPTIONS_PRECEDENCE, PRECEDENCE_ARGUMENTS)
+        if precedence not in (PRECEDENCE_ARGUMENTS, PRECEDENCE_CONFIGURATION, PRECEDENCE_IGNORE):
+            raise ParseException(
+                f"Unknown value of {CONFIG_OPTIONS_PRECEDENCE}: {precedence}. Expected one of: "
+                f"{PRECEDENCE_ARGUMENTS}, {PRECEDENCE_CONFIGURATION}, {PRECEDENCE_IGNORE}"
+            )
+        if precedence == PRECEDENCE_IGNORE:
+            return args
+        options = self._get_configuration_options()
+        for option, value in list(options.items()):
+            if option not in args:
+                continue
+            if precedence == PRECEDENCE_ARGUMENTS:
+                logging.info(
+                    f"Keeping the {option} argument of {self.name} instead of {value} from configuration"
+                )
+                del options[option]
+            else:
+                logging.warning(
+                    f"Replacing the {option} argument of {self.name} with {value} from configuration"
+                )
+                index = args.index(option)
+                args = [arg for arg_index, arg in enumerate(args) if arg_index not in (index, index + 1)]
+        if options:
+            logging.info(f"Translated the configuration of {self.name} into the DistCp options: {options}")
+        # The options have to precede the source and target paths
+        return [arg for option, value in options.items() for arg in (option, value)] + args
 
     def _get_distcp_command(self):
         return f"--class=org.apache.hadoop.tools.DistCp -- {self.args}"
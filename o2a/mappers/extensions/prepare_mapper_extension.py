@@ -22,30 +22,35 @@ from o2a.utils.el_utils import normalize_path
 
 
 class PrepareMapperExtension:
-    """Extension of mapper used to add Prepare node capability to a node in composable way"""
+    """
+    Extension of mapper used to add Prepare node capability to a node in composable way
+
+    The prepare node is parsed once, the first time it is needed, and the paths are kept with the mapper.
+    """
 
     def __init__(self, mapper: BaseMapper):
         self.mapper: BaseMapper = mapper
+        self._prepare_paths: Optional[Tuple[List[str], List[str]]] = None
 
-    def has_prepare(self):
-        prepare_node = xml_utils.find_node_by_tag(self.mapper.oozie_node, "prepare")
-        if prepare_node:
-            delete_nodes = xml_utils.find_nodes_by_tag(prepare_node, "delete")
-            mkdir_nodes = xml_utils.find_node_by_tag(prepare_node, "mkdir")
-            if delete_nodes or mkdir_nodes:
-                return True
-        return False
+    def has_prepare(self) -> bool:
+        delete_paths, mkdir_paths = self.parse_prepare_node()
+        return bool(delete_paths or mkdir_paths)
 
     def get_prepare_task(self) -> Optional[Task]:
         delete_paths, mkdir_paths = self.parse_prepare_node()
+        return self.create_prepare_task(self.mapper.name + "_prepare", delete_paths, mkdir_paths)
+
+    @staticmethod
+    def create_prepare_task(task_id: str, delete_paths: List[str], mkdir_paths: List[str]) -> Optional[Task]:
+        """
+        Creates the task deleting and creating the directories or returns None if there is nothing to do.
+        """
         if not delete_paths and not mkdir_paths:
             return None
         delete = " ".join(delete_paths) if delete_paths else None
         mkdir = " ".join(mkdir_paths) if mkdir_paths else None
         return Task(
-            task_id=self.mapper.name + "_prepare",
-            template_name="prepare.tpl",
-            template_params=dict(delete=delete, mkdir=mkdir),
+            task_id=task_id, template_name="prepare.tpl", template_params=dict(delete=delete, mkdir=mkdir)
         )
 
     def parse_prepare_node(self) -> Tuple[List[str], List[str]]:
@@ -57,6 +62,11 @@ class PrepareMapperExtension:
             ...
         </prepare>
         """
+        if self._prepare_paths is None:
+            self._prepare_paths = self._parse_prepare_node()
+        return self._prepare_paths
+
+    def _parse_prepare_node(self) -> Tuple[List[str], List[str]]:
         delete_paths = []
         mkdir_paths = []
         prepare_node = xml_utils.find_node_by_tag(self.mapper.oozie_node, "prepare")
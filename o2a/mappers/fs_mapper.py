@@ -19,6 +19,7 @@ from typing import List, Set, Tuple
 
 from xml.etree.ElementTree import Element
 
+from o2a.converter.conversion_options import ConversionOptions
 from o2a.converter.relation import Relation
 from o2a.converter.task import Task
 from o2a.mappers.action_mapper import ActionMapper
@@ -112,11 +113,24 @@ FS_OPERATION_MAPPERS = {
 class FsMapper(ActionMapper):
     """
     Converts a FS Oozie node to an Airflow task.
+
+    Each operation is run as a separate Dataproc job, unless the ``single_fs_job`` option is set - then all
+    the operations are run by a single Pig script, which logs the name of each operation before it runs.
     """
 
-    def __init__(self, oozie_node: Element, name: str, dag_name: str, props: PropertySet, **kwargs):
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        oozie_node: Element,
+        name: str,
+        dag_name: str,
+        props: PropertySet,
+        options: ConversionOptions = ConversionOptions(),
+        **kwargs,
+    ):
         super().__init__(oozie_node=oozie_node, name=name, props=props, dag_name=dag_name, **kwargs)
         self.oozie_node = oozie_node
+        self.options = options
         self.tasks: List[Task] = []
 
     def on_parse_node(self):
@@ -140,8 +154,29 @@ class FsMapper(ActionMapper):
             # Each mapper must return at least one task
             return [Task(task_id=self.name, template_name="dummy.tpl")]
 
+        if self.options.single_fs_job and len(tasks) > 1:
+            return [self.merge_fs_operations(tasks)]
+
         return tasks
 
+    def merge_fs_operations(self, tasks: List[Task]) -> Task:
+        """
+        Merges the tasks of the operations into one task running them one after another in a single job.
+        """
+        pig_commands = []
+        for task in tasks:
+            # Names of the nodes are valid shell words, so the task id does not have to be quoted
+            pig_commands.append(f"sh echo {task.task_id}")
+            pig_commands.append(task.template_params["pig_command"])
+        # The fs and sh Grunt commands end with the line - a semicolon would be passed to them as an argument
+        return Task(
+            task_id=self.name,
+            template_name="fs_op.tpl",
+            template_params=dict(
+                pig_command="\n".join(pig_commands), action_node_properties=self.props.action_node_properties
+            ),
+        )
+
     def to_tasks_and_relations(self) -> Tuple[List[Task], List[Relation]]:
         return self.tasks, chain(self.tasks)
 
@@ -20,6 +20,7 @@ from urllib.parse import urlparse
 from xml.etree.ElementTree import Element
 
 
+from o2a.converter.exceptions import ParseException
 from o2a.converter.relation import Relation
 from o2a.converter.task import Task
 from o2a.mappers.action_mapper import ActionMapper
@@ -34,9 +35,20 @@ TAG_BRANCH = "branch"
 TAG_KEY_PATH = "key-path"
 TAG_DESTINATION_URI = "destination-uri"
 
+CONFIG_CLONE_DEPTH = "git_clone_depth"
+CONFIG_SPARSE_PATHS = "git_sparse_paths"
+CONFIG_MIRROR_CACHE_PATH = "git_mirror_cache_path"
+
 
 def prepare_git_command(
-    git_uri: str, git_branch: Optional[str], destination_path: str, key_path: Optional[str]
+    *,
+    git_uri: str,
+    git_branch: Optional[str],
+    destination_path: str,
+    key_path: Optional[str],
+    depth: Optional[int] = None,
+    sparse_paths: Optional[List[str]] = None,
+    mirror_cache_path: Optional[str] = None,
 ):
     cmd = (
         f"$DAGS_FOLDER/../data/git.sh "
@@ -52,12 +64,28 @@ def prepare_git_command(
     if key_path:
         cmd += f" --key-path {shlex.quote(key_path)}"
 
+    if depth:
+        cmd += f" --depth {depth}"
+
+    for sparse_path in sparse_paths or []:
+        cmd += f" --sparse-path {shlex.quote(sparse_path)}"
+
+    if mirror_cache_path:
+        cmd += f" --mirror-cache {shlex.quote(mirror_cache_path)}"
+
     return cmd
 
 
 class GitMapper(ActionMapper):
     """
-    Converts a Shell Oozie action to an Airflow task.
+    Converts a Git Oozie action to an Airflow task.
+
+    The clone can be made cheaper with the following options of the configuration.properties file:
+
+    - ``git_clone_depth`` - creates a shallow clone with the given number of commits,
+    - ``git_sparse_paths`` - comma-separated list of the paths checked out from the repository,
+    - ``git_mirror_cache_path`` - directory on the cluster with the mirrors of the cloned repositories.
+      The repository is fetched into the mirror and cloned from it instead of the remote repository.
     """
 
     def __init__(self, oozie_node: Element, name: str, props: PropertySet, **kwargs):
@@ -68,6 +96,9 @@ class GitMapper(ActionMapper):
         self.destination_path: Optional[str] = None
         self.key_path_uri: Optional[str] = None
         self.key_path: Optional[str] = None
+        self.depth: Optional[int] = None
+        self.sparse_paths: List[str] = []
+        self.mirror_cache_path: Optional[str] = None
         self.prepare_extension: PrepareMapperExtension = PrepareMapperExtension(self)
 
     def on_parse_node(self):
@@ -80,6 +111,30 @@ class GitMapper(ActionMapper):
         self.destination_path = urlparse(self.destination_uri).path
         key_path_uri = get_tag_el_text(self.oozie_node, tag=TAG_KEY_PATH, props=self.props, default=None)
         self.key_path = urlparse(key_path_uri).path if key_path_uri else None
+        self._parse_clone_options()
+
+    def _parse_clone_options(self):
+        config = self.props.config
+        self.depth = self._parse_clone_depth(config.get(CONFIG_CLONE_DEPTH))
+        self.sparse_paths = [
+            path.strip() for path in config.get(CONFIG_SPARSE_PATHS, "").split(",") if path.strip()
+        ]
+        self.mirror_cache_path = config.get(CONFIG_MIRROR_CACHE_PATH) or None
+
+    def _parse_clone_depth(self, depth: Optional[str]) -> Optional[int]:
+        if not depth:
+            return None
+        try:
+            value = int(depth)
+        except ValueError as ex:
+            raise ParseException(
+                f"The {CONFIG_CLONE_DEPTH} property of {self.name} is not a number: {depth}"
+            ) from ex
+        if value < 1:
+            raise ParseException(
+                f"The {CONFIG_CLONE_DEPTH} property of {self.name} must be positive: {depth}"
+            )
+        return value
 
     def to_tasks_and_relations(self) -> Tuple[List[Task], List[Relation]]:
         action_task = Task(
@@ -90,6 +145,9 @@ class GitMapper(ActionMapper):
                 git_branch=self.git_branch,
                 destination_path=self.destination_path,
                 key_path=self.key_path,
+                depth=self.depth,
+                sparse_paths=self.sparse_paths,
+                mirror_cache_path=self.mirror_cache_path,
                 props=self.props,
             ),
         )
@@ -14,12 +14,12 @@
 # limitations under the License.
 """Maps Oozie pig node to Airflow's DAG"""
 import os
-import shutil
 from typing import Dict, Set, Optional, List
 
 from xml.etree.ElementTree import Element
 
 
+from o2a.converter.asset_manager import AssetManager
 from o2a.converter.exceptions import ParseException
 from o2a.converter.task import Task
 from o2a.mappers.action_mapper import ActionMapper
@@ -92,13 +92,14 @@ class HiveMapper(ActionMapper):
 
         return tasks, relations
 
-    def copy_extra_assets(self, input_directory_path: str, output_directory_path: str):
+    def copy_extra_assets(
+        self, input_directory_path: str, output_directory_path: str, asset_manager: AssetManager
+    ):
         if not self.script:
             return
         source_script_file_path = os.path.join(input_directory_path, self.script)
         destination_script_file_path = os.path.join(output_directory_path, self.script)
-        os.makedirs(os.path.dirname(destination_script_file_path), exist_ok=True)
-        shutil.copy(source_script_file_path, destination_script_file_path)
+        asset_manager.add_asset(source_script_file_path, destination_script_file_path)
 
     def required_imports(self) -> Set[str]:
         return {"from airflow.utils import dates", "from airflow.contrib.operators import dataproc_operator"}
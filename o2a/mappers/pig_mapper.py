@@ -19,6 +19,7 @@ from typing import Dict, Set, Tuple, List
 from xml.etree.ElementTree import Element
 
 
+from o2a.converter.asset_manager import AssetManager
 from o2a.converter.task import Task
 from o2a.converter.relation import Relation
 from o2a.mappers.action_mapper import ActionMapper
@@ -72,27 +73,22 @@ class PigMapper(ActionMapper):
             tasks, relations = self.prepend_task(prepare_task, tasks, relations)
         return tasks, relations
 
-    def _add_symlinks(self, destination_pig_file):
-        destination_pig_file.write("set mapred.create.symlink yes;\n")
+    def _get_symlinks_header(self) -> str:
+        header = "set mapred.create.symlink yes;\n"
         if self.files:
-            destination_pig_file.write("set mapred.cache.file {};\n".format(",".join(self.hdfs_files)))
+            header += "set mapred.cache.file {};\n".format(",".join(self.hdfs_files))
         if self.archives:
-            destination_pig_file.write("set mapred.cache.archives {};\n".format(",".join(self.hdfs_archives)))
+            header += "set mapred.cache.archives {};\n".format(",".join(self.hdfs_archives))
+        return header
 
-    def copy_extra_assets(self, input_directory_path: str, output_directory_path: str):
+    def copy_extra_assets(
+        self, input_directory_path: str, output_directory_path: str, asset_manager: AssetManager
+    ):
         self._validate_paths(input_directory_path, output_directory_path)
         source_pig_file_path = os.path.join(input_directory_path, self.script_file_name)
         destination_pig_file_path = os.path.join(output_directory_path, self.script_file_name)
-        self._copy_pig_script_with_path_injection(destination_pig_file_path, source_pig_file_path)
-
-    def _copy_pig_script_with_path_injection(self, destination_pig_file_path, source_pig_file_path):
-        os.makedirs(os.path.dirname(destination_pig_file_path), exist_ok=True)
-        with open(destination_pig_file_path, "w") as destination_pig_file:
-            with open(source_pig_file_path, "r") as source_pig_file:
-                pig_script = source_pig_file.read()
-                if self.files or self.archives:
-                    self._add_symlinks(destination_pig_file)
-                destination_pig_file.write(pig_script)
+        header = self._get_symlinks_header() if self.files or self.archives else None
+        asset_manager.add_asset(source_pig_file_path, destination_pig_file_path, header=header)
 
     @staticmethod
     def _validate_paths(input_directory_path, output_directory_path):
@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Maps Spark action to Airflow Dag"""
+import logging
+import shlex
 from typing import Dict, Set, List, Optional, Tuple
 
 import xml.etree.ElementTree as ET
@@ -39,6 +41,38 @@ SPARK_TAG_JOB_NAME = "name"
 SPARK_TAG_CLASS = "class"
 SPARK_TAG_JAR = "jar"
 
+# Options of spark-submit: the Spark property each option sets (None if the option is skipped)
+# and whether the option takes a value
+SPARK_SUBMIT_OPTIONS: Dict[str, Tuple[Optional[str], bool]] = {
+    "name": ("spark.app.name", True),
+    "driver-memory": ("spark.driver.memory", True),
+    "driver-cores": ("spark.driver.cores", True),
+    "driver-java-options": ("spark.driver.extraJavaOptions", True),
+    "driver-library-path": ("spark.driver.extraLibraryPath", True),
+    "driver-class-path": ("spark.driver.extraClassPath", True),
+    "executor-memory": ("spark.executor.memory", True),
+    "executor-cores": ("spark.executor.cores", True),
+    "num-executors": ("spark.executor.instances", True),
+    "total-executor-cores": ("spark.cores.max", True),
+    "queue": ("spark.yarn.queue", True),
+    "jars": ("spark.jars", True),
+    "packages": ("spark.jars.packages", True),
+    "exclude-packages": ("spark.jars.excludes", True),
+    "repositories": ("spark.jars.repositories", True),
+    "py-files": ("spark.submit.pyFiles", True),
+    "files": ("spark.files", True),
+    "archives": ("spark.yarn.dist.archives", True),
+    "principal": ("spark.yarn.principal", True),
+    "keytab": ("spark.yarn.keytab", True),
+    "supervise": ("spark.driver.supervise", False),
+    # Managed by Dataproc
+    "master": (None, True),
+    "deploy-mode": (None, True),
+    "proxy-user": (None, True),
+    "properties-file": (None, True),
+    "verbose": (None, False),
+}
+
 
 class SparkMapper(ActionMapper):
     """Maps Spark Action"""
@@ -78,38 +112,71 @@ class SparkMapper(ActionMapper):
         for arg in app_args:
             self.application_args.append(el_utils.replace_el_with_var(arg.text, self.props, quote=False))
 
-    @staticmethod
-    def _parse_spark_opts(spark_opts_node: ET.Element):
+    def _parse_spark_opts(self, spark_opts_node: ET.Element) -> Dict[str, str]:
         """
+        Translates the spark-submit options into the Spark properties.
         Some examples of the spark-opts element:
         --conf key1=value
         --conf key2="value1 value2"
+        --executor-memory 20G --num-executors 50
+
+        The options set explicitly take precedence over the same properties set with --conf,
+        as in spark-submit. The options which cannot be translated are skipped with a warning.
         """
-        conf: Dict[str, str] = {}
-        if spark_opts_node.text:
-            spark_opts = spark_opts_node.text.split("--")[1:]
-        else:
+        if not spark_opts_node.text:
             raise ParseException("Spark opts node has no text: {}".format(spark_opts_node))
-        clean_opts = [opt.strip() for opt in spark_opts]
-        clean_opts_split = [opt.split(maxsplit=1) for opt in clean_opts]
-
-        for spark_opt in clean_opts_split:
-            # Can have multiple "--conf" in spark_opts
-            if spark_opt[0] == "conf":
-                key, _, value = spark_opt[1].partition("=")
-                # Value is required
-                if not value:
-                    raise ParseException(
-                        f"Incorrect parameter format. Expected format: key=value. Current value: {spark_opt}"
-                    )
-                # Delete surrounding quotes
-                if len(value) > 2 and value[0] in ["'", '"'] and value:
-                    value = value[1:-1]
-                conf[key] = value
-            # TODO: parse also other options (like --executor-memory 20G --num-executors 50 and many more)
-            #  see: https://oozie.apache.org/docs/5.1.0/DG_SparkActionExtension.html#PySpark_with_Spark_Action
-
-        return conf
+        try:
+            tokens = shlex.split(spark_opts_node.text)
+        except ValueError as ex:
+            raise ParseException(f"Incorrect spark-opts: {spark_opts_node.text}: {ex}") from ex
+
+        conf: Dict[str, str] = {}
+        option_properties: Dict[str, str] = {}
+        while tokens:
+            token = tokens.pop(0)
+            if not token.startswith("--"):
+                logging.warning(f"Skipping the unexpected spark-opts value of {self.name}: {token}")
+                continue
+            option, separator, value = token[2:].partition("=")
+            if option == "conf":
+                key, conf_value = self._parse_conf(value if separator else self._pop_value(option, tokens))
+                conf[key] = conf_value
+                continue
+            if option not in SPARK_SUBMIT_OPTIONS:
+                logging.warning(f"Skipping the unknown spark-opts option of {self.name}: {token}")
+                continue
+            spark_property, takes_value = SPARK_SUBMIT_OPTIONS[option]
+            if takes_value and not separator:
+                value = self._pop_value(option, tokens)
+            if spark_property is None:
+                logging.warning(
+                    f"Skipping the --{option} spark-opts option of {self.name} managed by Dataproc"
+                )
+            elif not takes_value:
+                option_properties[spark_property] = "true"
+            elif value:
+                option_properties[spark_property] = value
+            else:
+                raise ParseException(f"Missing value of the --{option} spark-opts option of {self.name}")
+
+        return {**conf, **option_properties}
+
+    def _pop_value(self, option: str, tokens: List[str]) -> str:
+        """Removes the value of the option from the front of the tokens."""
+        if not tokens or tokens[0].startswith("--"):
+            raise ParseException(f"Missing value of the --{option} spark-opts option of {self.name}")
+        return tokens.pop(0)
+
+    @staticmethod
+    def _parse_conf(value: str) -> Tuple[str, str]:
+        """Splits the value of the --conf option into the property and its value."""
+        key, _, conf_value = value.partition("=")
+        # Value is required
+        if not conf_value:
+            raise ParseException(
+                f"Incorrect parameter format. Expected format: key=value. Current value: {value}"
+            )
+        return key, conf_value
 
     def to_tasks_and_relations(self) -> Tuple[List[Task], List[Relation]]:
         action_task = Task(
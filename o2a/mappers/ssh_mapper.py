@@ -30,7 +30,7 @@ class SSHMapper(ActionMapper):
     Converts an SSH oozie node to Airflow operator.
 
     In order to use this, the user must specify an Airflow connection to use, and
-    provide the password there.
+    provide the password there. The SSH hook is created when the task runs, not when the DAG is parsed.
     """
 
     def __init__(
@@ -89,8 +89,4 @@ class SSHMapper(ActionMapper):
         return tasks, relations
 
     def required_imports(self) -> Set[str]:
-        return {
-            "from airflow.utils import dates",
-            "from airflow.contrib.operators import ssh_operator",
-            "from airflow.contrib.hooks import ssh_hook",
-        }
+        return {"from airflow.utils import dates", "from o2a.o2a_libs import lazy_ssh_operator"}
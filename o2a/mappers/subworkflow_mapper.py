@@ -15,14 +15,17 @@
 """Maps subworkflow of Oozie to Airflow's sub-dag"""
 import logging
 import os
-from typing import Dict, Set, Type, Tuple, List
+from typing import Dict, Optional, Set, Type, Tuple, List
 
 from xml.etree.ElementTree import Element
 
+from o2a.converter.asset_manager import AssetManager
+from o2a.converter.conversion_options import ConversionOptions
 from o2a.converter.oozie_converter import OozieConverter
 from o2a.converter.relation import Relation
 from o2a.converter.renderers import BaseRenderer
 from o2a.converter.task import Task
+from o2a.converter.workflow import Workflow
 from o2a.definitions import EXAMPLES_PATH
 from o2a.mappers.action_mapper import ActionMapper
 from o2a.o2a_libs.property_utils import PropertySet
@@ -33,6 +36,9 @@ from o2a.utils import el_utils
 class SubworkflowMapper(ActionMapper):
     """
     Converts a Sub-workflow Oozie node to an Airflow task.
+
+    The subworkflow is rendered as a separate sub-DAG. When the subworkflows are inlined, it is only
+    converted and its tasks are later moved into the DAG by the InlineSubworkflowTransformer.
     """
 
     # pylint: disable=too-many-arguments
@@ -46,6 +52,8 @@ class SubworkflowMapper(ActionMapper):
         props: PropertySet,
         action_mapper: Dict[str, Type[ActionMapper]],
         renderer: BaseRenderer,
+        asset_manager: Optional[AssetManager] = None,
+        options: ConversionOptions = ConversionOptions(),
         **kwargs,
     ):
         ActionMapper.__init__(
@@ -57,6 +65,10 @@ class SubworkflowMapper(ActionMapper):
         self.dag_name = dag_name
         self.action_mapper = action_mapper
         self.renderer = renderer
+        self.asset_manager = asset_manager
+        self.options = options
+        self.subworkflow: Optional[Workflow] = None
+        self.subworkflow_props: Optional[PropertySet] = None
         self._parse_oozie_node()
 
     def _parse_oozie_node(self):
@@ -74,8 +86,18 @@ class SubworkflowMapper(ActionMapper):
             action_mapper=self.action_mapper,
             dag_name=self.app_name,
             initial_props=self.get_child_props(),
+            asset_manager=self.asset_manager,
+            options=self.options.for_subworkflow(),
         )
-        converter.convert(as_subworkflow=True)
+        if self.options.inline_subworkflows:
+            converter.convert_workflow()
+            converter.copy_extra_assets(converter.workflow.nodes)
+            self.subworkflow = converter.workflow
+            self.subworkflow_props = converter.props
+        else:
+            converter.convert(as_subworkflow=True)
+        # Paths of this subworkflow and its own subworkflows
+        self.subworkflow_app_paths: List[str] = [app_path] + converter.get_subworkflow_app_paths()
 
     def get_child_props(self) -> PropertySet:
         propagate_configuration = self.oozie_node.find("propagate-configuration")
@@ -87,6 +109,9 @@ class SubworkflowMapper(ActionMapper):
         )
 
     def to_tasks_and_relations(self) -> Tuple[List[Task], List[Relation]]:
+        if self.options.inline_subworkflows:
+            # The task is replaced with the tasks of the subworkflow after the relations are converted
+            return [Task(task_id=self.name, template_name="dummy.tpl")], []
         tasks: List[Task] = [
             Task(task_id=self.name, template_name="subwf.tpl", template_params=dict(app_name=self.app_name))
         ]
@@ -94,6 +119,8 @@ class SubworkflowMapper(ActionMapper):
         return tasks, relations
 
     def required_imports(self) -> Set[str]:
+        if self.subworkflow is not None:
+            return {"from airflow.operators import dummy_operator", *self.subworkflow.dependencies}
         return {
             "from airflow.utils import dates",
             "from airflow.contrib.operators import dataproc_operator",
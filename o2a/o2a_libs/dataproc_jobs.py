@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Operators submitting the Dataproc jobs without waiting for them and sensors waiting for the jobs"""
+import uuid
+from typing import Any, Dict
+
+from airflow.contrib.hooks.gcp_dataproc_hook import DataProcHook
+from airflow.exceptions import AirflowException
+from airflow.models import BaseOperator
+from airflow.sensors.base_sensor_operator import BaseSensorOperator
+from airflow.utils.decorators import apply_defaults
+
+# States of the jobs that will not change anymore, except the successful DONE state
+FAILED_JOB_STATES = {"ERROR", "CANCELLED"}
+
+
+class DataProcJobSubmitOperator(BaseOperator):
+    """
+    Submits the Dataproc job and returns its id instead of waiting for the job to finish.
+    The id is pushed to XCom.
+
+    :param job_type: field of the job in the Dataproc API, for example ``pigJob``
+    :param job: definition of the job of the type as in the Dataproc API, templated
+    :param cluster_name: name of the cluster running the job
+    :param region: region of the Dataproc cluster
+    :param gcp_conn_id: connection used to submit the job
+    """
+
+    template_fields = ("job",)
+
+    @apply_defaults
+    def __init__(
+        self,
+        job_type: str,
+        job: Dict[str, Any],
+        cluster_name: str,
+        region: str = "global",
+        gcp_conn_id: str = "google_cloud_default",
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.job_type = job_type
+        self.job = job
+        self.cluster_name = cluster_name
+        self.region = region
+        self.gcp_conn_id = gcp_conn_id
+
+    def execute(self, context):
+        hook = DataProcHook(gcp_conn_id=self.gcp_conn_id)
+        body = {
+            "job": {
+                "reference": {
+                    "projectId": hook.project_id,
+                    "jobId": f"{self.task_id}_{uuid.uuid4().hex[:8]}",
+                },
+                "placement": {"clusterName": self.cluster_name},
+                self.job_type: self.job,
+            }
+        }
+        submitted_job = (
+            hook.get_conn()
+            .projects()
+            .regions()
+            .jobs()
+            .submit(projectId=hook.project_id, region=self.region, body=body)
+            .execute()
+        )
+        job_id = submitted_job["reference"]["jobId"]
+        self.log.info(f"Submitted the Dataproc job {job_id}")
+        return job_id
+
+
+class DataProcJobSensor(BaseSensorOperator):  # pylint: disable=too-few-public-methods
+    """
+    Waits for the Dataproc job to finish and fails if the job fails.
+
+    Used in the ``reschedule`` mode, it frees the worker slot between the checks.
+
+    :param job_id: id of the Dataproc job, templated
+    :param region: region of the Dataproc cluster
+    :param gcp_conn_id: connection used to check the job
+    """
+
+    template_fields = ("job_id",)
+
+    @apply_defaults
+    def __init__(
+        self, job_id: str, region: str = "global", gcp_conn_id: str = "google_cloud_default", **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.job_id = job_id
+        self.region = region
+        self.gcp_conn_id = gcp_conn_id
+
+    def poke(self, context):  # pylint: disable=unused-argument
+        hook = DataProcHook(gcp_conn_id=self.gcp_conn_id)
+        job = (
+            hook.get_conn()
+            .projects()
+            .regions()
+            .jobs()
+            .get(projectId=hook.project_id, region=self.region, jobId=self.job_id)
+            .execute()
+        )
+        state = job["status"]["state"]
+        self.log.info(f"The Dataproc job {self.job_id} is in the {state} state")
+        if state in FAILED_JOB_STATES:
+            raise AirflowException(
+                f"The Dataproc job {self.job_id} ended in the {state} state: {job['status'].get('details')}"
+            )
+        return state == "DONE"
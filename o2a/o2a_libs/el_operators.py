@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Operators of the Expression Language used by the EL expressions translated to Python.
+
+The operators coerce their operands the way EL does - the values of the properties are strings,
+so for example ``"20" > 10`` and ``"false" == False`` have to hold as they do in Oozie.
+"""
+from typing import Any, Tuple, Union
+
+EL_CONSTANTS = {"KB": 1024 ** 1, "MB": 1024 ** 2, "GB": 1024 ** 3, "TB": 1024 ** 4, "PB": 1024 ** 5}
+
+Number = Union[int, float]
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_float(value: Any) -> bool:
+    return isinstance(value, float) or (
+        isinstance(value, str) and any(char in value for char in (".", "e", "E"))
+    )
+
+
+def _to_int(value: Any) -> int:
+    if value is None or value == "":
+        return 0
+    if isinstance(value, bool):
+        raise TypeError(f"Cannot coerce {value!r} to a number")
+    return int(value)
+
+
+def _to_float(value: Any) -> float:
+    if value is None or value == "":
+        return 0.0
+    if isinstance(value, bool):
+        raise TypeError(f"Cannot coerce {value!r} to a number")
+    return float(value)
+
+
+def _to_number(value: Any) -> Number:
+    return _to_float(value) if _is_float(value) else _to_int(value)
+
+
+def _to_string(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _to_numbers(first: Any, second: Any) -> Tuple[Number, Number]:
+    if _is_float(first) or _is_float(second):
+        return _to_float(first), _to_float(second)
+    return _to_int(first), _to_int(second)
+
+
+def to_boolean(value: Any) -> bool:
+    """
+    Coerces the value to a boolean. Strings other than "true" (ignoring case) are false.
+    """
+    if value is None or value == "":
+        return False
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.lower() == "true"
+    raise TypeError(f"Cannot coerce {value!r} to a boolean")
+
+
+def unsupported(expression: str) -> bool:
+    """
+    Stands in for the expression which could not be translated to Python.
+    """
+    raise NotImplementedError(f"The EL expression is not supported: {expression}")
+
+
+def empty(value: Any) -> bool:
+    """
+    Implements the ``empty`` operator - true for null and empty strings and collections.
+    """
+    if value is None:
+        return True
+    if isinstance(value, (str, list, tuple, dict, set)):
+        return not value
+    return False
+
+
+def not_(value: Any) -> bool:
+    """Implements the ``not`` and ``!`` operators."""
+    return not to_boolean(value)
+
+
+def neg(value: Any) -> Number:
+    """Implements the unary ``-`` operator."""
+    return -_to_number(value)
+
+
+def add(first: Any, second: Any) -> Number:
+    """Implements the ``+`` operator."""
+    first_number, second_number = _to_numbers(first, second)
+    return first_number + second_number
+
+
+def sub(first: Any, second: Any) -> Number:
+    """Implements the binary ``-`` operator."""
+    first_number, second_number = _to_numbers(first, second)
+    return first_number - second_number
+
+
+def mul(first: Any, second: Any) -> Number:
+    """Implements the ``*`` operator."""
+    first_number, second_number = _to_numbers(first, second)
+    return first_number * second_number
+
+
+def div(first: Any, second: Any) -> float:
+    """Implements the ``/`` and ``div`` operators."""
+    return _to_float(first) / _to_float(second)
+
+
+def mod(first: Any, second: Any) -> Number:
+    """Implements the ``%`` and ``mod`` operators. The result has the sign of the dividend as in Java."""
+    first_number, second_number = _to_numbers(first, second)
+    remainder = abs(first_number) % abs(second_number)
+    return remainder if first_number >= 0 else -remainder
+
+
+def eq(first: Any, second: Any) -> bool:
+    """Implements the ``==`` and ``eq`` operators."""
+    if first is second:
+        return True
+    if first is None or second is None:
+        return False
+    if _is_number(first) or _is_number(second):
+        try:
+            first_number, second_number = _to_numbers(first, second)
+            return first_number == second_number
+        except ValueError:
+            pass
+    if isinstance(first, bool) or isinstance(second, bool):
+        return to_boolean(first) == to_boolean(second)
+    if isinstance(first, str) or isinstance(second, str):
+        return _to_string(first) == _to_string(second)
+    return bool(first == second)
+
+
+def ne(first: Any, second: Any) -> bool:
+    """Implements the ``!=`` and ``ne`` operators."""
+    return not eq(first, second)
+
+
+def _sign(first: Any, second: Any) -> int:
+    return int(first > second) - int(first < second)
+
+
+def _compare(first: Any, second: Any) -> int:
+    # Strings are coerced to numbers only when compared with numbers and only if they can be parsed
+    if _is_number(first) or _is_number(second):
+        try:
+            return _sign(*_to_numbers(first, second))
+        except ValueError:
+            pass
+    if isinstance(first, str) or isinstance(second, str):
+        return _sign(_to_string(first), _to_string(second))
+    return _sign(first, second)
+
+
+def lt(first: Any, second: Any) -> bool:
+    """Implements the ``<`` and ``lt`` operators."""
+    if first is None or second is None:
+        return False
+    return _compare(first, second) < 0
+
+
+def gt(first: Any, second: Any) -> bool:
+    """Implements the ``>`` and ``gt`` operators."""
+    if first is None or second is None:
+        return False
+    return _compare(first, second) > 0
+
+
+def le(first: Any, second: Any) -> bool:
+    """Implements the ``<=`` and ``le`` operators."""
+    if first is second:
+        return True
+    if first is None or second is None:
+        return False
+    return _compare(first, second) <= 0
+
+
+def ge(first: Any, second: Any) -> bool:
+    """Implements the ``>=`` and ``ge`` operators."""
+    if first is second:
+        return True
+    if first is None or second is None:
+        return False
+    return _compare(first, second) >= 0
@@ -13,19 +13,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """
-This module contains tools for translating Expression Language to Jinja.
+This module contains tools for translating Expression Language to Jinja and to Python.
 
 The BNF for the grammar is based on official grammar of EL:
 https://download.oracle.com/otn-pub/jcp/jsp-2.1-fr-spec-oth-JSpec/jsp-2_1-fr-spec-el.pdf
 """
 
-__all__ = ["translate"]
+__all__ = ["translate", "translate_to_python"]
 
-from typing import Union, Optional
+from functools import lru_cache
+from typing import Callable, Dict, List, Union
 import re
 
 from lark import Lark, Tree, Token
 
+from o2a.o2a_libs.el_operators import EL_CONSTANTS
+
 
 GRAMMAR = r"""
     start: (lvalue (start)?)* | (rvalue (start)?)* | literal_expression (rvalue (start)?)?
@@ -126,8 +129,13 @@ GRAMMAR = r"""
 """
 
 
+@lru_cache(maxsize=None)
+def _get_lark() -> Lark:
+    return Lark(GRAMMAR, start="start", keep_all_tokens=True, ambiguity="resolve")
+
+
 def _parser(sentence: str) -> Tree:
-    return Lark(GRAMMAR, start="start", keep_all_tokens=True, ambiguity="resolve").parse(sentence)
+    return _get_lark().parse(sentence)
 
 
 def _camel_to_snake(name: str) -> str:
@@ -140,151 +148,381 @@ def _camel_to_snake(name: str) -> str:
     return sub
 
 
-def _translate_binary_operator(tree: Tree) -> str:
-    """
-    Translates non-python binary operators to python equivalents.
-    """
-    # Binary op will have only one child and it will be a Token
-    operator = tree.children[0]
-
-    if operator.value == "gt":
-        operator.value = ">"
-
-    if operator.value == "lt":
-        operator.value = "<"
-
-    if operator.value == "ge":
-        operator.value = ">="
-
-    if operator.value == "le":
-        operator.value = "<="
-
-    if operator.value == "ne":
-        operator.value = "!="
+# Non-python binary operators and their python equivalents
+JINJA_BINARY_OPERATORS = {
+    "gt": ">",
+    "lt": "<",
+    "ge": ">=",
+    "le": "<=",
+    "ne": "!=",
+    "eq": "==",
+    "||": "or",
+    "&&": "and",
+    "mod": "%",
+    "div": "/",
+}
 
-    if operator.value == "eq":
-        operator.value = "=="
 
-    if operator.value == "||":
-        operator.value = "or"
+# Non-python tokens and their python equivalents
+JINJA_TOKENS = {"BEGIN": " {{", "END": "}} ", "INVOCATION_COLON": "_", "NULL": "None"}
 
-    if operator.value == "&&":
-        operator.value = "and"
 
-    if operator.value == "mod":
-        operator.value = "%"
-
-    if operator.value == "div":
-        operator.value = "/"
+def _translate_jinja_token(token: Token) -> str:
+    """
+    Translates non-python values to python equivalents.
+    """
+    if token.type in JINJA_TOKENS:
+        return JINJA_TOKENS[token.type]
+    if token.type == "BOOL":
+        return "True" if token.value == "true" else "False"
+    if token.type == "JAVA":
+        return _camel_to_snake(token.value)
+    return str(token.value)
 
-    operator.value = " " + operator.value + " "
 
-    return str(operator.value)
+def _has_ternary(tree: Tree) -> bool:
+    return any(isinstance(child, Tree) and child.data == "ternary" for child in tree.children)
 
 
-def _translate_ternary(tree: Tree) -> Optional[str]:
+def _expand_jinja(tree: Tree) -> List[Union[Tree, Token, str]]:
     """
-    Translates ternary expression.
+    Returns the subtrees and the texts the tree is translated to, in order.
     """
-    if tree.data == "expression" and "ternary" in [ch.data for ch in tree.children]:
+    if tree.data == "binary_op":
+        operator = str(tree.children[0])
+        return [f" {JINJA_BINARY_OPERATORS.get(operator, operator)} "]
+
+    if tree.data == "expression" and _has_ternary(tree):
         # Case of `f() ? true : false`
         condition, ternary = tree.children
         _, if_true, _, if_false = ternary.children
-        translation = f"{_translate_el(if_true)} if {_translate_el(condition)} else {_translate_el(if_false)}"
-        return translation
+        return [if_true, " if ", condition, " else ", if_false]
 
-    if tree.data == "expression1" and "ternary" in [ch.data for ch in tree.children[-1].children]:
+    if tree.data == "expression1" and len(tree.children) == 3 and _has_ternary(tree.children[2]):
         # Case of `x op y ? true : false`
-        first = _translate_el(tree.children[0])
-        operator = _translate_el(tree.children[1])
+        first, operator, right = tree.children
+        second, ternary = right.children
+        _, if_true, _, if_false = ternary.children
+        return [if_true, " if ", first, operator, second, " else ", if_false]
 
-        # expression | ternary
-        expression, ternary = tree.children[2].children
+    return list(tree.children)
 
-        # ? | expression | : | expression
-        _, if_true, _, if_false = ternary.children
 
-        second = _translate_el(expression)
+# Spaces between "}}" and "/", spaces between "/" and "{{" and runs of spaces - kept as a single space
+_PURIFY = re.compile(r"(?<=}}) +(?=/)|(?<=/) +(?={{)|( ) +")
 
-        condition = f"{first}{operator}{second}"
-        translation = f"{_translate_el(if_true)} if {condition} else {_translate_el(if_false)}"
-        return translation
 
-    return None
+def _purify(sentence: str) -> str:
+    """
+    Removes the spaces around the slashes joining expressions and collapses the other runs of spaces
+    in a single substitution.
+    """
+    return _PURIFY.sub(r"\1", sentence.strip())
 
 
-def _translate_token(token: Token) -> str:
+def _translate_jinja(tree: Tree) -> str:
     """
-    Translates non-python values to python equivalents.
+    Translates el expression to jinja equivalent. The tree is walked top-down with an explicit stack,
+    so deeply nested expressions do not hit the recursion limit, and the tree is not modified.
     """
-    if token.type == "BEGIN":
-        token.value = " {{"
+    fragments: List[str] = []
+    stack: List[Union[Tree, Token, str]] = [tree]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, Token):
+            fragments.append(_translate_jinja_token(item))
+        elif isinstance(item, str):
+            fragments.append(item)
+        else:
+            stack.extend(reversed(_expand_jinja(item)))
+    return _purify("".join(fragments))
 
-    if token.type == "END":
-        token.value = "}} "
 
-    if token.type == "INVOCATION_COLON":
-        token.value = "_"
+def translate(expression: str) -> str:
+    """
+    Translate Expression Language sentence to Jinja.
 
-    if token.type == "NULL":
-        token.value = None
+    During translation the following transformations are applied:
+    - ${, #{   ->  {{
+    - name:function   ->  name_function
+    - CamelCase -> camel_case
 
-    if token.type == "BOOL":
-        if token.value == "true":
-            token.value = True
-        else:
-            token.value = False
+    :param expression: the expression to be translated
+    :type expression: str
+    :return: translated expression
+    :rtype: str
+    """
+    return _translate_jinja(_parser(expression))
+
+
+# EL functions supported in Python expressions and the Python functions implementing them
+PYTHON_FUNCTIONS = {
+    "firstNotNull": "el_basic_functions.first_not_null",
+    "concat": "el_basic_functions.concat",
+    "replaceAll": "el_basic_functions.replace_all",
+    "appendAll": "el_basic_functions.append_all",
+    "trim": "el_basic_functions.trim",
+    "urlEncode": "el_basic_functions.url_encode",
+    "timestamp": "el_basic_functions.timestamp",
+    "toJsonStr": "el_basic_functions.to_json_str",
+}
+
+# EL functions reading the properties of the workflow, formatted with the properties variable and arguments
+PYTHON_PROPERTY_FUNCTIONS = {
+    "wf:conf": "{properties}.get({arguments}, '')",
+    "wf:user": "{properties}['user.name']",
+}
+
+PYTHON_BINARY_OPERATORS = {
+    "and": "and",
+    "&&": "and",
+    "or": "or",
+    "||": "or",
+    "+": "el_operators.add",
+    "-": "el_operators.sub",
+    "*": "el_operators.mul",
+    "/": "el_operators.div",
+    "div": "el_operators.div",
+    "%": "el_operators.mod",
+    "mod": "el_operators.mod",
+    ">": "el_operators.gt",
+    "gt": "el_operators.gt",
+    "<": "el_operators.lt",
+    "lt": "el_operators.lt",
+    ">=": "el_operators.ge",
+    "ge": "el_operators.ge",
+    "<=": "el_operators.le",
+    "le": "el_operators.le",
+    "==": "el_operators.eq",
+    "eq": "el_operators.eq",
+    "!=": "el_operators.ne",
+    "ne": "el_operators.ne",
+}
+
+# Precedence of the binary operators, the grammar does not encode it
+PYTHON_BINARY_PRECEDENCE = {
+    "or": 1,
+    "and": 2,
+    "el_operators.eq": 3,
+    "el_operators.ne": 3,
+    "el_operators.gt": 4,
+    "el_operators.lt": 4,
+    "el_operators.ge": 4,
+    "el_operators.le": 4,
+    "el_operators.add": 5,
+    "el_operators.sub": 5,
+    "el_operators.mul": 6,
+    "el_operators.div": 6,
+    "el_operators.mod": 6,
+}
+
+PYTHON_UNARY_OPERATORS = {
+    "-": "el_operators.neg",
+    "!": "el_operators.not_",
+    "not": "el_operators.not_",
+    "empty": "el_operators.empty",
+}
+
+
+def _get_children(tree: Tree, data: str) -> List[Tree]:
+    return [child for child in tree.children if isinstance(child, Tree) and child.data == data]
+
+
+def _get_identifier(tree: Tree) -> str:
+    return str(tree.children[0])
+
+
+def _flatten_expression(tree: Tree) -> List[Union[Tree, str]]:
+    """
+    Flattens the chain of binary operations into the list of operands, operators and ternary operators.
+    """
+    expression1 = tree.children[0]
+    if len(expression1.children) == 3:
+        left, operator, right = expression1.children
+        items = _flatten_expression(left) + [str(operator.children[0])] + _flatten_expression(right)
+    else:
+        items = [expression1.children[0]]
+    items.extend(_get_children(tree, "ternary"))
+    return items
 
-    if token.type == "JAVA":
-        token.value = _camel_to_snake(token.value)
 
-    return str(token.value)
+def _python_binary_operation(operator: str, first: str, second: str) -> str:
+    if operator in ("and", "or"):
+        return f"(el_operators.to_boolean({first}) {operator} el_operators.to_boolean({second}))"
+    return f"{operator}({first}, {second})"
 
 
-def _translate_el(tree: Union[Tree, Token]) -> str:
+def _translate_python_ternary(
+    condition_items: List[Union[Tree, str]], ternary: Tree, rest: List[Union[Tree, str]], properties: str
+) -> str:
     """
-    Translates el expression to jinjia equivalent.
+    Translates the ternary operator. It has the lowest precedence, so its condition is made of the items
+    before it and its false branch takes the rest of the items.
     """
+    _, if_true, _, if_false = ternary.children
+    condition = _translate_python_items(condition_items, properties)
+    true_value = _translate_python(if_true, properties)
+    false_value = _translate_python_items(_flatten_expression(if_false) + rest, properties)
+    return f"({true_value} if el_operators.to_boolean({condition}) else {false_value})"
 
-    if isinstance(tree, Token):
-        return _translate_token(tree)
 
-    if tree.data == "binary_op":
-        return _translate_binary_operator(tree)
+def _translate_python_items(items: List[Union[Tree, str]], properties: str) -> str:
+    """
+    Translates the flattened expression, applying the precedence of the binary operators.
+    """
+    for index, item in enumerate(items):
+        if isinstance(item, Tree) and item.data == "ternary":
+            rest = items[index:]
+            rest.pop(0)
+            return _translate_python_ternary(items[:index], item, rest, properties)
+
+    operands = [_translate_python(items[0], properties)]
+    operators: List[str] = []
+
+    def reduce():
+        second = operands.pop()
+        first = operands.pop()
+        operands.append(_python_binary_operation(operators.pop(), first, second))
+
+    for operator_name, operand in zip(items[1::2], items[2::2]):
+        operator = PYTHON_BINARY_OPERATORS[str(operator_name)]
+        while operators and PYTHON_BINARY_PRECEDENCE[operators[-1]] >= PYTHON_BINARY_PRECEDENCE[operator]:
+            reduce()
+        operators.append(operator)
+        operands.append(_translate_python(operand, properties))
+    while operators:
+        reduce()
+    return operands[0]
+
+
+def _translate_python_function(tree: Tree, properties: str) -> str:
+    """
+    Translates the invocation of the EL function to the call of the Python function implementing it.
+    """
+    name = ":".join(_get_identifier(identifier) for identifier in _get_children(tree, "identifier"))
+    arguments = ", ".join(
+        _translate_python(expression, properties) for expression in _get_children(tree, "expression")
+    )
+    if name in PYTHON_PROPERTY_FUNCTIONS:
+        return PYTHON_PROPERTY_FUNCTIONS[name].format(properties=properties, arguments=arguments)
+    if name in PYTHON_FUNCTIONS:
+        return f"{PYTHON_FUNCTIONS[name]}({arguments})"
+    raise ValueError(f"The EL function {name} is not supported in Python expressions")
+
+
+def _translate_python_value(tree: Tree, properties: str) -> str:
+    """
+    Translates the value with its property accesses, e.g. ${wf:conf('key')['field']}.
+    """
+    prefix, *suffixes = tree.children
+    if prefix.data == "value_prefix":
+        prefix = prefix.children[0]
+    if prefix.data == "non_literal_lvalue_prefix":
+        prefix = prefix.children[0] if len(prefix.children) == 1 else prefix
+
+    if prefix.data == "identifier":
+        # Dots separate the parts of the property name, e.g. ${mapreduce.job.queuename}
+        name_parts = [_get_identifier(prefix)]
+        while suffixes and str(suffixes[0].children[0]) == ".":
+            name_parts.append(_get_identifier(suffixes[0].children[1]))
+            suffixes = suffixes[1:]
+        name = ".".join(name_parts)
+        value = str(EL_CONSTANTS[name]) if name in EL_CONSTANTS else f"{properties}[{name!r}]"
+    else:
+        value = _translate_python(prefix, properties)
+
+    for suffix in suffixes:
+        if str(suffix.children[0]) == ".":
+            value += f"[{_get_identifier(suffix.children[1])!r}]"
+        else:
+            value += f"[{_translate_python(suffix.children[1], properties)}]"
+    return value
 
-    ternary = _translate_ternary(tree)
-    if ternary is not None:
-        return ternary
 
-    output = "".join([_translate_el(ch) for ch in tree.children])
-    return output
+def _translate_python_token(token: Token) -> str:
+    """
+    Translates the literal of the EL expression to the Python literal.
+    """
+    if token.type == "STRING":
+        return repr(token.value[1:-1])
+    if token.type == "BOOL":
+        return "True" if token.value == "true" else "False"
+    if token.type == "NULL":
+        return "None"
+    return str(token.value)
+
 
+def _translate_python(tree: Union[Tree, Token], properties: str) -> str:
+    """
+    Translates the subtree of the EL expression to the Python expression.
+    """
+    if isinstance(tree, Token):
+        return _translate_python_token(tree)
+    if tree.data not in _PYTHON_TRANSLATORS:
+        raise ValueError(f"Unexpected element of the EL expression: {tree.data}")
+    return _PYTHON_TRANSLATORS[tree.data](tree, properties)
 
-def _purify(sentence: str) -> str:
-    sentence = sentence.strip()
-    sentence = re.sub("[ ]+", " ", sentence)
-    sentence = sentence.replace("}} / {{", "}}/{{")
-    sentence = sentence.replace("}} /", "}}/")
-    sentence = sentence.replace("/ {{", "/{{")
 
-    return sentence
+def _translate_python_unary(tree: Tree, properties: str) -> str:
+    """
+    Translates the expression with an optional unary operator.
+    """
+    if len(tree.children) == 1:
+        return _translate_python(tree.children[0], properties)
+    operator, operand = tree.children
+    return f"{PYTHON_UNARY_OPERATORS[str(operator.children[0])]}({_translate_python(operand, properties)})"
+
+
+# Functions translating the subtrees of the EL expression to Python, by the rule of the subtree
+_PYTHON_TRANSLATORS: Dict[str, Callable[[Tree, str], str]] = {
+    "expression": lambda tree, properties: _translate_python_items(_flatten_expression(tree), properties),
+    "unary_expression": _translate_python_unary,
+    "value": _translate_python_value,
+    "lvalue_inner": _translate_python_value,
+    # Parenthesized expression
+    "non_literal_lvalue_prefix": lambda tree, properties: _translate_python(tree.children[1], properties),
+    "function_invocation": _translate_python_function,
+    "literal": lambda tree, properties: _translate_python(tree.children[0], properties),
+}
+
+
+def _get_template_parts(tree: Tree) -> List[Union[Tree, str]]:
+    """
+    Returns the literal texts and the EL expressions of the template in order.
+    """
+    parts: List[Union[Tree, str]] = []
+    for child in tree.children:
+        if child.data == "start":
+            parts.extend(_get_template_parts(child))
+        elif child.data == "lvalue":
+            parts.append(child.children[1])
+        elif child.data == "rvalue":
+            parts.extend(_get_children(child, "expression"))
+        else:
+            parts.append("".join(str(token) for token in child.scan_values(lambda value: True)))
+    return parts
 
 
-def translate(expression: str) -> str:
+def translate_to_python(expression: str, properties: str = "props") -> str:
     """
-    Translate Expression Language sentence to Jinja.
+    Translate a single Expression Language expression to a Python expression.
 
-    During translation the following transformations are applied:
-    - ${, #{   ->  {{
-    - name:function   ->  name_function
-    - CamelCase -> camel_case
+    The Python expression uses the functions of the el_basic_functions and el_operators modules, and reads
+    the EL variables from the dictionary of the properties, for example:
+    - ${size gt 10 * MB}   ->  el_operators.gt(props['size'], el_operators.mul(10, 1048576))
+    - ${firstNotNull(a, b)}   ->  el_basic_functions.first_not_null(props['a'], props['b'])
 
-    :param expression: the expression to be translated
+    :param expression: the expression to be translated, e.g. ${a eq b}
     :type expression: str
+    :param properties: name of the variable holding the dictionary of the properties
+    :type properties: str
     :return: translated expression
     :rtype: str
+    :raises ValueError: if the expression is not a single EL expression or uses unsupported functions
     """
-    ast_tree = _parser(expression)
-    translation = _translate_el(ast_tree)
-
-    return _purify(translation)
+    parts = [
+        part for part in _get_template_parts(_parser(expression.strip())) if not isinstance(part, str) or part
+    ]
+    if len(parts) != 1 or isinstance(parts[0], str):
+        raise ValueError(f"Expected a single EL expression, got: {expression}")
+    return _translate_python(parts[0], properties)
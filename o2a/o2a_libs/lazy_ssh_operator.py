@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""SSH operator creating its hook when it is executed"""
+from airflow.contrib.hooks.ssh_hook import SSHHook
+from airflow.contrib.operators.ssh_operator import SSHOperator
+from airflow.utils.decorators import apply_defaults
+
+
+class LazySSHOperator(SSHOperator):
+    """
+    SSH operator creating its hook when it is executed instead of when the DAG is parsed.
+
+    Every task runs in its own process, so the hook - and the SSH session - is not shared with other tasks.
+    Consecutive commands can be run in one session by merging their tasks with the batch SSH transformer.
+
+    :param username: user connecting to the remote host
+    """
+
+    @apply_defaults
+    def __init__(self, username: str, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.username = username
+        # The hook is created in execute
+        self.ssh_hook = None
+
+    def execute(self, context):
+        self.ssh_hook = SSHHook(
+            ssh_conn_id=self.ssh_conn_id,
+            username=self.username,
+            remote_host=self.remote_host,
+            timeout=self.timeout,
+        )
+        return super().execute(context)
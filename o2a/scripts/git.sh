@@ -53,6 +53,16 @@ Flags:
 
 -r, --region <REGION>
         GCP Region where the cluster is located.
+
+--depth <DEPTH>
+        Creates a shallow clone with the history truncated to the specified number of commits.
+
+--sparse-path <PATH>
+        Checks out only the specified path of the repository. Can be used multiple times.
+
+--mirror-cache <PATH>
+        Directory on the cluster keeping the mirrors of the repositories. The mirror of the repository
+        is fetched incrementally and the repository is cloned from it.
 """
 }
 
@@ -107,6 +117,53 @@ function submit_pig {
     fi
 }
 
+#######################################
+# Prints the command cloning the repository
+# Globals:
+#   GIT_URI
+#   GIT_BRANCH_NAME
+#   GIT_DEPTH
+#   SPARSE_PATHS
+#   MIRROR_CACHE_PATH
+#   TMP_CHECKOUT_LOCAL_PATH
+# Arguments:
+#   None
+# Returns:
+#   None
+#######################################
+function git_clone_command {
+    local source_uri
+    local command=""
+    local clone_options="--branch $(bash_escape "${GIT_BRANCH_NAME}") --single-branch"
+    if [[ -n "${GIT_DEPTH}" ]]; then
+        clone_options+=" --depth $(bash_escape "${GIT_DEPTH}")"
+    fi
+    if [[ ${#SPARSE_PATHS[@]} -gt 0 ]]; then
+        clone_options+=" --filter=blob:none --no-checkout"
+    fi
+    source_uri="$(bash_escape "${GIT_URI}")"
+    if [[ -n "${MIRROR_CACHE_PATH}" ]]; then
+        # The mirror is locked, so the tasks using the same repository do not update it at the same time
+        local mirror_path
+        mirror_path="$(bash_escape "${MIRROR_CACHE_PATH}/$(echo -n "${GIT_URI}" | md5sum | head -c 32).git")"
+        command+="mkdir -p $(bash_escape "${MIRROR_CACHE_PATH}") && "
+        command+="(flock 9 && if [[ -d ${mirror_path} ]]; "
+        command+="then git -C ${mirror_path} fetch --prune origin; "
+        command+="else git clone --mirror ${source_uri} ${mirror_path}; fi) 9>${mirror_path}.lock && "
+        source_uri="file://${mirror_path}"
+    fi
+    command+="git clone ${clone_options} ${source_uri} ${TMP_CHECKOUT_LOCAL_PATH}"
+    if [[ ${#SPARSE_PATHS[@]} -gt 0 ]]; then
+        local sparse_path
+        command+=" && git -C ${TMP_CHECKOUT_LOCAL_PATH} sparse-checkout set --no-cone"
+        for sparse_path in "${SPARSE_PATHS[@]}"; do
+            command+=" $(bash_escape "${sparse_path}")"
+        done
+        command+=" && git -C ${TMP_CHECKOUT_LOCAL_PATH} checkout $(bash_escape "${GIT_BRANCH_NAME}")"
+    fi
+    echo "${command}"
+}
+
 #######################################
 # Clone repository
 # Globals:
@@ -121,7 +178,7 @@ function submit_pig {
 #######################################
 function clone_repository {
     local git_command
-    git_command="git clone $(bash_escape "${GIT_URI}") --branch $(bash_escape "${GIT_BRANCH_NAME}") --single-branch ${TMP_CHECKOUT_LOCAL_PATH}"
+    git_command="$(git_clone_command)"
     if [[ -z "${KEY_HDFS_PATH}" ]]; then
         echo "Cloning repository to local directory"
         submit_pig "sh bash -c \'$(pig_escape "${git_command}")\'"
@@ -175,9 +232,12 @@ function main() {
     DESTINATION_HDFS_PATH=""
     DATAPROC_CLUSTER_NAME=""
     GCP_REGION=""
+    GIT_DEPTH=""
+    SPARSE_PATHS=()
+    MIRROR_CACHE_PATH=""
 
     local _SHORT_OPTIONS="h: g: b: k: d: c: r:"
-    local _LONG_OPTIONS="help git-uri: branch: key-path: destination-path: cluster: region:"
+    local _LONG_OPTIONS="help git-uri: branch: key-path: destination-path: cluster: region: depth: sparse-path: mirror-cache:"
 
     local PARAMS
     PARAMS=$(getopt \
@@ -218,6 +278,15 @@ function main() {
         -r|--region)
           export GCP_REGION="${2}";
           shift 2 ;;
+        --depth)
+          export GIT_DEPTH="${2}";
+          shift 2 ;;
+        --sparse-path)
+          SPARSE_PATHS+=("${2}");
+          shift 2 ;;
+        --mirror-cache)
+          export MIRROR_CACHE_PATH="${2}";
+          shift 2 ;;
         --)
           shift ;
           break ;;
@@ -0,0 +1,508 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Conversion server
+
+Keeps the converter - the mappers, the compiled templates and the formatters - loaded and serves
+conversion requests over HTTP on a TCP port or a Unix socket. The conversions run in a pool of ``workers``
+processes forked when the server starts, so they start with the converter already loaded.
+
+Endpoints:
+
+- ``POST /convert`` - converts a workflow. The body is a JSON object with the long names of
+  the ``o2a`` options, for example ``{"input_directory_path": "examples/demo",
+  "output_directory_path": "output/demo", "dot": true}``, and an optional ``timeout`` in seconds.
+  The output directory must be inside the output root of the server,
+- ``GET /metrics`` - counters and timings of the served requests,
+- ``GET /health`` - liveness check.
+
+The worker process of a conversion that exceeds the timeout is killed and replaced with a new one.
+
+The worker processes are forked, also on the platforms where it is not the default start method,
+as the processes started otherwise would not inherit the loaded converter. A fork copies only the thread
+that forks, so the replacement workers, which are forked while the server threads handle other requests,
+could inherit a lock held by another thread, for example of the logging, and hang on it. Such a worker
+does not finish its conversions in time and is replaced again.
+"""
+import argparse
+import contextlib
+import http.client
+import io
+import json
+import logging
+import math
+import multiprocessing
+import os
+import queue
+import socket
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+from o2a import cli
+from o2a.converter.exceptions import O2AException
+from o2a.utils.template_utils import preload_templates
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8642
+DEFAULT_TIMEOUT = 300.0
+
+_FORK_CONTEXT = multiprocessing.get_context("fork")
+
+
+class BadRequestException(O2AException):
+    """Raised when the conversion request is invalid."""
+
+
+class ConversionTimeoutException(O2AException):
+    """Raised when the conversion does not finish in time."""
+
+
+class ServerException(O2AException):
+    """Raised by the client when the server responds with an error."""
+
+    def __init__(self, message: str, status: int):
+        super().__init__(message)
+        self.status = status
+
+
+def options_to_args(options: Dict[str, Any]) -> List[str]:
+    """
+    Translates the options of the conversion request to the command line arguments of o2a.
+    """
+    args: List[str] = []
+    for name, value in options.items():
+        flag = "--" + name.replace("_", "-")
+        if value is True:
+            args.append(flag)
+        elif value is not False and value is not None:
+            args.extend([flag, str(value)])
+    return args
+
+
+def run_conversion(options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Converts a single workflow. It is run in the worker processes.
+    """
+    stderr = io.StringIO()
+    try:
+        # The errors are returned in the response and the help is not printed to the output of the server
+        with contextlib.redirect_stderr(stderr), contextlib.redirect_stdout(io.StringIO()):
+            args = cli.parse_args(options_to_args(options))
+    except SystemExit as ex:
+        lines = stderr.getvalue().strip().splitlines()
+        raise BadRequestException(lines[-1] if lines else "Invalid conversion options") from ex
+    if args.watch:
+        raise BadRequestException("The watch mode is not supported by the server")
+
+    start = time.monotonic()
+    try:
+        cli.convert(args)
+    except SystemExit as ex:
+        raise O2AException(f"The conversion exited with code {ex.code}") from ex
+    return {
+        "dag_name": args.dag_name or os.path.basename(args.input_directory_path),
+        "output_directory_path": args.output_directory_path,
+        "duration": time.monotonic() - start,
+    }
+
+
+def _serve_conversions(connection) -> None:
+    """
+    Runs the conversions received over the connection. It is run in the worker processes.
+    """
+    while True:
+        try:
+            options = connection.recv()
+        except EOFError:
+            return
+        try:
+            result: Tuple[str, Any] = ("ok", run_conversion(options))
+        except Exception as ex:  # pylint: disable=broad-except
+            result = ("error", ex)
+        try:
+            connection.send(result)
+        except Exception as ex:  # pylint: disable=broad-except
+            # The exception could not be pickled
+            connection.send(("error", O2AException(f"{type(ex).__name__}: {ex}")))
+
+
+class _Worker:  # pylint: disable=too-few-public-methods
+    """Worker process running the conversions one by one"""
+
+    def __init__(self):
+        self.connection, worker_connection = _FORK_CONTEXT.Pipe()
+        self.process = _FORK_CONTEXT.Process(
+            target=_serve_conversions, args=(worker_connection,), daemon=True
+        )
+        self.process.start()
+        worker_connection.close()
+
+    def stop(self) -> None:
+        self.connection.close()
+        self.process.kill()
+        self.process.join()
+
+
+class ConversionService:
+    """
+    Runs the conversions in the worker processes forked from the server and collects the metrics.
+
+    :param workers: number of the worker processes [defaults to the number of CPUs]
+    :param timeout: default timeout of a single conversion in seconds
+    :param output_root: directory which the output directories must be inside of
+        [defaults to the current directory]
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        output_root: Optional[str] = None,
+    ):
+        # The templates are compiled before the worker processes are forked, so they inherit them
+        preload_templates()
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.output_root = os.path.realpath(output_root or os.getcwd())
+        self._idle_workers: "queue.Queue[_Worker]" = queue.Queue()
+        for _ in range(self.workers):
+            self._idle_workers.put(_Worker())
+        self._lock = threading.Lock()
+        self._start_time = time.monotonic()
+        self._metrics: Dict[str, Any] = {
+            "requests_total": 0,
+            "requests_in_progress": 0,
+            "requests_succeeded": 0,
+            "requests_failed": 0,
+            "requests_rejected": 0,
+            "requests_timed_out": 0,
+            "conversion_seconds_total": 0.0,
+            "conversion_seconds_max": 0.0,
+        }
+
+    def convert(self, options: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Converts the workflow described by the options of the request and waits for the result.
+        """
+        options = dict(options)
+        with self._lock:
+            self._metrics["requests_total"] += 1
+            self._metrics["requests_in_progress"] += 1
+        start = time.monotonic()
+        outcome = "requests_failed"
+        try:
+            try:
+                timeout = self._pop_timeout(options)
+                self._confine_output_directory(options)
+                result = self._run(options, timeout)
+            except ConversionTimeoutException:
+                outcome = "requests_timed_out"
+                raise
+            except BadRequestException:
+                outcome = "requests_rejected"
+                raise
+            outcome = "requests_succeeded"
+            return result
+        finally:
+            self._finish_request(outcome, time.monotonic() - start)
+
+    def _pop_timeout(self, options: Dict[str, Any]) -> float:
+        value = options.pop("timeout", self.timeout)
+        try:
+            timeout = float(value)
+        except (TypeError, ValueError) as ex:
+            raise BadRequestException(f"The timeout must be a number of seconds: {value!r}") from ex
+        if not math.isfinite(timeout) or timeout <= 0:
+            raise BadRequestException(f"The timeout must be a positive number of seconds: {value!r}")
+        return timeout
+
+    def _confine_output_directory(self, options: Dict[str, Any]) -> None:
+        """
+        Resolves the output directory against the output root and rejects the ones outside of it,
+        as the output directory is removed before the conversion.
+        """
+        if options.get("output_directory_path") is None:
+            return
+        path = os.path.realpath(os.path.join(self.output_root, str(options["output_directory_path"])))
+        if os.path.commonpath([self.output_root, path]) != self.output_root or path == self.output_root:
+            raise BadRequestException(f"The output directory must be inside {self.output_root}")
+        options["output_directory_path"] = path
+
+    def _run(self, options: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """
+        Runs the conversion in an idle worker and replaces the worker if it does not finish in time.
+        """
+        deadline = time.monotonic() + timeout
+        timeout_message = f"The conversion did not finish in {timeout} seconds"
+        try:
+            worker = self._idle_workers.get(timeout=timeout)
+        except queue.Empty as ex:
+            raise ConversionTimeoutException(timeout_message) from ex
+        finished = False
+        try:
+            worker.connection.send(options)
+            if not worker.connection.poll(max(deadline - time.monotonic(), 0)):
+                raise ConversionTimeoutException(timeout_message)
+            try:
+                status, result = worker.connection.recv()
+            except EOFError as ex:
+                worker.process.join()
+                raise O2AException(
+                    f"The conversion process exited with code {worker.process.exitcode}"
+                ) from ex
+            finished = True
+        finally:
+            if not finished:
+                worker.stop()
+                worker = _Worker()
+            self._idle_workers.put(worker)
+        if status == "error":
+            raise result
+        return cast(Dict[str, Any], result)
+
+    def _finish_request(self, outcome: str, duration: float) -> None:
+        with self._lock:
+            self._metrics["requests_in_progress"] -= 1
+            self._metrics[outcome] += 1
+            self._metrics["conversion_seconds_total"] += duration
+            self._metrics["conversion_seconds_max"] = max(self._metrics["conversion_seconds_max"], duration)
+
+    def close(self) -> None:
+        """
+        Stops the idle worker processes.
+        """
+        while True:
+            try:
+                self._idle_workers.get_nowait().stop()
+            except queue.Empty:
+                return
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Returns the snapshot of the metrics.
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+        metrics["workers"] = self.workers
+        metrics["uptime_seconds"] = time.monotonic() - self._start_time
+        return metrics
+
+
+class ConversionRequestHandler(BaseHTTPRequestHandler):
+    """Handles the HTTP requests of the conversion server"""
+
+    server_version = "o2a"
+
+    # pylint: disable=invalid-name
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok"})
+        elif self.path == "/metrics":
+            self._send_json(200, self.server.service.metrics())
+        else:
+            self._send_json(404, {"status": "error", "error": f"Not found: {self.path}"})
+
+    # pylint: disable=invalid-name
+    def do_POST(self):
+        if self.path != "/convert":
+            self._send_json(404, {"status": "error", "error": f"Not found: {self.path}"})
+            return
+        try:
+            options = self._read_options()
+            result = self.server.service.convert(options)
+        except BadRequestException as ex:
+            self._send_json(400, {"status": "error", "error": str(ex)})
+        except ConversionTimeoutException as ex:
+            self._send_json(504, {"status": "error", "error": str(ex)})
+        except Exception as ex:  # pylint: disable=broad-except
+            logging.exception("The conversion failed")
+            self._send_json(500, {"status": "error", "error": f"{type(ex).__name__}: {ex}"})
+        else:
+            self._send_json(200, {"status": "ok", **result})
+
+    def _read_options(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            options = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError as ex:
+            raise BadRequestException(f"The request is not a valid JSON: {ex}") from ex
+        if not isinstance(options, dict):
+            raise BadRequestException("The request must be a JSON object")
+        return options
+
+    def _send_json(self, status: int, content: Dict[str, Any]) -> None:
+        body = json.dumps(content).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    # pylint: disable=redefined-builtin
+    def log_message(self, format, *args):
+        # The client address is not available for Unix sockets
+        logging.info(format, *args)
+
+
+class ConversionHTTPServer(socketserver.ThreadingMixIn, HTTPServer):
+    """Conversion server listening on a TCP port"""
+
+    daemon_threads = True
+
+    def __init__(self, server_address: Tuple[str, int], service: ConversionService):
+        super().__init__(server_address, ConversionRequestHandler)
+        self.service = service
+
+
+class UnixConversionHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Conversion server listening on a Unix socket"""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, service: ConversionService):
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        super().__init__(socket_path, ConversionRequestHandler)
+        self.service = service
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
+
+
+def create_server(
+    service: ConversionService,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    socket_path: Optional[str] = None,
+) -> socketserver.BaseServer:
+    """
+    Creates the server listening on the Unix socket, if its path is given, or on the TCP port otherwise.
+    """
+    if socket_path:
+        return UnixConversionHTTPServer(socket_path, service)
+    return ConversionHTTPServer((host, port), service)
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str, timeout: Optional[float] = None):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class ConversionClient:
+    """
+    Client of the conversion server.
+
+    :param host: host of the server
+    :param port: port of the server
+    :param socket_path: path of the Unix socket of the server. If given, the host and port are not used.
+    :param timeout: timeout of the connection in seconds
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        socket_path: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.socket_path = socket_path
+        self.timeout = timeout
+
+    def convert(self, **options: Any) -> Dict[str, Any]:
+        """
+        Converts the workflow. The options are the long names of the o2a options.
+        """
+        return self._request("POST", "/convert", options)
+
+    def metrics(self) -> Dict[str, Any]:
+        return self._request("GET", "/metrics")
+
+    def health(self) -> Dict[str, Any]:
+        return self._request("GET", "/health")
+
+    def _request(self, method: str, path: str, content: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        if self.socket_path:
+            connection: http.client.HTTPConnection = _UnixHTTPConnection(
+                self.socket_path, timeout=self.timeout
+            )
+        else:
+            connection = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        try:
+            body = json.dumps(content).encode() if content is not None else None
+            connection.request(method, path, body=body, headers={"Content-Type": "application/json"})
+            response = connection.getresponse()
+            result: Dict[str, Any] = json.loads(response.read())
+        finally:
+            connection.close()
+        if response.status != 200:
+            raise ServerException(result.get("error", response.reason), status=response.status)
+        return result
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(
+        prog="o2a serve", description="Serve conversions of Apache Oozie workflows over HTTP."
+    )
+    parser.add_argument("-H", "--host", help="Host to listen on", default=DEFAULT_HOST)
+    parser.add_argument("-p", "--port", help="Port to listen on", type=int, default=DEFAULT_PORT)
+    parser.add_argument("-S", "--socket", help="Unix socket to listen on instead of the TCP port")
+    parser.add_argument(
+        "-w",
+        "--workers",
+        help="Number of the worker processes running the conversions [defaults to the number of CPUs]",
+        type=int,
+    )
+    parser.add_argument(
+        "-o",
+        "--output-root",
+        help="Directory which the output directories of the conversions must be inside of "
+        "[defaults to the current directory]",
+    )
+    parser.add_argument(
+        "-t",
+        "--timeout",
+        help="Default timeout of a single conversion in seconds",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+    )
+    return parser.parse_args(args)
+
+
+# pylint: disable=missing-docstring
+def main(argv: List[str]):
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    service = ConversionService(workers=args.workers, timeout=args.timeout, output_root=args.output_root)
+    server = create_server(service, host=args.host, port=args.port, socket_path=args.socket)
+    logging.info(f"Serving conversions on {args.socket or f'{args.host}:{args.port}'}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
@@ -0,0 +1,398 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Surveys the Oozie workflow applications before the migration
+
+The workflows are only parsed - no mappers are created and nothing is rendered - so thousands of
+applications can be scanned quickly in a pool of worker processes. The report contains the action types,
+EL functions, fork depth, property count, unsupported features and the estimated conversion cost
+of every application and the totals of all of them.
+"""
+import argparse
+import csv
+import inspect
+import json
+import os
+import re
+import sys
+
+# noinspection PyPep8Naming
+import xml.etree.ElementTree as ET
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from o2a.converter.constants import HDFS_FOLDER
+from o2a.converter.mappers import ACTION_MAP
+from o2a.converter.parser import get_node_kind
+from o2a.o2a_libs import el_basic_functions, el_wf_functions
+from o2a.o2a_libs.el_parser import PYTHON_FUNCTIONS, PYTHON_PROPERTY_FUNCTIONS, _camel_to_snake
+from o2a.utils.constants import CONFIG, JOB_PROPS, WORKFLOW_XML
+from o2a.utils.el_utils import EL_FUNCTIONS, WF_EL_FUNCTIONS
+
+# Functions of the libraries called by the EL expressions translated to Jinja, e.g. wf_conf for wf:conf
+EL_LIBRARY_FUNCTIONS = {
+    name
+    for module in (el_basic_functions, el_wf_functions)
+    for name, function in inspect.getmembers(module, inspect.isfunction)
+    if function.__module__ == module.__name__
+}
+
+# EL functions known to the converter
+SUPPORTED_EL_FUNCTIONS = (
+    set(EL_FUNCTIONS) | set(WF_EL_FUNCTIONS) | set(PYTHON_FUNCTIONS) | set(PYTHON_PROPERTY_FUNCTIONS)
+)
+
+# Estimated effort of converting the parts of an application, in points
+CONVERSION_COST = {
+    "node": 1,
+    "decision": 2,
+    "fork_level": 2,
+    "unsupported_action": 8,
+    "unsupported_el_function": 3,
+    "unsupported_element": 5,
+}
+
+EL_EXPRESSION = re.compile(r"[$#]{([^}]*)}")
+EL_STRING = re.compile(r"'[^']*'|\"[^\"]*\"")
+EL_FUNCTION = re.compile(r"((?:[A-Za-z_]\w*:)?[A-Za-z_]\w*)\s*\(")
+
+
+class AppReport(NamedTuple):
+    """
+    Result of surveying a single workflow application.
+
+    :param path: path of the application directory
+    :param node_kinds: number of the workflow nodes by kind
+    :param action_types: number of the actions by type
+    :param el_functions: number of the calls of the EL functions by name
+    :param max_fork_depth: the deepest nesting of forks
+    :param property_count: number of the properties in the property files and in the workflow
+    :param unsupported: number of the unsupported actions, EL functions and elements by name
+    :param cost: estimated conversion cost in points
+    :param error: error which stopped the survey of the application
+    """
+
+    path: str
+    node_kinds: Dict[str, int]
+    action_types: Dict[str, int]
+    el_functions: Dict[str, int]
+    max_fork_depth: int
+    property_count: int
+    unsupported: Dict[str, int]
+    cost: int
+    error: Optional[str] = None
+
+
+def find_apps(paths: Iterable[str]) -> Iterator[str]:
+    """
+    Yields the application directories given directly or found in the given directories.
+    """
+    for path in paths:
+        for root, directories, _ in os.walk(path):
+            directories.sort()
+            if os.path.isfile(os.path.join(root, HDFS_FOLDER, WORKFLOW_XML)):
+                yield os.path.abspath(root)
+
+
+def survey_app(path: str) -> AppReport:
+    """
+    Parses the application and collects its statistics. It is run in the worker processes.
+    """
+    try:
+        return _survey_app(path)
+    except (ET.ParseError, OSError, UnicodeDecodeError, ValueError) as error:
+        return AppReport(
+            path=path,
+            node_kinds={},
+            action_types={},
+            el_functions={},
+            max_fork_depth=0,
+            property_count=0,
+            unsupported={},
+            cost=0,
+            error=str(error),
+        )
+
+
+def _strip_namespace(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _survey_app(path: str) -> AppReport:
+    """
+    Streams the workflow of the application and collects the statistics of its nodes.
+    """
+    node_kinds: Counter = Counter()
+    action_types: Counter = Counter()
+    el_functions: Counter = Counter()
+    unsupported: Counter = Counter()
+    transitions: Dict[str, Tuple[str, List[str]]] = {}
+    start_targets: List[str] = []
+    property_count = sum(_count_properties(os.path.join(path, name)) for name in (JOB_PROPS, CONFIG))
+
+    for depth, element in _iterparse_workflow(os.path.join(path, HDFS_FOLDER, WORKFLOW_XML)):
+        if element.tag == "property":
+            property_count += 1
+        for value in [element.text or "", *element.attrib.values()]:
+            _count_el_functions(value, el_functions)
+        if depth != 1:
+            continue
+        kind = _classify_node(element, node_kinds, action_types, unsupported)
+        if kind is None:
+            continue
+        targets = _get_targets(kind, element)
+        if kind == "start":
+            start_targets.extend(targets)
+        else:
+            transitions[element.attrib.get("name", "")] = (kind, targets)
+
+    _count_unsupported_el_functions(el_functions, unsupported)
+    max_fork_depth = _get_max_fork_depth(start_targets, transitions)
+    return AppReport(
+        path=path,
+        node_kinds=dict(node_kinds),
+        action_types=dict(action_types),
+        el_functions=dict(el_functions),
+        max_fork_depth=max_fork_depth,
+        property_count=property_count,
+        unsupported=dict(unsupported),
+        cost=_estimate_cost(node_kinds, max_fork_depth, unsupported),
+        error=None,
+    )
+
+
+def _iterparse_workflow(workflow_file: str) -> Iterator[Tuple[int, ET.Element]]:
+    """
+    Yields the elements of the workflow without the namespaces, each one with its depth, once the element
+    is parsed. The workflow nodes have the depth of 1 and they are cleared once they are surveyed.
+    """
+    depth = 0
+    for event, element in ET.iterparse(workflow_file, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            continue
+        depth -= 1
+        element.tag = _strip_namespace(element.tag)
+        yield depth, element
+        if depth == 1:
+            element.clear()
+
+
+def _classify_node(
+    node: ET.Element, node_kinds: Counter, action_types: Counter, unsupported: Counter
+) -> Optional[str]:
+    """
+    Counts the workflow node by its kind and action type and returns its kind, or None if the node
+    is not supported.
+    """
+    kind = get_node_kind(node)
+    if kind is None:
+        unsupported[f"element:{node.tag}"] += 1
+        return None
+    node_kinds[kind] += 1
+    if kind == "action" and len(node):
+        action_type = node[0].tag
+        action_types[action_type] += 1
+        if action_type not in ACTION_MAP or action_type == "unknown":
+            unsupported[f"action:{action_type}"] += 1
+    return kind
+
+
+def is_supported_el_function(name: str) -> bool:
+    """
+    Checks if the EL function is known to the converter or implemented by the library functions
+    its Jinja translation calls.
+    """
+    library_function = "_".join(_camel_to_snake(part) for part in name.split(":"))
+    return name in SUPPORTED_EL_FUNCTIONS or library_function in EL_LIBRARY_FUNCTIONS
+
+
+def _count_properties(properties_file: str) -> int:
+    if not os.path.isfile(properties_file):
+        return 0
+    with open(properties_file) as prop_file:
+        return sum(1 for line in prop_file if "=" in line and not line.startswith(("#", " ", "\n")))
+
+
+def _count_el_functions(text: str, el_functions: Counter):
+    if "{" not in text:
+        return
+    for expression in EL_EXPRESSION.findall(text):
+        el_functions.update(EL_FUNCTION.findall(EL_STRING.sub("", expression)))
+
+
+def _count_unsupported_el_functions(el_functions: Counter, unsupported: Counter):
+    for function, count in el_functions.items():
+        if not is_supported_el_function(function):
+            unsupported[f"el:{function}"] += count
+
+
+def _get_targets(kind: str, node: ET.Element) -> List[str]:
+    if kind == "fork":
+        return [path.attrib["start"] for path in node if path.tag == "path"]
+    if kind == "action":
+        return [child.attrib["to"] for child in node if child.tag in ("ok", "error") and "to" in child.attrib]
+    if kind == "decision":
+        return [case.attrib["to"] for switch in node for case in switch if "to" in case.attrib]
+    return [node.attrib["to"]] if "to" in node.attrib else []
+
+
+def _get_max_fork_depth(start_targets: List[str], transitions: Dict[str, Tuple[str, List[str]]]) -> int:
+    """
+    Walks the workflow from the start node and returns the deepest nesting of forks.
+    """
+    max_depth = 0
+    stack = [(target, 0) for target in start_targets]
+    visited: Set[Tuple[str, int]] = set()
+    while stack:
+        name, depth = stack.pop()
+        if (name, depth) in visited or name not in transitions:
+            continue
+        visited.add((name, depth))
+        kind, targets = transitions[name]
+        if kind == "fork":
+            depth += 1
+            max_depth = max(max_depth, depth)
+        elif kind == "join":
+            depth = max(depth - 1, 0)
+        stack.extend((target, depth) for target in targets)
+    return max_depth
+
+
+def _estimate_cost(node_kinds: Counter, max_fork_depth: int, unsupported: Counter) -> int:
+    cost = CONVERSION_COST["node"] * sum(node_kinds.values())
+    cost += CONVERSION_COST["decision"] * node_kinds["decision"]
+    cost += CONVERSION_COST["fork_level"] * max_fork_depth
+    for feature, count in unsupported.items():
+        feature_type = feature.split(":", 1)[0]
+        if feature_type == "action":
+            cost += CONVERSION_COST["unsupported_action"] * count
+        elif feature_type == "el":
+            cost += CONVERSION_COST["unsupported_el_function"] * count
+        else:
+            cost += CONVERSION_COST["unsupported_element"] * count
+    return cost
+
+
+def survey_apps(
+    paths: Iterable[str], workers: Optional[int] = None, chunk_size: int = 16
+) -> Iterator[AppReport]:
+    """
+    Surveys the applications in a pool of worker processes. The reports are yielded in the order of the paths
+    as soon as they are ready.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(survey_app, paths, chunksize=chunk_size)
+
+
+def summarize(reports: Iterable[AppReport]) -> AppReport:
+    """
+    Returns the totals of the reports.
+
+    The fork depth is the deepest one of all reports and the error counts the failed surveys.
+    """
+    node_kinds: Counter = Counter()
+    action_types: Counter = Counter()
+    el_functions: Counter = Counter()
+    unsupported: Counter = Counter()
+    max_fork_depth = property_count = cost = errors = 0
+    for report in reports:
+        node_kinds.update(report.node_kinds)
+        action_types.update(report.action_types)
+        el_functions.update(report.el_functions)
+        unsupported.update(report.unsupported)
+        max_fork_depth = max(max_fork_depth, report.max_fork_depth)
+        property_count += report.property_count
+        cost += report.cost
+        errors += 1 if report.error else 0
+    return AppReport(
+        path="TOTAL",
+        node_kinds=dict(node_kinds),
+        action_types=dict(action_types),
+        el_functions=dict(el_functions),
+        max_fork_depth=max_fork_depth,
+        property_count=property_count,
+        unsupported=dict(unsupported),
+        cost=cost,
+        error=f"{errors} errors" if errors else None,
+    )
+
+
+def _format_counts(counts: Dict[str, int]) -> str:
+    return " ".join(f"{name}={count}" for name, count in sorted(counts.items()))
+
+
+def write_csv(reports: Iterable[AppReport], output) -> AppReport:
+    """
+    Writes a row for every report as soon as it is ready and a row with the totals at the end.
+    The counts are written as space-separated ``name=count`` pairs.
+    """
+    writer = csv.writer(output)
+    writer.writerow(AppReport._fields)
+    summary = summarize(_write_csv_rows(writer, reports))
+    _write_csv_row(writer, summary)
+    return summary
+
+
+def _write_csv_rows(writer, reports: Iterable[AppReport]) -> Iterator[AppReport]:
+    for report in reports:
+        _write_csv_row(writer, report)
+        yield report
+
+
+def _write_csv_row(writer, report: AppReport):
+    writer.writerow([_format_counts(value) if isinstance(value, dict) else value for value in report])
+
+
+def write_json(reports: Iterable[AppReport], output) -> AppReport:
+    """
+    Writes the totals and the reports as a JSON object.
+    """
+    app_reports = list(reports)
+    summary = summarize(app_reports)
+    json.dump(
+        {"summary": summary._asdict(), "apps": [report._asdict() for report in app_reports]}, output, indent=2
+    )
+    output.write("\n")
+    return summary
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(
+        prog="o2a-survey",
+        description="Survey the Oozie workflow applications to estimate the cost of the migration.",
+    )
+    parser.add_argument("paths", help="Application directories or directories containing them", nargs="+")
+    parser.add_argument(
+        "-w", "--workers", help="Number of worker processes [defaults to the number of CPUs]", type=int
+    )
+    parser.add_argument("-f", "--format", help="Format of the report", choices=["csv", "json"], default="csv")
+    parser.add_argument("-o", "--output", help="Output file [defaults to the standard output]")
+    return parser.parse_args(args)
+
+
+# pylint: disable=missing-docstring
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    reports = survey_apps(find_apps(args.paths), workers=args.workers)
+    write = write_json if args.format == "json" else write_csv
+
+    if args.output:
+        with open(args.output, "w", newline="") as output:
+            summary = write(reports, output)
+    else:
+        summary = write(reports, sys.stdout)
+
+    return 1 if summary.error else 0
@@ -0,0 +1,24 @@
+{#
+  Copyright 2019 Google LLC
+
+  Licensed under the Apache License, Version 2.0 (the "License");
+  you may not use this file except in compliance with the License.
+  You may obtain a copy of the License at
+
+  http://www.apache.org/licenses/LICENSE-2.0
+
+  Unless required by applicable law or agreed to in writing, software
+  distributed under the License is distributed on an "AS IS" BASIS,
+  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+  See the License for the specific language governing permissions and
+  limitations under the License.
+#}
+{{ task_id | to_var }} = dataproc_jobs_lib.DataProcJobSensor(
+    task_id={{ task_id | to_python }},
+    trigger_rule={{ trigger_rule | to_python }},
+    job_id={{ job_id | to_python }},
+    region={{ config_var }}['gcp_region'],
+    gcp_conn_id={{ config_var }}['gcp_conn_id'],
+    mode='reschedule',
+    poke_interval={{ poke_interval | int }},
+)
@@ -13,7 +13,11 @@
   See the License for the specific language governing permissions and
   limitations under the License.
 #}
+{{ task_id | to_var }}_props = {% include "props.tpl" %}
+
+
 def {{ task_id | to_var }}_decision():
+    props = {{ task_id | to_var }}_props
 {% for key, val in case_dict.items() %}
 {% if loop.first %}
     if {{ key }}:
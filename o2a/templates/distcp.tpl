@@ -17,7 +17,8 @@
 {{ task_id | to_var }} = bash_operator.BashOperator(
     task_id={{ task_id | tojson }},
     trigger_rule={{ trigger_rule | tojson }},
-    bash_command={% include "hadoop_command.tpl" %} % (CONFIG['dataproc_cluster'], CONFIG['gcp_region'],
+    bash_command={% include "hadoop_command.tpl" %} % ({{ config_var }}['dataproc_cluster'], {{ config_var }}['gcp_region'],
         {{ distcp_command | to_python }}),
     params={% include "props.tpl" %},
+    {% if async_submit is defined and async_submit %}xcom_push=True,{% endif %}
 )
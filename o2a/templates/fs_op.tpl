@@ -16,7 +16,8 @@
 {{ task_id | to_var }} = bash_operator.BashOperator(
     task_id={{ task_id | to_python }},
     trigger_rule={{ trigger_rule | to_python }},
-    bash_command={% include "pig_command.tpl" %} % (CONFIG['dataproc_cluster'], CONFIG['gcp_region'],
+    bash_command={% include "pig_command.tpl" %} % ({{ config_var }}['dataproc_cluster'], {{ config_var }}['gcp_region'],
         shlex.quote({{ pig_command | to_python }})),
     params={% include "props.tpl" %},
+    {% if async_submit is defined and async_submit %}xcom_push=True,{% endif %}
 )
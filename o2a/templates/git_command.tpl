@@ -18,11 +18,17 @@
 "--region=%s "
 "--git-uri %s "
 "--destination-path %s "
-{% if git_branch != '' %}"--branch %s " {% endif %}
-{% if key_path != '' %}"--key_path %s " {% endif %}
-% (CONFIG['dataproc_cluster'], CONFIG['gcp_region'],
+{% if git_branch %}"--branch %s " {% endif %}
+{% if key_path %}"--key-path %s " {% endif %}
+{% if depth is defined and depth %}"--depth %s " {% endif %}
+{% if sparse_paths is defined and sparse_paths %}{% for sparse_path in sparse_paths %}"--sparse-path %s " {% endfor %}{% endif %}
+{% if mirror_cache_path is defined and mirror_cache_path %}"--mirror-cache %s " {% endif %}
+% ({{ config_var }}['dataproc_cluster'], {{ config_var }}['gcp_region'],
 shlex.quote({{ git_uri | to_python }}),
 shlex.quote({{ destination_path | to_python }}),
-{% if git_branch != '' %}shlex.quote({{ git_branch | to_python }}),{% endif %}
-{% if key_path != '' %}shlex.quote({{ key_path | to_python }}),{% endif %}
+{% if git_branch %}shlex.quote({{ git_branch | to_python }}),{% endif %}
+{% if key_path %}shlex.quote({{ key_path | to_python }}),{% endif %}
+{% if depth is defined and depth %}{{ depth | int }},{% endif %}
+{% if sparse_paths is defined and sparse_paths %}{% for sparse_path in sparse_paths %}shlex.quote({{ sparse_path | to_python }}),{% endfor %}{% endif %}
+{% if mirror_cache_path is defined and mirror_cache_path %}shlex.quote({{ mirror_cache_path | to_python }}),{% endif %}
 )
@@ -16,4 +16,5 @@
 "gcloud dataproc jobs submit hadoop "
 "--cluster=%s "
 "--region=%s "
+{% if async_submit is defined and async_submit %}"--async --format='value(reference.jobId)' "{% endif %}
 "%s"
@@ -14,15 +14,33 @@
   limitations under the License.
  #}
 
+{% if async_submit is defined and async_submit %}
+{{ task_id | to_var }} = dataproc_jobs_lib.DataProcJobSubmitOperator(
+    task_id={{ task_id | to_python }},
+    trigger_rule={{ trigger_rule | to_python }},
+    job_type="hiveJob",
+    job={
+        {% if script %}"queryFileUri": '{}/{}'.format({{ config_var }}['gcp_uri_prefix'], {{ script | to_python }}),{% endif %}
+        {% if query %}"queryList": {"queries": [{{ query | to_python }}]},{% endif %}
+        {% if variables %}"scriptVariables": {{ variables | to_python }},{% endif %}
+        "properties": {% include "props.tpl" %},
+    },
+    cluster_name={{ config_var }}['dataproc_cluster'],
+    gcp_conn_id={{ config_var }}['gcp_conn_id'],
+    region={{ config_var }}['gcp_region'],
+    params={% include "props.tpl" %},
+)
+{% else %}
 {{ task_id | to_var }} = dataproc_operator.DataProcHiveOperator(
     task_id={{ task_id | to_python }},
     trigger_rule={{ trigger_rule | to_python }},
-    {% if script %}query_uri='{}/{}'.format(CONFIG['gcp_uri_prefix'], {{ script | to_python }}),{% endif %}
+    {% if script %}query_uri='{}/{}'.format({{ config_var }}['gcp_uri_prefix'], {{ script | to_python }}),{% endif %}
     {% if query %}query={{ query | to_python }},{% endif %}
     {% if variables %}variables={{ variables | to_python }},{% endif %}
     dataproc_hive_properties={% include "props.tpl" %}.merged,
-    cluster_name=CONFIG['dataproc_cluster'],
-    gcp_conn_id=CONFIG['gcp_conn_id'],
-    region=CONFIG['gcp_region'],
+    cluster_name={{ config_var }}['dataproc_cluster'],
+    gcp_conn_id={{ config_var }}['gcp_conn_id'],
+    region={{ config_var }}['gcp_region'],
     job_name={{ task_id | to_python }},
 )
+{% endif %}
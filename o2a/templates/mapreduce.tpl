@@ -13,10 +13,32 @@
   See the License for the specific language governing permissions and
   limitations under the License.
 #}
+{% if async_submit is defined and async_submit %}
+{{ task_id | to_var }} = dataproc_jobs_lib.DataProcJobSubmitOperator(
+    task_id={{ task_id | to_python }},
+    trigger_rule={{ trigger_rule | to_python }},
+    job_type="hadoopJob",
+    job={
+        "mainClass": {{ config_var }}['hadoop_main_class'],
+        "args": [
+            "{{ '{{' }} params['mapreduce.input.fileinputformat.inputdir'] {{ '}}' }}",
+            "{{ '{{' }} params['mapreduce.output.fileoutputformat.outputdir'] {{ '}}' }}"
+        ],
+        {% if hdfs_files %}"fileUris": {{ hdfs_files | to_python }},{% endif %}
+        {% if hdfs_archives %}"archiveUris": {{ hdfs_archives | to_python }},{% endif %}
+        "properties": {% include "props.tpl" %},
+        "jarFileUris": {{ config_var }}['hadoop_jars'].split(','),
+    },
+    cluster_name={{ config_var }}['dataproc_cluster'],
+    gcp_conn_id={{ config_var }}['gcp_conn_id'],
+    region={{ config_var }}['gcp_region'],
+    params={% include "props.tpl" %},
+)
+{% else %}
 {{ task_id | to_var }} = dataproc_operator.DataProcHadoopOperator(
     task_id={{ task_id | to_python }},
     trigger_rule={{ trigger_rule | to_python }},
-    main_class=CONFIG['hadoop_main_class'],
+    main_class={{ config_var }}['hadoop_main_class'],
     arguments=[
         "{{ '{{' }} params['mapreduce.input.fileinputformat.inputdir'] {{ '}}' }}",
         "{{ '{{' }} params['mapreduce.output.fileoutputformat.outputdir'] {{ '}}' }}"
@@ -27,11 +49,12 @@
     {% if hdfs_archives %}
         archives={{ hdfs_archives | to_python }},
     {% endif %}
-    cluster_name=CONFIG['dataproc_cluster'],
+    cluster_name={{ config_var }}['dataproc_cluster'],
     dataproc_hadoop_properties={% include "props.tpl" %},
-    dataproc_hadoop_jars=CONFIG['hadoop_jars'].split(','),
-    gcp_conn_id=CONFIG['gcp_conn_id'],
-    region=CONFIG['gcp_region'],
+    dataproc_hadoop_jars={{ config_var }}['hadoop_jars'].split(','),
+    gcp_conn_id={{ config_var }}['gcp_conn_id'],
+    region={{ config_var }}['gcp_region'],
     dataproc_job_id={{ task_id | to_python }},
     params={% include "props.tpl" %},
 )
+{% endif %}
@@ -13,15 +13,32 @@
   See the License for the specific language governing permissions and
   limitations under the License.
 #}
+{% if async_submit is defined and async_submit %}
+{{ task_id | to_var }} = dataproc_jobs_lib.DataProcJobSubmitOperator(
+    task_id={{ task_id | to_python }},
+    trigger_rule={{ trigger_rule | to_python }},
+    job_type="pigJob",
+    job={
+        "queryFileUri": '%s/%s' % ({{ config_var }}['gcp_uri_prefix'], {{ script_file_name | to_python }}),
+        "scriptVariables": {{ params_dict | to_python }},
+        "properties": {% include "props.tpl" %},
+    },
+    cluster_name={{ config_var }}['dataproc_cluster'],
+    gcp_conn_id={{ config_var }}['gcp_conn_id'],
+    region={{ config_var }}['gcp_region'],
+    params={% include "props.tpl" %},
+)
+{% else %}
 {{ task_id | to_var }} = dataproc_operator.DataProcPigOperator(
     task_id={{ task_id | to_python }},
     trigger_rule={{ trigger_rule | to_python }},
-    query_uri='%s/%s' % (CONFIG['gcp_uri_prefix'], {{ script_file_name | to_python }}),
+    query_uri='%s/%s' % ({{ config_var }}['gcp_uri_prefix'], {{ script_file_name | to_python }}),
     variables={{ params_dict | to_python }},
     dataproc_pig_properties={% include "props.tpl" %},
-    cluster_name=CONFIG['dataproc_cluster'],
-    gcp_conn_id=CONFIG['gcp_conn_id'],
-    region=CONFIG['gcp_region'],
+    cluster_name={{ config_var }}['dataproc_cluster'],
+    gcp_conn_id={{ config_var }}['gcp_conn_id'],
+    region={{ config_var }}['gcp_region'],
     dataproc_job_id={{ task_id | to_python }},
     params={% include "props.tpl" %},
 )
+{% endif %}
@@ -15,11 +15,11 @@
 #}
 {% if (action_node_properties is defined) and (action_node_properties | length != 0) -%}
     PropertySet(
-        config=CONFIG,
-        job_properties=JOB_PROPS,
+        config={{ config_var }},
+        job_properties={{ job_properties_var }},
         action_node_properties={{ action_node_properties | to_python }}).merged
 {% else -%}
     PropertySet(
-        config=CONFIG,
-        job_properties=JOB_PROPS).merged
+        config={{ config_var }},
+        job_properties={{ job_properties_var }}).merged
 {% endif %}
@@ -13,6 +13,26 @@
   See the License for the specific language governing permissions and
   limitations under the License.
 #}
+{% if async_submit is defined and async_submit %}
+{{ task_id | to_var }} = dataproc_jobs_lib.DataProcJobSubmitOperator(
+    task_id={{ task_id | to_python }},
+    trigger_rule={{ trigger_rule | to_python }},
+    job_type="sparkJob",
+    job={
+        {% if main_jar %}"mainJarFileUri": {{ main_jar | to_python }},{% endif %}
+        {% if main_class %}"mainClass": {{ main_class | to_python }},{% endif %}
+        "args": {{ arguments | to_python }},
+        {% if hdfs_files %}"fileUris": {{ hdfs_files | to_python }},{% endif %}
+        {% if hdfs_archives %}"archiveUris": {{ hdfs_archives | to_python }},{% endif %}
+        {% if dataproc_spark_jars %}"jarFileUris": {{ dataproc_spark_jars | to_python }},{% endif %}
+        {% if spark_opts %}"properties": {{ spark_opts | to_python }},{% endif %}
+    },
+    cluster_name={{ config_var }}['dataproc_cluster'],
+    gcp_conn_id={{ config_var }}['gcp_conn_id'],
+    region={{ config_var }}['gcp_region'],
+    params={% include "props.tpl" %},
+)
+{% else %}
 {{ task_id | to_var }} = dataproc_operator.DataProcSparkOperator(
     task_id={{ task_id | to_python }},
     trigger_rule={{ trigger_rule | to_python }},
@@ -26,14 +46,15 @@
         archives={{ hdfs_archives | to_python }}.
     {% endif %}
     job_name={{ job_name | to_python }},
-    cluster_name=CONFIG['dataproc_cluster'],
+    cluster_name={{ config_var }}['dataproc_cluster'],
     {% if dataproc_spark_jars %}
         dataproc_spark_jars={{ dataproc_spark_jars | to_python }},
     {% endif %}
     {% if spark_opts %}
         dataproc_spark_properties={{ spark_opts | to_python }},
     {% endif %}
-    gcp_conn_id=CONFIG['gcp_conn_id'],
-    region=CONFIG['gcp_region'],
+    gcp_conn_id={{ config_var }}['gcp_conn_id'],
+    region={{ config_var }}['gcp_region'],
     params={% include "props.tpl" %},
 )
+{% endif %}
@@ -13,16 +13,12 @@
   See the License for the specific language governing permissions and
   limitations under the License.
 #}
-{{ task_id | to_var }}_hook = ssh_hook.SSHHook(
+{{ task_id | to_var }} = lazy_ssh_operator.LazySSHOperator(
+    task_id={{ task_id | to_python }},
+    trigger_rule={{ trigger_rule | to_python }},
     ssh_conn_id='ssh_default',
     username={{ user | to_python }},
     remote_host={{ host | to_python }},
-)
-
-{{ task_id | to_var }} = ssh_operator.SSHOperator(
-    task_id={{ task_id | to_python }},
-    trigger_rule={{ trigger_rule | to_python }},
-    ssh_hook={{ task_id | to_var }}_hook,
     command={{ command | to_python }},
     params={% include "props.tpl" %},
 )
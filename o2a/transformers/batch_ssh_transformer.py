@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Batch SSH Transformer
+"""
+import logging
+from typing import Dict, List, Optional
+
+from airflow.utils.trigger_rule import TriggerRule
+
+from o2a.converter.task import Task
+from o2a.converter.task_graph import TaskGraph
+from o2a.converter.workflow import Workflow
+from o2a.transformers.base_transformer import BaseWorkflowTransformer
+
+
+# pylint: disable=too-few-public-methods
+class BatchSshTransformer(BaseWorkflowTransformer):
+    """
+    Runs the consecutive SSH commands sent to the same host as the same user in one SSH session.
+
+    A task is merged into its upstream task when:
+
+    - the upstream task is its only upstream task and it is the only task run when the upstream task succeeds,
+    - it has the ``all_success`` trigger rule,
+    - both tasks handle the errors with the same tasks.
+
+    The merged task runs every command in its own subshell one after another and stops at the first
+    failing command, so the operators of a command do not change how the others are run.
+    It has to be applied after the relations are converted.
+    """
+
+    def process_workflow(self, workflow: Workflow):
+        graph = TaskGraph(workflow)
+        merged_task_ids: Dict[str, List[str]] = {}
+        for task_id in list(graph.tasks):
+            if task_id not in graph.tasks:
+                # Already merged into its upstream task
+                continue
+            while True:
+                next_task_id = self._find_next_task_id(graph, task_id)
+                if next_task_id is None:
+                    break
+                self._merge_tasks(graph, task_id, next_task_id, merged=task_id in merged_task_ids)
+                merged_task_ids.setdefault(task_id, []).append(next_task_id)
+        for task_id, next_task_ids in merged_task_ids.items():
+            logging.info(f"Merged the SSH commands of {next_task_ids} into {task_id}")
+
+    @staticmethod
+    def _find_next_task_id(graph: TaskGraph, task_id: str) -> Optional[str]:
+        task = graph.tasks[task_id]
+        if task.template_name != "ssh.tpl":
+            return None
+        ok_relations = [relation for relation in graph.downstream_relations[task_id] if not relation.is_error]
+        if len(ok_relations) != 1:
+            return None
+        next_task_id = ok_relations[0].to_task_id
+        next_task = graph.tasks[next_task_id]
+        if (
+            next_task.template_name != "ssh.tpl"
+            or next_task.trigger_rule != TriggerRule.ALL_SUCCESS
+            or graph.upstream_task_ids(next_task_id) != {task_id}
+            or (next_task.template_params["user"], next_task.template_params["host"])
+            != (task.template_params["user"], task.template_params["host"])
+        ):
+            return None
+        error_task_ids = {
+            relation.to_task_id for relation in graph.downstream_relations[task_id] if relation.is_error
+        }
+        next_error_task_ids = {
+            relation.to_task_id for relation in graph.downstream_relations[next_task_id] if relation.is_error
+        }
+        if error_task_ids != next_error_task_ids:
+            return None
+        return next_task_id
+
+    @staticmethod
+    def _merge_tasks(graph: TaskGraph, task_id: str, next_task_id: str, merged: bool):
+        """
+        Appends the command of the next task to the commands of the task. The command of the task is
+        already wrapped in a subshell if other commands were merged into it before.
+        """
+        task = graph.tasks[task_id]
+        next_task = graph.tasks[next_task_id]
+        command = task.template_params["command"]
+        if not merged:
+            command = f"( {command} )"
+        command = f"{command} && ( {next_task.template_params['command']} )"
+        graph.replace_task(
+            Task(
+                task_id=task.task_id,
+                template_name=task.template_name,
+                trigger_rule=task.trigger_rule,
+                template_params={**task.template_params, "command": command},
+            )
+        )
+        ok_relations = [
+            relation for relation in graph.downstream_relations[next_task_id] if not relation.is_error
+        ]
+        graph.remove_task(next_task_id)
+        for relation in ok_relations:
+            graph.add_relation(task_id, relation.to_task_id)
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Collapse Dummy Transformer
+"""
+import logging
+from typing import Dict, FrozenSet, List, Set, Tuple
+
+from airflow.utils.trigger_rule import TriggerRule
+
+from o2a.converter.task_graph import TaskGraph
+from o2a.converter.workflow import Workflow
+from o2a.mappers.dummy_mapper import DummyMapper
+from o2a.mappers.kill_mapper import KillMapper
+from o2a.transformers.base_transformer import BaseWorkflowTransformer
+
+# Trigger rules that are satisfied by an upstream task that succeeded, whatever the other upstream tasks do
+RULES_INDEPENDENT_OF_SUCCESS = {TriggerRule.ALL_SUCCESS, TriggerRule.ALL_DONE, TriggerRule.DUMMY}
+
+
+# pylint: disable=too-few-public-methods
+class CollapseDummyTransformer(BaseWorkflowTransformer):
+    """
+    Removes the dummy tasks of forks, joins, starts and ends that do not change when the other tasks run.
+
+    A dummy task is removed and its upstream tasks are connected to its downstream tasks when:
+
+    - it has no upstream tasks and it does not change the trigger rules of its downstream tasks,
+    - it has a single upstream task and the ``all_success`` trigger rule - which passes through the state
+      of the upstream task,
+    - it has the ``all_success`` trigger rule as well as all its downstream tasks.
+
+    Dummy tasks with the same upstream tasks and trigger rule are merged into one. Relations already implied
+    by other paths of ``all_success`` tasks are not created. Dummy tasks downstream of a decision are kept,
+    because the decision refers to them. It has to be applied after the relations are converted.
+    """
+
+    def process_workflow(self, workflow: Workflow):
+        graph = TaskGraph(workflow)
+        removed_task_ids: List[str] = []
+        changed = True
+        while changed:
+            changed = False
+            for task_id in self._find_dummy_task_ids(graph):
+                if self._collapse_task(graph, task_id):
+                    removed_task_ids.append(task_id)
+                    changed = True
+            merged_task_ids = self._merge_duplicates(graph)
+            if merged_task_ids:
+                removed_task_ids.extend(merged_task_ids)
+                changed = True
+        if removed_task_ids:
+            logging.info(f"Removed dummy tasks: {removed_task_ids}")
+
+    @staticmethod
+    def _find_dummy_task_ids(graph: TaskGraph) -> List[str]:
+        task_ids = []
+        for task_id, task in graph.tasks.items():
+            node = graph.task_nodes[task_id]
+            if (
+                task.template_name == "dummy.tpl"
+                and isinstance(node.mapper, DummyMapper)
+                and not isinstance(node.mapper, KillMapper)
+                and not any(
+                    graph.tasks[upstream_id].template_name == "decision.tpl"
+                    for upstream_id in graph.upstream_task_ids(task_id)
+                )
+            ):
+                task_ids.append(task_id)
+        return task_ids
+
+    def _collapse_task(self, graph: TaskGraph, task_id: str) -> bool:
+        upstream_ids = graph.upstream_task_ids(task_id)
+        downstream_ids = graph.downstream_task_ids(task_id)
+        trigger_rule = graph.tasks[task_id].trigger_rule
+        if not upstream_ids:
+            if not downstream_ids or not all(
+                self._is_independent_of_root(graph, task_id, downstream_id)
+                for downstream_id in downstream_ids
+            ):
+                return False
+        elif trigger_rule != TriggerRule.ALL_SUCCESS:
+            return False
+        elif len(upstream_ids) == 1:
+            # The upstream task becomes a leaf, so the state of the DAG run depends on it instead
+            (upstream_id,) = upstream_ids
+            if not downstream_ids and graph.downstream_task_ids(upstream_id) != {task_id}:
+                return False
+        elif not downstream_ids or any(
+            graph.tasks[downstream_id].trigger_rule != TriggerRule.ALL_SUCCESS
+            for downstream_id in downstream_ids
+        ):
+            return False
+
+        downstream_relations = list(graph.downstream_relations[task_id])
+        graph.remove_task(task_id)
+        for upstream_id in upstream_ids:
+            for relation in downstream_relations:
+                if not self._is_implied(graph, upstream_id, relation.to_task_id):
+                    graph.add_relation(upstream_id, relation.to_task_id, is_error=relation.is_error)
+        return True
+
+    @staticmethod
+    def _is_independent_of_root(graph: TaskGraph, task_id: str, downstream_id: str) -> bool:
+        """
+        Checks if the downstream task runs the same way without the root task, which always succeeds.
+        """
+        trigger_rule = graph.tasks[downstream_id].trigger_rule
+        if graph.upstream_task_ids(downstream_id) == {task_id}:
+            return trigger_rule in RULES_INDEPENDENT_OF_SUCCESS or trigger_rule == TriggerRule.ONE_SUCCESS
+        return trigger_rule in RULES_INDEPENDENT_OF_SUCCESS
+
+    @staticmethod
+    def _is_implied(graph: TaskGraph, from_task_id: str, to_task_id: str) -> bool:
+        """
+        Checks if the relation between the tasks is implied by a path of ``all_success`` tasks.
+        Such a path succeeds only when the first task does and fails or skips when it does.
+        """
+        if graph.tasks[to_task_id].trigger_rule != TriggerRule.ALL_SUCCESS:
+            return False
+        if to_task_id in graph.downstream_task_ids(from_task_id):
+            return True
+        visited: Set[str] = set()
+        stack = [
+            task_id
+            for task_id in graph.downstream_task_ids(from_task_id)
+            if graph.tasks[task_id].trigger_rule == TriggerRule.ALL_SUCCESS
+        ]
+        while stack:
+            task_id = stack.pop()
+            if task_id in visited:
+                continue
+            visited.add(task_id)
+            for downstream_id in graph.downstream_task_ids(task_id):
+                if downstream_id == to_task_id:
+                    return True
+                if graph.tasks[downstream_id].trigger_rule == TriggerRule.ALL_SUCCESS:
+                    stack.append(downstream_id)
+        return False
+
+    def _merge_duplicates(self, graph: TaskGraph) -> List[str]:
+        """
+        Merges the dummy tasks that have the same upstream tasks and trigger rule, so they always end
+        in the same state.
+        """
+        duplicates: Dict[Tuple[FrozenSet[str], str], List[str]] = {}
+        for task_id in self._find_dummy_task_ids(graph):
+            upstream_ids = frozenset(graph.upstream_task_ids(task_id))
+            if upstream_ids:
+                duplicates.setdefault((upstream_ids, graph.tasks[task_id].trigger_rule), []).append(task_id)
+
+        merged_task_ids: List[str] = []
+        for kept_task_id, *duplicate_task_ids in duplicates.values():
+            for duplicate_task_id in duplicate_task_ids:
+                downstream_relations = list(graph.downstream_relations[duplicate_task_id])
+                graph.remove_task(duplicate_task_id)
+                for relation in downstream_relations:
+                    graph.add_relation(kept_task_id, relation.to_task_id, is_error=relation.is_error)
+                merged_task_ids.append(duplicate_task_id)
+        return merged_task_ids
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Inline Subworkflow Transformer
+"""
+import logging
+from collections import OrderedDict
+from typing import Dict, List, Set, Union
+
+from airflow.utils.trigger_rule import TriggerRule
+
+from o2a.converter.parsed_action_node import ParsedActionNode
+from o2a.converter.relation import Relation
+from o2a.converter.task import Task
+from o2a.converter.workflow import Workflow
+from o2a.mappers.subworkflow_mapper import SubworkflowMapper
+from o2a.o2a_libs.property_utils import PropertySet
+from o2a.transformers.base_transformer import BaseWorkflowTransformer
+from o2a.utils.el_utils import comma_separated_string_to_list
+from o2a.utils.variable_name_utils import convert_to_python_variable
+
+
+# pylint: disable=too-few-public-methods
+class InlineSubworkflowTransformer(BaseWorkflowTransformer):
+    """
+    Moves the tasks of the subworkflows into the DAG instead of running them in sub-DAGs.
+
+    The tasks of the subworkflow get the name of the subworkflow node as prefix. They are placed between
+    two dummy tasks: the first one keeps the task id of the subworkflow node and starts the tasks
+    without upstream tasks, the second one waits for the tasks without downstream tasks, except for
+    the error handlers. The start task defines the variables with the properties of the subworkflow
+    and the tasks of the subworkflow use them instead of the properties of the DAG.
+
+    It has to be applied after the relations are converted, so the trigger rules of the tasks of
+    the subworkflow are not changed, and the subworkflows have to be converted with the
+    ``inline_subworkflows`` option enabled.
+    """
+
+    def process_workflow(self, workflow: Workflow):
+        for node in list(workflow.nodes.values()):
+            if isinstance(node.mapper, SubworkflowMapper) and node.mapper.subworkflow is not None:
+                self._inline_subworkflow(workflow, node)
+
+    def _inline_subworkflow(self, workflow: Workflow, node: ParsedActionNode):
+        mapper = node.mapper
+        assert isinstance(mapper, SubworkflowMapper)
+        subworkflow = mapper.subworkflow
+        assert subworkflow is not None and mapper.subworkflow_props is not None
+        # Subworkflows of the subworkflow are inlined first
+        self.process_workflow(subworkflow)
+        prefix = node.name + "."
+
+        relations = self._get_prefixed_relations(subworkflow, prefix)
+        downstream_task_ids: Set[str] = {relation.to_task_id for relation in relations}
+        start_task = Task(
+            task_id=node.first_task_id,
+            template_name="subwf_inline_start.tpl",
+            trigger_rule=node.tasks[0].trigger_rule,
+            template_params={
+                **self._get_props_params(mapper.subworkflow_props),
+                **self._get_props_var_params(node.first_task_id),
+            },
+        )
+        end_task = Task(task_id=node.name + ".subworkflow_end", template_name="subwf_inline_end.tpl")
+        tasks: List[Task] = [
+            self._prefix_task(task, prefix, downstream_task_ids, start_task.task_id)
+            for subworkflow_node in subworkflow.nodes.values()
+            for task in subworkflow_node.tasks
+        ]
+        relations.extend(self._get_start_and_end_relations(tasks, relations, start_task, end_task))
+
+        last_task_id = node.last_task_id
+        workflow.replace_tasks(node, [start_task, *tasks, end_task], relations)
+        self._move_downstream_relations(workflow, last_task_id, end_task.task_id)
+        logging.info(f"Inlined {len(tasks)} tasks of the {subworkflow.dag_name} subworkflow into {node.name}")
+
+    def _get_prefixed_relations(self, subworkflow: Workflow, prefix: str) -> List[Relation]:
+        relations: List[Relation] = []
+        for subworkflow_node in subworkflow.nodes.values():
+            relations.extend(
+                self._prefix_relation(relation, prefix) for relation in subworkflow_node.relations
+            )
+        relations.extend(self._prefix_relation(relation, prefix) for relation in subworkflow.relations)
+        return relations
+
+    @staticmethod
+    def _get_start_and_end_relations(
+        tasks: List[Task], relations: List[Relation], start_task: Task, end_task: Task
+    ) -> List[Relation]:
+        """
+        Returns the relations of the start task with the first tasks of the subworkflow
+        and of its last tasks with the end task.
+        """
+        upstream_task_ids = {relation.from_task_id for relation in relations}
+        downstream_task_ids = {relation.to_task_id for relation in relations}
+        new_relations = [
+            Relation(from_task_id=start_task.task_id, to_task_id=task.task_id)
+            for task in tasks
+            if task.task_id not in downstream_task_ids
+        ]
+        last_tasks = [task for task in tasks if task.task_id not in upstream_task_ids]
+        # Error handlers are skipped when the subworkflow succeeds
+        ok_last_tasks = [task for task in last_tasks if task.trigger_rule != TriggerRule.ONE_FAILED]
+        new_relations.extend(
+            Relation(from_task_id=task.task_id, to_task_id=end_task.task_id)
+            for task in ok_last_tasks or last_tasks
+        )
+        if not tasks:
+            new_relations.append(Relation(from_task_id=start_task.task_id, to_task_id=end_task.task_id))
+        return new_relations
+
+    @staticmethod
+    def _move_downstream_relations(workflow: Workflow, from_task_id: str, to_task_id: str) -> None:
+        """
+        Makes the downstream tasks of the subworkflow node wait for the end task of the subworkflow.
+        """
+        for relation in [
+            relation for relation in workflow.relations if relation.from_task_id == from_task_id
+        ]:
+            workflow.remove_relation(relation)
+            workflow.add_relation(
+                Relation(from_task_id=to_task_id, to_task_id=relation.to_task_id, is_error=relation.is_error)
+            )
+
+    def _prefix_task(
+        self, task: Task, prefix: str, downstream_task_ids: Set[str], start_task_id: str
+    ) -> Task:
+        """
+        Returns a copy of the task with the prefixed task id, so the tasks of the subworkflow are not changed.
+        The copy uses the properties defined by the start task, unless the task belongs to a subworkflow
+        inlined before.
+        """
+        task_id = prefix + task.task_id
+        # The task started the subworkflow, now it runs only when the subworkflow node does
+        trigger_rule = task.trigger_rule if task_id in downstream_task_ids else TriggerRule.ALL_SUCCESS
+        template_params = task.template_params
+        props_task_id = template_params.get("props_task_id")
+        props_task_id = prefix + props_task_id if props_task_id else start_task_id
+        template_params = {**template_params, **self._get_props_var_params(props_task_id)}
+        if task.template_name == "decision.tpl":
+            # Decisions return the task id of the chosen branch
+            template_params["case_dict"] = OrderedDict(
+                (case, prefix + branch_task_id)
+                for case, branch_task_id in template_params["case_dict"].items()
+            )
+        return Task(
+            task_id=task_id,
+            template_name=task.template_name,
+            trigger_rule=trigger_rule,
+            template_params=template_params,
+        )
+
+    @staticmethod
+    def _prefix_relation(relation: Relation, prefix: str) -> Relation:
+        return Relation(
+            from_task_id=prefix + relation.from_task_id,
+            to_task_id=prefix + relation.to_task_id,
+            is_error=relation.is_error,
+        )
+
+    @staticmethod
+    def _get_props_params(props: PropertySet) -> Dict[str, Dict]:
+        job_properties: Dict[str, Union[List[str], str]] = {
+            key: comma_separated_string_to_list(value) for key, value in props.job_properties.items()
+        }
+        return dict(config=props.config, job_properties=job_properties)
+
+    @staticmethod
+    def _get_props_var_params(props_task_id: str) -> Dict[str, str]:
+        """
+        Returns the names of the variables with the properties defined by the start task of the subworkflow.
+        """
+        var = convert_to_python_variable(props_task_id)
+        return dict(
+            props_task_id=props_task_id, config_var=f"{var}_config", job_properties_var=f"{var}_job_props"
+        )
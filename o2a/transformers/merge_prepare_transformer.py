@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Merge Prepare Transformer
+"""
+import logging
+from typing import List, Optional
+
+from o2a.converter.parsed_action_node import ParsedActionNode
+from o2a.converter.relation import Relation
+from o2a.converter.workflow import Workflow
+from o2a.mappers.dummy_mapper import DummyMapper
+from o2a.mappers.extensions.prepare_mapper_extension import PrepareMapperExtension
+from o2a.transformers.base_transformer import BaseWorkflowTransformer
+
+
+# pylint: disable=too-few-public-methods
+class MergePrepareTransformer(BaseWorkflowTransformer):
+    """
+    Merges the prepare tasks of the actions started by the same fork into one task run by the fork.
+
+    The actions must be reachable only from the fork, so the prepare step is run whenever the action is.
+    It has to be applied after the nodes are converted to tasks.
+    """
+
+    def process_workflow(self, workflow: Workflow):
+        for fork_node in [node for node in workflow.nodes.values() if self._is_fork(node)]:
+            prepared_nodes = [
+                workflow.nodes[name]
+                for name in fork_node.downstream_names
+                if self._has_prepare_task(workflow.nodes[name])
+                and workflow.find_upstream_nodes(workflow.nodes[name]) == [fork_node]
+            ]
+            if len(prepared_nodes) < 2:
+                continue
+            self._merge_prepare_tasks(workflow, fork_node, prepared_nodes)
+
+    @staticmethod
+    def _is_fork(node: ParsedActionNode) -> bool:
+        return isinstance(node.mapper, DummyMapper) and node.mapper.oozie_node.tag.endswith("fork")
+
+    @staticmethod
+    def _get_prepare_extension(node: ParsedActionNode) -> Optional[PrepareMapperExtension]:
+        extension = getattr(node.mapper, "prepare_extension", None)
+        return extension if isinstance(extension, PrepareMapperExtension) else None
+
+    def _has_prepare_task(self, node: ParsedActionNode) -> bool:
+        extension = self._get_prepare_extension(node)
+        return (
+            extension is not None
+            and extension.has_prepare()
+            and len(node.tasks) > 1
+            and node.tasks[0].task_id == node.name + "_prepare"
+        )
+
+    def _merge_prepare_tasks(
+        self, workflow: Workflow, fork_node: ParsedActionNode, nodes: List[ParsedActionNode]
+    ):
+        delete_paths: List[str] = []
+        mkdir_paths: List[str] = []
+        for node in nodes:
+            extension = self._get_prepare_extension(node)
+            assert extension is not None
+            node_delete_paths, node_mkdir_paths = extension.parse_prepare_node()
+            delete_paths.extend(node_delete_paths)
+            mkdir_paths.extend(node_mkdir_paths)
+
+        prepare_task = PrepareMapperExtension.create_prepare_task(
+            task_id=fork_node.name + "_prepare",
+            # The same directory may be prepared for more than one action
+            delete_paths=list(dict.fromkeys(delete_paths)),
+            mkdir_paths=list(dict.fromkeys(mkdir_paths)),
+        )
+        if prepare_task is None:
+            return
+
+        for node in nodes:
+            prepare_task_id = node.tasks[0].task_id
+            workflow.replace_tasks(
+                node,
+                node.tasks[1:],
+                [relation for relation in node.relations if relation.from_task_id != prepare_task_id],
+            )
+        workflow.replace_tasks(
+            fork_node,
+            [*fork_node.tasks, prepare_task],
+            [
+                *fork_node.relations,
+                Relation(from_task_id=fork_node.last_task_id, to_task_id=prepare_task.task_id),
+            ],
+        )
+        logging.info(
+            f"Merged the prepare tasks of {[node.name for node in nodes]} into {prepare_task.task_id}"
+        )
@@ -35,10 +35,9 @@ class RemoveEndTransformer(BaseWorkflowTransformer):
         for end_node in end_nodes:
             upstream_nodes = workflow.find_upstream_nodes(end_node)
             upstream_node_names = {node.name for node in upstream_nodes}
-            print(upstream_node_names)
             if not decision_node_names.intersection(upstream_node_names):
                 workflow.remove_node(end_node)
             else:
                 for upstream_node in upstream_nodes:
                     if upstream_node.name not in decision_node_names:
-                        upstream_node.downstream_names.remove(end_node.name)
+                        workflow.remove_downstream(upstream_node, end_node.name)
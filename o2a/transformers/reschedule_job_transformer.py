@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Reschedule Job Transformer
+"""
+import logging
+from typing import Dict, List, Tuple
+
+from o2a.converter.relation import Relation
+from o2a.converter.task import Task
+from o2a.converter.workflow import Workflow
+from o2a.transformers.base_transformer import BaseWorkflowTransformer
+
+# Templates of the tasks submitting Dataproc jobs
+JOB_TEMPLATE_NAMES = {
+    "distcp.tpl",
+    "fs_op.tpl",
+    "hive.tpl",
+    "mapreduce.tpl",
+    "pig.tpl",
+    "shell.tpl",
+    "spark.tpl",
+}
+
+DEFAULT_POKE_INTERVAL = 60
+
+
+# pylint: disable=too-few-public-methods
+class RescheduleJobTransformer(BaseWorkflowTransformer):
+    """
+    Splits the tasks running Dataproc jobs into a task submitting the job and a sensor waiting for it.
+
+    The submitting task keeps the task id and passes the id of the job to the sensor through XCom.
+    The sensor runs in the ``reschedule`` mode, so it does not occupy a worker slot while the job runs.
+    The relations starting at the task start at the sensor instead. It has to be applied after
+    the relations are converted.
+
+    :param poke_interval: number of seconds between the checks of the state of the job
+    """
+
+    def __init__(self, poke_interval: int = DEFAULT_POKE_INTERVAL):
+        self.poke_interval = poke_interval
+
+    def process_workflow(self, workflow: Workflow):
+        sensor_task_ids: Dict[str, str] = {}
+        for node in list(workflow.nodes.values()):
+            if not any(task.template_name in JOB_TEMPLATE_NAMES for task in node.tasks):
+                continue
+            tasks: List[Task] = []
+            relations: List[Relation] = []
+            for task in node.tasks:
+                if task.template_name not in JOB_TEMPLATE_NAMES:
+                    tasks.append(task)
+                    continue
+                submit_task, sensor_task = self._split_task(task)
+                tasks.extend([submit_task, sensor_task])
+                relations.append(Relation(from_task_id=submit_task.task_id, to_task_id=sensor_task.task_id))
+                sensor_task_ids[task.task_id] = sensor_task.task_id
+            relations.extend(self._move_relation(relation, sensor_task_ids) for relation in node.relations)
+            workflow.replace_tasks(node, tasks, relations)
+
+        for relation in [
+            relation for relation in workflow.relations if relation.from_task_id in sensor_task_ids
+        ]:
+            workflow.remove_relation(relation)
+            workflow.add_relation(self._move_relation(relation, sensor_task_ids))
+        if sensor_task_ids:
+            workflow.dependencies.add("from o2a.o2a_libs import dataproc_jobs as dataproc_jobs_lib")
+            logging.info(f"Added sensors waiting for the jobs of {list(sensor_task_ids)}")
+
+    def _split_task(self, task: Task) -> Tuple[Task, Task]:
+        submit_task = Task(
+            task_id=task.task_id,
+            template_name=task.template_name,
+            trigger_rule=task.trigger_rule,
+            template_params={**task.template_params, "async_submit": True},
+        )
+        sensor_task = Task(
+            task_id=task.task_id + "_sensor",
+            template_name="dataproc_job_sensor.tpl",
+            template_params=dict(
+                job_id=f"{{{{ task_instance.xcom_pull(task_ids={task.task_id!r}) }}}}",
+                poke_interval=self.poke_interval,
+                # The sensor uses the same properties as the job, e.g. of its inlined subworkflow
+                **{
+                    name: value
+                    for name, value in task.template_params.items()
+                    if name in ("config_var", "job_properties_var")
+                },
+            ),
+        )
+        return submit_task, sensor_task
+
+    @staticmethod
+    def _move_relation(relation: Relation, sensor_task_ids: Dict[str, str]) -> Relation:
+        if relation.from_task_id not in sensor_task_ids:
+            return relation
+        return Relation(
+            from_task_id=sensor_task_ids[relation.from_task_id],
+            to_task_id=relation.to_task_id,
+            is_error=relation.is_error,
+        )
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Transitive Reduction Transformer
+"""
+import logging
+from typing import Dict, List
+
+from airflow.utils.trigger_rule import TriggerRule
+
+from o2a.converter.exceptions import O2AException
+from o2a.converter.relation import Relation
+from o2a.converter.task_graph import TaskGraph
+from o2a.converter.workflow import Workflow
+from o2a.transformers.base_transformer import BaseWorkflowTransformer
+
+
+# pylint: disable=too-few-public-methods
+class TransitiveReductionTransformer(BaseWorkflowTransformer):
+    """
+    Removes the relations implied by other paths between the tasks.
+
+    A relation is implied when the downstream task has the ``all_success`` trigger rule and can be
+    reached from the upstream task through other ``all_success`` tasks. Such a path succeeds only when
+    the upstream task does and fails or skips when it does, so the downstream task runs the same way.
+    Relations starting at decisions are kept, because a decision skips its direct downstream tasks.
+
+    Reachability is computed once for the whole workflow, using integers as bitsets of tasks.
+    The number of relations removed from each DAG is kept in ``removed_relations``.
+    """
+
+    def __init__(self):
+        self.removed_relations: Dict[str, int] = {}
+
+    def process_workflow(self, workflow: Workflow):
+        graph = TaskGraph(workflow)
+        task_ids = self._sort_topologically(graph)
+        bits = {task_id: 1 << index for index, task_id in enumerate(task_ids)}
+        is_all_success = {
+            task_id: graph.tasks[task_id].trigger_rule == TriggerRule.ALL_SUCCESS for task_id in task_ids
+        }
+
+        # Tasks reachable from the task through paths of all_success tasks
+        reachable: Dict[str, int] = {}
+        for task_id in reversed(task_ids):
+            reachable_bits = 0
+            for downstream_id in graph.downstream_task_ids(task_id):
+                if is_all_success[downstream_id]:
+                    reachable_bits |= bits[downstream_id] | reachable[downstream_id]
+            reachable[task_id] = reachable_bits
+
+        redundant_relations: List[Relation] = []
+        for task_id in task_ids:
+            if graph.tasks[task_id].template_name == "decision.tpl":
+                continue
+            downstream_ids = graph.downstream_task_ids(task_id)
+            # Tasks reachable through at least two relations
+            indirect_bits = 0
+            for downstream_id in downstream_ids:
+                if is_all_success[downstream_id]:
+                    indirect_bits |= reachable[downstream_id]
+            for relation in graph.downstream_relations[task_id]:
+                if is_all_success[relation.to_task_id] and indirect_bits & bits[relation.to_task_id]:
+                    redundant_relations.append(relation)
+
+        for relation in redundant_relations:
+            graph.remove_relation(relation)
+        self.removed_relations[workflow.dag_name] = len(redundant_relations)
+        logging.info(
+            f"Removed {len(redundant_relations)} redundant relations from the {workflow.dag_name} DAG"
+        )
+
+    @staticmethod
+    def _sort_topologically(graph: TaskGraph) -> List[str]:
+        upstream_counts = {task_id: len(graph.upstream_task_ids(task_id)) for task_id in graph.tasks}
+        ready = [task_id for task_id, count in upstream_counts.items() if count == 0]
+        task_ids: List[str] = []
+        while ready:
+            task_id = ready.pop()
+            task_ids.append(task_id)
+            for downstream_id in graph.downstream_task_ids(task_id):
+                upstream_counts[downstream_id] -= 1
+                if upstream_counts[downstream_id] == 0:
+                    ready.append(downstream_id)
+        if len(task_ids) != len(graph.tasks):
+            raise O2AException(f"The tasks of the {graph.workflow.dag_name} DAG contain a cycle")
+        return task_ids
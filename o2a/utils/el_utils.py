@@ -17,8 +17,9 @@ import codecs
 import logging
 import os
 import re
-from copy import deepcopy
-from typing import List, Optional, Tuple, Union
+from collections import ChainMap
+from functools import partial
+from typing import Dict, List, Mapping, Match, Optional, Set, Tuple, Union
 from urllib.parse import urlparse, ParseResult
 
 from o2a.converter.exceptions import ParseException
@@ -68,21 +69,112 @@ def strip_el(el_function: str) -> str:
     return re.sub("[${}]", "", el_function).strip()
 
 
-def replace_el_with_var(el_function: str, props: PropertySet, quote=True) -> str:
+class PropertyResolver:
     """
-    Only supports a single variable for now.
+    Resolves EL variables (``${name}``) in property values.
+
+    Values of properties may reference other properties, which may reference other properties
+    in turn. The references form a dependency graph that is walked depth-first, without recursion,
+    so that each property is resolved only once. Resolved values are memoized for the lifetime
+    of the resolver.
+
+    References to properties that are not defined are left untouched. Properties that are part
+    of a cycle keep their raw values - a warning is logged in that case. If the properties are
+    a ChainMap, a property referencing itself, e.g. ``PATH=${PATH}:/bin``, extends the value
+    from the next map in the chain instead.
+
+    :param properties: mapping of property names to their raw values
     """
-    # Matches oozie EL variables e.g. ${hostname}
-    var_match = VAR_MATCH.findall(el_function)
 
-    jinjafied_el = el_function
-    if var_match:
-        for var in var_match:
-            try:
-                value = props.merged[var]
-                jinjafied_el = jinjafied_el.replace("${" + var + "}", value)
-            except KeyError:
-                logging.info(f"The EL variable {var} was missing in the properties")
+    def __init__(self, properties: Mapping[str, str]):
+        self.properties = properties
+        self._resolved: Dict[str, str] = {}
+        self._dependencies: Dict[str, List[str]] = {}
+        self._parent: Optional[PropertyResolver] = None
+        if isinstance(properties, ChainMap) and len(properties.maps) > 1:
+            self._parent = PropertyResolver(properties.parents)
+
+    def resolve(self, name: str) -> str:
+        """
+        Returns the value of the property with all references replaced.
+
+        :param name: name of the property
+        :return: the resolved value
+        :raises KeyError: if the property is not defined
+        """
+        if name in self._resolved:
+            return self._resolved[name]
+        if name not in self.properties:
+            raise KeyError(name)
+
+        # Each frame holds a property and the position of its next dependency to visit
+        stack: List[List] = [[name, 0]]
+        depths = {name: 0}
+        cyclic: Set[str] = set()
+        while stack:
+            frame = stack[-1]
+            current, position = frame
+            dependencies = self._get_dependencies(current)
+            if position < len(dependencies):
+                frame[1] += 1
+                dependency = dependencies[position]
+                if dependency in depths:
+                    logging.warning(f"The EL variable {dependency} is referenced in a cycle by {current}")
+                    cycle_start = depths[dependency]
+                    cyclic.update(cycle_frame[0] for cycle_frame in stack[cycle_start:])
+                elif dependency in self.properties and dependency not in self._resolved:
+                    depths[dependency] = len(stack)
+                    stack.append([dependency, 0])
+                continue
+            if current in cyclic:
+                self._resolved[current] = self.properties[current]
+            else:
+                self._resolved[current] = VAR_MATCH.sub(
+                    partial(self._replace_resolved, current), self.properties[current]
+                )
+            stack.pop()
+            del depths[current]
+        return self._resolved[name]
+
+    def substitute(self, text: str) -> str:
+        """
+        Replaces all EL variables in the text in a single pass.
+        """
+        return VAR_MATCH.sub(self._replace, text)
+
+    def _get_dependencies(self, name: str) -> List[str]:
+        if name not in self._dependencies:
+            self._dependencies[name] = [
+                dependency
+                for dependency in VAR_MATCH.findall(self.properties[name])
+                if not self._extends_parent(name, dependency)
+            ]
+        return self._dependencies[name]
+
+    def _extends_parent(self, name: str, dependency: str) -> bool:
+        return dependency == name and self._parent is not None and name in self._parent.properties
+
+    def _replace_resolved(self, name: str, match: Match[str]) -> str:
+        dependency = match.group(1)
+        if self._parent is not None and self._extends_parent(name, dependency):
+            return self._parent.resolve(dependency)
+        return self._resolved.get(dependency, match.group(0))
+
+    def _replace(self, match: Match[str]) -> str:
+        try:
+            return self.resolve(match.group(1))
+        except KeyError:
+            logging.info(f"The EL variable {match.group(1)} was missing in the properties")
+            return match.group(0)
+
+
+def replace_el_with_var(el_function: str, props: PropertySet, quote=True) -> str:
+    """
+    Replaces all EL variables in the text with values of the properties.
+    Properties referenced by other properties are resolved as well.
+    EL functions are not supported.
+    """
+    jinjafied_el = PropertyResolver(props.merged).substitute(el_function)
 
     return "'" + jinjafied_el + "'" if quote else jinjafied_el
 
@@ -131,53 +223,53 @@ def convert_el_to_jinja(oozie_el, quote=True):
         jinjafied_el = parse_el_func(oozie_el)
         return jinjafied_el
     if var_match:
-        for var in var_match:
-            jinjafied_el = jinjafied_el.replace("${" + var + "}", "{{ params.props.merged['" + var + "'] }}")
+        jinjafied_el = VAR_MATCH.sub(r"{{ params.props.merged['\1'] }}", jinjafied_el)
 
     return "'" + jinjafied_el + "'" if quote else jinjafied_el
 
 
-def parse_els(properties_file: Optional[str], props: PropertySet):
+def parse_els(properties_file: Optional[str], props: PropertySet) -> Dict[str, str]:
     """
     Parses the job_properties file into a dictionary, if the value has
     and EL function in it, it gets replaced with the corresponding
-    value that has already been parsed. For example, a file like:
+    value of the property. For example, a file like:
 
     job.job_properties
-        host=user@google.com
         command=ssh ${host}
+        host=user@google.com
 
     The job_properties would be parsed like:
         PROPERTIES = {
-        host: 'user@google.com',
         command='ssh user@google.com',
+        host: 'user@google.com',
     }
+
+    The file is read line by line. Once all the properties are read, the references between
+    them are resolved with a PropertyResolver, so a property can refer to properties defined
+    later in the file. Properties defined in the file take precedence over the properties
+    from the property set.
     """
-    copy_of_props = deepcopy(props)
-    properties_read_from_file = {}
+    properties_read_from_file: Dict[str, str] = {}
     if properties_file:
         if os.path.isfile(properties_file):
             with open(properties_file) as prop_file:
-                for line in prop_file.readlines():
+                for line in prop_file:
                     if line.startswith("#") or line.startswith(" ") or line.startswith("\n"):
                         continue
-                    else:
-                        key, value = _convert_line(line, props=copy_of_props)
-                        # Set the value of property in the copy of property set for further reference
-                        copy_of_props.action_node_properties[key] = value
-                        properties_read_from_file[key] = value
+                    key, value = _convert_line(line)
+                    properties_read_from_file[key] = value
         else:
             logging.warning(f"The job_properties file is missing: {properties_file}")
-    return properties_read_from_file
+    resolver = PropertyResolver(ChainMap(properties_read_from_file, props.merged))
+    return {key: resolver.resolve(key) for key in properties_read_from_file}
 
 
-def _convert_line(line: str, props: PropertySet) -> Tuple[str, str]:
+def _convert_line(line: str) -> Tuple[str, str]:
     """
-    Converts a line from the job_properties file and adds it to the job_properties dictionary.
+    Converts a line from the job_properties file into a key and a raw value.
     """
     key, value = line.split("=", 1)
-    value = replace_el_with_var(value.strip(), props=props, quote=False)
-    return key.strip(), value
+    return key.strip(), value.strip()
 
 
 def comma_separated_string_to_list(line: str) -> Union[List[str], str]:
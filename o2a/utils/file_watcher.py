@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""File watching utilities
+
+Files are watched with inotify on Linux. Where inotify is not available, the directories are polled
+and compared by the modification time and size of the files.
+"""
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+FileSignature = Tuple[int, int]
+
+# How often the watch loop checks if it should stop
+STOP_CHECK_INTERVAL = 1.0
+
+# inotify event masks, see inotify(7)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+)
+
+INOTIFY_EVENT = struct.Struct("iIII")
+INOTIFY_BUFFER_SIZE = 64 * 1024
+
+
+def take_snapshot(directories: Iterable[str]) -> Dict[str, FileSignature]:
+    """
+    Returns the modification time and size of all the files in the directories.
+    """
+    snapshot: Dict[str, FileSignature] = {}
+    for directory in directories:
+        for root, _, file_names in os.walk(directory):
+            for file_name in file_names:
+                path = os.path.join(root, file_name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def compare_snapshots(old: Dict[str, FileSignature], new: Dict[str, FileSignature]) -> Set[str]:
+    """
+    Returns the paths of the files created, modified or deleted between the snapshots.
+    """
+    changed = {path for path, signature in new.items() if old.get(path) != signature}
+    changed.update(old.keys() - new.keys())
+    return changed
+
+
+class BaseWatcher(ABC):
+    """Base class of the watchers"""
+
+    def __init__(self, directories: Iterable[str]):
+        self.directories = [os.path.abspath(directory) for directory in directories]
+
+    @abstractmethod
+    def wait_for_changes(self, timeout: Optional[float]) -> Set[str]:
+        """
+        Waits until some files change and returns their paths. Returns an empty set on timeout.
+        """
+
+    def close(self) -> None:
+        """
+        Releases the resources of the watcher.
+        """
+
+
+class PollingWatcher(BaseWatcher):
+    """
+    Watcher comparing snapshots of the directories.
+
+    :param interval: time between the snapshots in seconds
+    """
+
+    def __init__(self, directories: Iterable[str], interval: float = 1.0):
+        super().__init__(directories)
+        self.interval = interval
+        self._snapshot = take_snapshot(self.directories)
+
+    def wait_for_changes(self, timeout: Optional[float]) -> Set[str]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snapshot = take_snapshot(self.directories)
+            changed = compare_snapshots(self._snapshot, snapshot)
+            self._snapshot = snapshot
+            if changed:
+                return changed
+            delay = self.interval
+            if deadline is not None:
+                delay = min(delay, deadline - time.monotonic())
+                if delay <= 0:
+                    return set()
+            time.sleep(delay)
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except OSError:
+        return None
+    if not hasattr(libc, "inotify_init1"):
+        return None
+    return libc
+
+
+class InotifyWatcher(BaseWatcher):
+    """
+    Watcher receiving the changes from the inotify API of the Linux kernel.
+
+    Raises OSError if inotify is not available.
+    """
+
+    def __init__(self, directories: Iterable[str]):
+        super().__init__(directories)
+        libc = _load_libc()
+        if libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not available")
+        self._libc = libc
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, f"Unable to initialize inotify: {os.strerror(error)}")
+        self._watches: Dict[int, str] = {}
+        try:
+            for directory in self.directories:
+                self._add_tree(directory)
+        except OSError:
+            self.close()
+            raise
+
+    def _add_tree(self, directory: str) -> None:
+        for root, _, _ in os.walk(directory):
+            self._add_watch(root)
+
+    def _add_watch(self, path: str) -> None:
+        watch_descriptor = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if watch_descriptor < 0:
+            error = ctypes.get_errno()
+            if error == errno.ENOENT:
+                # The directory was removed in the meantime
+                return
+            raise OSError(error, f"Unable to watch {path}: {os.strerror(error)}")
+        self._watches[watch_descriptor] = path
+
+    def wait_for_changes(self, timeout: Optional[float]) -> Set[str]:
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+        return self._read_events()
+
+    def _read_events(self) -> Set[str]:
+        changed: Set[str] = set()
+        try:
+            data = os.read(self._fd, INOTIFY_BUFFER_SIZE)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset < len(data):
+            watch_descriptor, mask, _, length = INOTIFY_EVENT.unpack_from(data, offset)
+            offset += INOTIFY_EVENT.size
+            end = offset + length
+            name = os.fsdecode(data[offset:end].rstrip(b"\0"))
+            offset = end
+            if mask & IN_Q_OVERFLOW:
+                # Some events were lost, so anything could have changed
+                changed.update(self.directories)
+                continue
+            directory = self._watches.get(watch_descriptor)
+            if directory is None:
+                continue
+            if mask & IN_IGNORED:
+                del self._watches[watch_descriptor]
+                continue
+            path = os.path.join(directory, name) if name else directory
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                self._add_tree(path)
+                # Files created before the directory was watched do not generate events
+                changed.update(take_snapshot([path]).keys())
+            changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_watcher(directories: Iterable[str], polling_interval: float = 1.0) -> BaseWatcher:
+    """
+    Creates the inotify watcher, or the polling watcher if inotify is not available.
+    """
+    directories = list(directories)
+    try:
+        return InotifyWatcher(directories)
+    except OSError as ex:
+        logging.info(f"Unable to use inotify ({ex}). Polling the directories every {polling_interval}s.")
+        return PollingWatcher(directories, interval=polling_interval)
+
+
+def _is_excluded(path: str, excluded_directories: List[str]) -> bool:
+    return any(path == directory or path.startswith(directory + os.sep) for directory in excluded_directories)
+
+
+def _collect_changes(
+    watcher: BaseWatcher,
+    changed: Set[str],
+    debounce: float,
+    excluded_directories: List[str],
+    stop_event: threading.Event,
+) -> Set[str]:
+    """
+    Waits for the changes and returns them once no more changes happen for ``debounce`` seconds.
+    """
+    changed = set(changed)
+    while not stop_event.is_set():
+        more_changes = {
+            path
+            for path in watcher.wait_for_changes(timeout=debounce if changed else STOP_CHECK_INTERVAL)
+            if not _is_excluded(path, excluded_directories)
+        }
+        if changed and not more_changes:
+            break
+        changed.update(more_changes)
+    return changed
+
+
+def watch(
+    *,
+    get_directories: Callable[[], List[str]],
+    on_change: Callable[[Set[str]], None],
+    debounce: float = 0.5,
+    polling_interval: float = 1.0,
+    excluded_directories: Iterable[str] = (),
+    stop_event: Optional[threading.Event] = None,
+) -> None:
+    """
+    Calls ``on_change`` with the changed paths every time files in the directories change.
+
+    The changes are debounced - ``on_change`` is called when no more changes happen for ``debounce``
+    seconds. The watcher stays open while ``on_change`` runs, so the files changed in the meantime
+    are passed to the next call. The directories are listed again after every call, as they can depend
+    on the changed files. Changes in the excluded directories - such as the output directory - are ignored.
+    The loop runs until the ``stop_event`` is set.
+    """
+    stop_event = stop_event or threading.Event()
+    excluded = [os.path.abspath(directory) for directory in excluded_directories]
+    directories = get_directories()
+    watcher = create_watcher(directories, polling_interval=polling_interval)
+    pending: Set[str] = set()
+    try:
+        while not stop_event.is_set():
+            changed = _collect_changes(watcher, pending, debounce, excluded, stop_event)
+            if stop_event.is_set():
+                break
+            on_change(changed)
+            pending = set()
+            new_directories = get_directories()
+            if new_directories != directories:
+                directories = new_directories
+                # The new watcher is created before the old one is closed, so no change is lost
+                new_watcher = create_watcher(directories, polling_interval=polling_interval)
+                pending = {
+                    path for path in watcher.wait_for_changes(timeout=0) if not _is_excluded(path, excluded)
+                }
+                watcher.close()
+                watcher = new_watcher
+    finally:
+        watcher.close()
@@ -26,57 +26,162 @@ The following data types are supported:
 - None value;
 
 If you encounter a circular reference, an ValueError will be thrown.
+
+The serializer walks the object with an explicit stack, so deeply nested structures do not hit the
+recursion limit. Flat dictionaries and lists of strings - which is what most of the property sets
+passed to the templates are - are serialized in a single pass without walking the stack at all.
+Serialized strings are cached, as the same keys and values are serialized for every task.
 """
-from typing import Any, Set
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Set, Tuple
 
 from o2a.utils.el_utils import escape_string_with_python_escapes
 
+STRING_CACHE_SIZE = 65536
+
+_CONSTANTS = {True: "True", False: "False", None: "None"}
+
+# Stack instructions
+_VALUE = 0
+_TEXT = 1
+_LEAVE = 2
+
+Instruction = Tuple[int, Any]
+
+
+@lru_cache(maxsize=STRING_CACHE_SIZE)
+def _serialize_str(target: str) -> str:
+    # An empty string is serialized as None as it always has been
+    return str(escape_string_with_python_escapes(target))
+
+
+def _serialize_flat_dict(target: dict) -> str:
+    return (
+        "{"
+        + ", ".join(f"{_serialize_str(key)}: {_serialize_str(value)}" for key, value in target.items())
+        + "}"
+    )
+
+
+def _serialize_flat_list(target: list) -> str:
+    return "[" + ", ".join(_serialize_str(item) for item in target) + "]"
+
+
+def _is_flat_dict(target: dict) -> bool:
+    return all(isinstance(key, str) and isinstance(value, str) for key, value in target.items())
+
+
+def _is_flat_list(target: list) -> bool:
+    return all(isinstance(item, str) for item in target)
+
 
 def serialize(serializable_obj: Any) -> str:
     """
     Serialize to Python code
     """
+    if isinstance(serializable_obj, str):
+        return _serialize_str(serializable_obj)
+    if isinstance(serializable_obj, dict) and _is_flat_dict(serializable_obj):
+        return _serialize_flat_dict(serializable_obj)
+    if isinstance(serializable_obj, list) and _is_flat_list(serializable_obj):
+        return _serialize_flat_list(serializable_obj)
+    return _serialize_iteratively(serializable_obj)
+
+
+def _serialize_scalar(target: Any) -> Optional[str]:
+    """
+    Serialize a value that cannot contain other values or returns None for containers.
+    """
+    if isinstance(target, str):
+        return _serialize_str(target)
+    if target is True or target is False or target is None:
+        return _CONSTANTS[target]
+    return None
+
+
+def _get_dict_items(target: dict) -> List[Instruction]:
+    items: List[Instruction] = []
+    for key, value in target.items():
+        separator = ", " if items else ""
+        serialized_key = _serialize_scalar(key)
+        serialized_value = _serialize_scalar(value)
+        if serialized_key is not None and serialized_value is not None:
+            items.append((_TEXT, f"{separator}{serialized_key}: {serialized_value}"))
+        elif serialized_key is not None:
+            items.extend(((_TEXT, f"{separator}{serialized_key}: "), (_VALUE, value)))
+        else:
+            items.extend(((_TEXT, separator), (_VALUE, key), (_TEXT, ": "), (_VALUE, value)))
+    return items
+
+
+def _get_collection_items(target: Iterable) -> List[Instruction]:
+    items: List[Instruction] = []
+    for item in target:
+        separator = ", " if items else ""
+        serialized_item = _serialize_scalar(item)
+        if serialized_item is not None:
+            items.append((_TEXT, f"{separator}{serialized_item}"))
+        else:
+            items.extend(((_TEXT, separator), (_VALUE, item)))
+    return items
+
+
+def _get_container(target: Any) -> Tuple[str, str, List[Instruction]]:
+    """
+    Returns the opening and the closing brackets of the container and the instructions writing its items.
+    """
+    if isinstance(target, dict):
+        return "{", "}", _get_dict_items(target)
+    if isinstance(target, list):
+        return "[", "]", _get_collection_items(target)
+    if isinstance(target, set):
+        return "{", "}", _get_collection_items(target)
+    if isinstance(target, tuple):
+        return "(", ")", _get_collection_items(target)
+    raise ValueError(f"Type '{type(target)}' is not serializable")
+
+
+def _serialize_iteratively(serializable_obj: Any) -> str:
+    """
+    Serialize arbitrary nested structures using an explicit stack of instructions.
+
+    Every instruction is a tuple of kind and payload:
+    - ``_VALUE`` - the payload is an object to serialize,
+    - ``_TEXT`` - the payload is a text to write to the output,
+    - ``_LEAVE`` - the payload is the id of a container that has been fully written.
+
+    Scalars are serialized as soon as their container is visited, so only containers go through the stack.
+    """
+    buf: List[str] = []
+    markers: Set[int] = set()
+    stack: List[Instruction] = [(_VALUE, serializable_obj)]
+
+    while stack:
+        kind, target = stack.pop()
+        if kind == _TEXT:
+            buf.append(target)
+            continue
+        if kind == _LEAVE:
+            markers.remove(target)
+            continue
+
+        scalar = _serialize_scalar(target)
+        if scalar is not None:
+            buf.append(scalar)
+            continue
+        if isinstance(target, set) and not target:
+            buf.append("set()")
+            continue
 
-    def serialize_recursively(target: Any, markers: Set[int]) -> str:
         marker_id = id(target)
         if marker_id in markers:
             raise ValueError("Circular reference detected")
+        opening, closing, items = _get_container(target)
         markers.add(marker_id)
+        buf.append(opening)
+        # The stack is LIFO, so everything that has to be written after the items is pushed first
+        stack.append((_LEAVE, marker_id))
+        stack.append((_TEXT, closing))
+        stack.extend(reversed(items))
 
-        if isinstance(target, str):
-            buf = f"{escape_string_with_python_escapes(target)}"
-        elif isinstance(target, dict):
-            buf = "{"
-            buf += ", ".join(
-                f"{serialize_recursively(key, markers)}: {serialize_recursively(value, markers)}"
-                for key, value in target.items()
-            )
-            buf += "}"
-        elif isinstance(target, list):
-            buf = "["
-            buf += ", ".join(serialize_recursively(item, markers) for item in target)
-            buf += "]"
-        elif isinstance(target, set):
-            if target:
-                buf = "{"
-                buf += ", ".join(serialize_recursively(item, markers) for item in target)
-                buf += "}"
-            else:
-                buf = "set()"
-        elif isinstance(target, tuple):
-            buf = "("
-            buf += ", ".join(serialize_recursively(item, markers) for item in target)
-            buf += ")"
-        elif target is True:
-            buf = "True"
-        elif target is False:
-            buf = "False"
-        elif target is None:
-            buf = "None"
-        else:
-            raise ValueError(f"Type '{type(target)}' is not serializable")
-
-        markers.remove(marker_id)
-        return buf
-
-    return serialize_recursively(serializable_obj, set())
+    return "".join(buf)
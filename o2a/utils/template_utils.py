@@ -32,6 +32,11 @@ TEMPLATE_ENV.filters["to_var"] = convert_to_python_variable
 
 TEMPLATE_ENV.filters["to_python"] = python_serializer.serialize
 
+# Names of the variables with the properties used by the tasks. The tasks of inlined subworkflows
+# use the variables with the properties of their subworkflows instead.
+TEMPLATE_ENV.globals["config_var"] = "CONFIG"
+TEMPLATE_ENV.globals["job_properties_var"] = "JOB_PROPS"
+
 
 def render_template(template_name: str, *args, **kwargs) -> str:
     """Render Jinja template"""
@@ -40,3 +45,10 @@ def render_template(template_name: str, *args, **kwargs) -> str:
         TEMPLATE_CACHES[template_name] = template
     content: str = TEMPLATE_CACHES[template_name].render(*args, **kwargs)
     return content
+
+
+def preload_templates() -> None:
+    """Compile all the templates, so that the first conversion does not pay for it"""
+    for template_name in TEMPLATE_ENV.list_templates():
+        if template_name not in TEMPLATE_CACHES:
+            TEMPLATE_CACHES[template_name] = TEMPLATE_ENV.get_template(template_name)
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Verifies that the generated DAG files load in Airflow
+
+Every file is loaded into a separate DagBag in a pool of worker processes. The report contains
+the import errors, the number of DAGs and tasks and the parse time of every file.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from airflow.models import DagBag
+
+
+class FileReport(NamedTuple):
+    """
+    Result of loading a single DAG file.
+
+    :param path: path of the file
+    :param dag_ids: IDs of the loaded DAGs, including the sub-DAGs
+    :param task_count: number of tasks of all the loaded DAGs
+    :param import_errors: import errors by the path of the file that failed
+    :param parse_time: time of loading the file in seconds
+    """
+
+    path: str
+    dag_ids: List[str]
+    task_count: int
+    import_errors: Dict[str, str]
+    parse_time: float
+
+
+def find_dag_files(paths: Iterable[str]) -> List[str]:
+    """
+    Returns the Python files given directly or found in the given directories.
+
+    The sub-DAG files are skipped, as they are loaded together with the DAGs that use them.
+    """
+    dag_files: List[str] = []
+    for path in paths:
+        if os.path.isfile(path):
+            dag_files.append(os.path.abspath(path))
+            continue
+        for root, _, file_names in os.walk(path):
+            dag_files.extend(
+                os.path.abspath(os.path.join(root, file_name))
+                for file_name in sorted(file_names)
+                if file_name.endswith(".py") and not file_name.startswith("subdag_")
+            )
+    return dag_files
+
+
+def verify_file(path: str) -> FileReport:
+    """
+    Loads the DAG file into a DagBag. It is run in the worker processes.
+    """
+    directory = os.path.dirname(path)
+    # The DAGs import the sub-DAG modules from their own directory
+    sys.path.insert(0, directory)
+    try:
+        start = time.monotonic()
+        dag_bag = DagBag(dag_folder=path, include_examples=False, safe_mode=False)
+        parse_time = time.monotonic() - start
+    finally:
+        sys.path.remove(directory)
+        _forget_modules(directory)
+    return FileReport(
+        path=path,
+        dag_ids=sorted(dag_bag.dag_ids),
+        task_count=sum(len(dag.tasks) for dag in dag_bag.dags.values()),
+        import_errors=dict(dag_bag.import_errors),
+        parse_time=parse_time,
+    )
+
+
+def _forget_modules(directory: str) -> None:
+    # The sub-DAG modules of different DAGs can have the same names
+    for name, module in list(sys.modules.items()):
+        module_file = getattr(module, "__file__", None) or ""
+        if module_file.startswith(directory + os.sep):
+            del sys.modules[name]
+
+
+def verify_files(paths: List[str], workers: Optional[int] = None) -> List[FileReport]:
+    """
+    Loads the DAG files in a pool of worker processes. The reports are in the order of the paths.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(verify_file, paths))
+
+
+def format_report(reports: List[FileReport]) -> str:
+    """
+    Returns the human-readable summary of the reports.
+    """
+    lines = []
+    for report in reports:
+        status = "ERROR" if report.import_errors else "OK"
+        lines.append(
+            f"{status:5} {report.parse_time:8.3f}s {len(report.dag_ids):3} DAGs "
+            f"{report.task_count:5} tasks  {report.path}"
+        )
+        for error_path, error in report.import_errors.items():
+            lines.append(f"      {error_path}:")
+            lines.extend(f"        {line}" for line in error.strip().splitlines())
+    failed = sum(1 for report in reports if report.import_errors)
+    total_time = sum(report.parse_time for report in reports)
+    lines.append(f"{len(reports)} files, {failed} with import errors, total parse time {total_time:.3f}s")
+    return "\n".join(lines)
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(
+        prog="o2a-verify", description="Verify that the generated DAG files load in Apache Airflow."
+    )
+    parser.add_argument("paths", help="DAG files or directories with DAG files", nargs="+")
+    parser.add_argument(
+        "-w", "--workers", help="Number of worker processes [defaults to the number of CPUs]", type=int
+    )
+    parser.add_argument(
+        "-t", "--max-parse-time", help="Fails if any file takes longer to parse in seconds", type=float
+    )
+    parser.add_argument("-j", "--json", help="Prints the reports as JSON", action="store_true")
+    return parser.parse_args(args)
+
+
+# pylint: disable=missing-docstring
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    reports = verify_files(find_dag_files(args.paths), workers=args.workers)
+
+    if args.json:
+        print(json.dumps([report._asdict() for report in reports], indent=2))
+    else:
+        print(format_report(reports))
+
+    exit_code = 0
+    if any(report.import_errors for report in reports):
+        exit_code = 1
+    if args.max_parse_time is not None:
+        slow_reports = [report for report in reports if report.parse_time > args.max_parse_time]
+        for report in slow_reports:
+            print(
+                f"{report.path} took {report.parse_time:.3f}s to parse (limit: {args.max_parse_time}s)",
+                file=sys.stderr,
+            )
+        if slow_reports:
+            exit_code = 1
+    return exit_code
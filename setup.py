@@ -37,7 +37,7 @@ setup(
     setup_requires=["pytest-runner"],
     install_requires=REQUIREMENTS,
     tests_require=["pytest"],
-    scripts=["bin/o2a", "bin/o2a-validate-workflows"],
+    scripts=["bin/o2a", "bin/o2a-validate-workflows", "bin/o2a-verify", "bin/o2a-survey"],
     packages=["o2a"],
     classifiers=[
         "Programming Language :: Python :: 3.6",
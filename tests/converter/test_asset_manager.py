@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests Asset Manager"""
+import contextlib
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from parameterized import parameterized
+
+from o2a.converter.asset_manager import AssetManager
+
+
+class AssetManagerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.input_directory_path = os.path.join(self.directory.name, "input")
+        self.output_directory_path = os.path.join(self.directory.name, "output")
+        os.makedirs(self.input_directory_path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _create_input_file(self, name: str, content: str) -> str:
+        path = os.path.join(self.input_directory_path, name)
+        with open(path, "w") as file:
+            file.write(content)
+        return path
+
+    def _read_output_file(self, name: str) -> str:
+        with open(os.path.join(self.output_directory_path, name)) as file:
+            return file.read()
+
+    @parameterized.expand([("copy",), ("reflink",), ("hardlink",)])
+    def test_copy_assets(self, link_mode):
+        script = self._create_input_file("script.q", "SELECT 1;")
+        asset_manager = AssetManager(link_mode=link_mode)
+        asset_manager.add_asset(script, os.path.join(self.output_directory_path, "a/script.q"))
+        asset_manager.add_asset(script, os.path.join(self.output_directory_path, "b/script.q"))
+
+        asset_manager.copy_assets()
+
+        self.assertEqual("SELECT 1;", self._read_output_file("a/script.q"))
+        self.assertEqual("SELECT 1;", self._read_output_file("b/script.q"))
+        self.assertEqual({}, asset_manager.assets)
+
+    def test_copy_assets_with_header(self):
+        script = self._create_input_file("id.pig", "A = LOAD 'input';\n")
+        asset_manager = AssetManager()
+        asset_manager.add_asset(script, os.path.join(self.output_directory_path, "id.pig"), header="set x;\n")
+
+        asset_manager.copy_assets()
+
+        self.assertEqual("set x;\nA = LOAD 'input';\n", self._read_output_file("id.pig"))
+
+    @parameterized.expand(
+        [
+            ("copy_file_range", [], False),
+            ("sendfile", ["copy_file_range"], False),
+            ("chunks", ["copy_file_range", "sendfile"], True),
+        ]
+    )
+    @mock.patch("o2a.converter.asset_manager.COPY_CHUNK_SIZE", 7)
+    def test_copy_assets_with_header_should_stream_source(self, _, failing_functions, copied_in_chunks):
+        content = "".join(f"A{i} = LOAD 'input{i}';\n" for i in range(1000))
+        script = self._create_input_file("id.pig", content)
+        asset_manager = AssetManager()
+        asset_manager.add_asset(script, os.path.join(self.output_directory_path, "id.pig"), header="set x;\n")
+
+        with contextlib.ExitStack() as stack:
+            for name in failing_functions:
+                stack.enter_context(mock.patch(f"o2a.converter.asset_manager.os.{name}", side_effect=OSError))
+            copyfileobj = stack.enter_context(
+                mock.patch("o2a.converter.asset_manager.shutil.copyfileobj", wraps=shutil.copyfileobj)
+            )
+            asset_manager.copy_assets()
+
+        self.assertEqual(copied_in_chunks, copyfileobj.called)
+        self.assertEqual("set x;\n" + content, self._read_output_file("id.pig"))
+
+    def test_copy_assets_should_copy_same_content_once(self):
+        first = self._create_input_file("first.q", "SELECT 1;")
+        second = self._create_input_file("second.q", "SELECT 1;")
+        other = self._create_input_file("other.q", "SELECT 2;")
+        asset_manager = AssetManager(link_mode="copy")
+        asset_manager.add_asset(first, os.path.join(self.output_directory_path, "first.q"))
+        asset_manager.add_asset(second, os.path.join(self.output_directory_path, "second.q"))
+        asset_manager.add_asset(other, os.path.join(self.output_directory_path, "other.q"))
+
+        with mock.patch.object(asset_manager, "_copy_asset", wraps=asset_manager._copy_asset) as copy_asset:
+            asset_manager.copy_assets()
+
+        self.assertEqual(2, copy_asset.call_count)
+        self.assertEqual("SELECT 1;", self._read_output_file("first.q"))
+        self.assertEqual("SELECT 1;", self._read_output_file("second.q"))
+        self.assertEqual("SELECT 2;", self._read_output_file("other.q"))
+
+    def test_copy_assets_should_not_merge_assets_with_different_headers(self):
+        script = self._create_input_file("id.pig", "A = LOAD 'input';\n")
+        asset_manager = AssetManager()
+        asset_manager.add_asset(script, os.path.join(self.output_directory_path, "a.pig"), header="set a;\n")
+        asset_manager.add_asset(script, os.path.join(self.output_directory_path, "b.pig"), header="set b;\n")
+        asset_manager.add_asset(script, os.path.join(self.output_directory_path, "c.pig"))
+
+        asset_manager.copy_assets()
+
+        self.assertEqual("set a;\nA = LOAD 'input';\n", self._read_output_file("a.pig"))
+        self.assertEqual("set b;\nA = LOAD 'input';\n", self._read_output_file("b.pig"))
+        self.assertEqual("A = LOAD 'input';\n", self._read_output_file("c.pig"))
+
+    def test_add_asset_should_replace_asset_with_same_destination(self):
+        first = self._create_input_file("first.q", "SELECT 1;")
+        second = self._create_input_file("second.q", "SELECT 2;")
+        asset_manager = AssetManager()
+        asset_manager.add_asset(first, os.path.join(self.output_directory_path, "script.q"))
+        asset_manager.add_asset(second, os.path.join(self.output_directory_path, "script.q"))
+
+        asset_manager.copy_assets()
+
+        self.assertEqual("SELECT 2;", self._read_output_file("script.q"))
+
+    def test_copy_assets_should_overwrite_existing_files(self):
+        script = self._create_input_file("script.q", "SELECT 1;")
+        os.makedirs(self.output_directory_path)
+        with open(os.path.join(self.output_directory_path, "script.q"), "w") as file:
+            file.write("SELECT 0;")
+        asset_manager = AssetManager(link_mode="hardlink")
+        asset_manager.add_asset(script, os.path.join(self.output_directory_path, "script.q"))
+
+        asset_manager.copy_assets()
+
+        self.assertEqual("SELECT 1;", self._read_output_file("script.q"))
+
+    def test_should_raise_exception_on_unknown_link_mode(self):
+        with self.assertRaisesRegex(ValueError, "Unknown link mode: symlink"):
+            AssetManager(link_mode="symlink")
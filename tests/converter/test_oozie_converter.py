@@ -13,12 +13,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Tests Oozie Converter"""
-
+import tempfile
 from unittest import mock, TestCase
 from xml.etree.ElementTree import Element
 from xml.etree import ElementTree as ET
 
-from o2a import o2a
+from parameterized import parameterized
+
+from o2a import cli
+from o2a.converter.conversion_options import ConversionOptions
 from o2a.converter.oozie_converter import OozieConverter
 from o2a.converter.parsed_action_node import ParsedActionNode
 
@@ -29,23 +32,118 @@ from o2a.mappers.dummy_mapper import DummyMapper
 from o2a.converter import parsed_action_node
 from o2a.converter.mappers import ACTION_MAP
 from o2a.converter.relation import Relation
+from o2a.converter.renderers import DotRenderer, JsonRenderer, PythonRenderer
 
 from o2a.mappers import dummy_mapper
+from o2a.transformers.collapse_dummy_transformer import CollapseDummyTransformer
+from o2a.transformers.merge_prepare_transformer import MergePrepareTransformer
 
 
 class TestOozieConverter(TestCase):
     def test_parse_args_input_output_file(self):
         input_dir = "/tmp/does.not.exist/"
         output_dir = "/tmp/out/"
-        args = o2a.parse_args(["-i", input_dir, "-o", output_dir])
+        args = cli.parse_args(["-i", input_dir, "-o", output_dir])
         self.assertEqual(args.input_directory_path, input_dir)
         self.assertEqual(args.output_directory_path, output_dir)
 
+    def test_parse_args_link_mode(self):
+        input_dir = "/tmp/does.not.exist"
+        output_dir = "/tmp/out/"
+        args = cli.parse_args(["-i", input_dir, "-o", output_dir])
+        self.assertEqual(args.link_mode, "reflink")
+        args = cli.parse_args(["-i", input_dir, "-o", output_dir, "-l", "hardlink"])
+        self.assertEqual(args.link_mode, "hardlink")
+
+    def test_parse_args_output_format(self):
+        input_dir = "/tmp/does.not.exist"
+        output_dir = "/tmp/out/"
+        args = cli.parse_args(["-i", input_dir, "-o", output_dir, "-j"])
+        self.assertTrue(args.json)
+        self.assertFalse(args.dot)
+        with self.assertRaises(SystemExit), mock.patch("sys.stderr"):
+            cli.parse_args(["-i", input_dir, "-o", output_dir, "-j", "-d"])
+
+    @parameterized.expand([([], PythonRenderer), (["-d"], DotRenderer), (["-j"], JsonRenderer)])
+    def test_get_renderer_class(self, flags, expected_renderer_class):
+        args = cli.parse_args(["-i", "/tmp/does.not.exist", "-o", "/tmp/out/", *flags])
+        self.assertEqual(expected_renderer_class, cli.get_renderer_class(args))
+
+    @mock.patch("o2a.cli.get_o2a_validate_workflows_script", return_value=None)
+    @mock.patch("o2a.cli.OozieConverter")
+    def test_convert_should_pass_poke_interval(self, converter_mock, _):
+        with tempfile.TemporaryDirectory() as output_dir:
+            args = cli.parse_args(["-i", "/tmp/does.not.exist", "-o", output_dir, "-r", "-p", "15"])
+            with self.assertLogs(level="WARNING"):
+                cli.convert(args)
+
+        (transformer,) = converter_mock.call_args[1]["options"].relation_transformers
+        self.assertEqual(15, transformer.poke_interval)
+
+    def test_parse_args_watch(self):
+        input_dir = "/tmp/does.not.exist"
+        output_dir = "/tmp/out/"
+        self.assertFalse(cli.parse_args(["-i", input_dir, "-o", output_dir]).watch)
+        self.assertTrue(cli.parse_args(["-i", input_dir, "-o", output_dir, "--watch"]).watch)
+
+    @parameterized.expand(
+        [
+            ([], "task_transformers", []),
+            (["--merge-prepare"], "task_transformers", [MergePrepareTransformer]),
+            ([], "relation_transformers", []),
+            (["--collapse-dummy-tasks"], "relation_transformers", [CollapseDummyTransformer]),
+        ]
+    )
+    @mock.patch("o2a.cli.get_o2a_validate_workflows_script", return_value=None)
+    @mock.patch("o2a.cli.OozieConverter")
+    def test_convert_optional_transformers(self, flags, argument, expected_transformers, converter_mock, _):
+        with tempfile.TemporaryDirectory() as output_dir:
+            args = cli.parse_args(["-i", "/tmp/does.not.exist", "-o", output_dir, *flags])
+            with self.assertLogs(level="WARNING"):
+                cli.convert(args)
+
+        transformers = getattr(converter_mock.call_args[1]["options"], argument)
+        self.assertEqual(expected_transformers, [type(transformer) for transformer in transformers])
+
+    @mock.patch("o2a.cli.convert")
+    @mock.patch("o2a.cli.file_watcher.watch")
+    def test_watch(self, watch_mock, convert_mock):
+        args = cli.parse_args(["-i", "/input/demo", "-o", "/output/demo", "--watch"])
+        converter = mock.Mock(**{"get_subworkflow_app_paths.return_value": ["/input/childwf"]})
+        convert_mock.return_value.get_subworkflow_app_paths.return_value = []
+
+        cli.watch(args, converter)
+
+        watch_mock.assert_called_once_with(
+            get_directories=mock.ANY, on_change=mock.ANY, excluded_directories=["/output/demo"]
+        )
+        get_directories = watch_mock.call_args[1]["get_directories"]
+        on_change = watch_mock.call_args[1]["on_change"]
+        self.assertEqual(["/input/demo", "/input/childwf"], get_directories())
+
+        on_change({"/input/childwf/hdfs/workflow.xml"})
+        convert_mock.assert_called_once_with(args)
+        self.assertEqual(["/input/demo"], get_directories())
+
+        convert_mock.side_effect = SystemExit(1)
+        with self.assertLogs(level="ERROR"):
+            on_change({"/input/demo/job.properties"})
+        self.assertEqual(["/input/demo"], get_directories())
+
+    def test_get_subworkflow_app_paths(self):
+        converter = self._create_converter()
+        converter.workflow.nodes = dict(
+            subwf=mock.Mock(mapper=mock.Mock(subworkflow_app_paths=["/input/childwf", "/input/pig"])),
+            dummy=ParsedActionNode(DummyMapper(oozie_node=Element("dummy"), name="dummy", dag_name="DAG")),
+        )
+
+        self.assertEqual(["/input/childwf", "/input/pig"], converter.get_subworkflow_app_paths())
+
     def test_parse_args_user(self):
         input_dir = "/tmp/does.not.exist"
         output_dir = "/tmp/out/"
         user = "oozie_test"
-        args = o2a.parse_args(["-i", input_dir, "-o", output_dir, "-u", user])
+        args = cli.parse_args(["-i", input_dir, "-o", output_dir, "-u", user])
         self.assertEqual(args.user, user)
 
     @mock.patch("o2a.converter.oozie_converter.parser.OozieParser")
@@ -54,6 +152,7 @@ class TestOozieConverter(TestCase):
         converter = self._create_converter()
         workflow = self._create_workflow()
         converter.workflow = workflow
+        converter.asset_manager = mock.MagicMock()
 
         # When
         converter.convert()
@@ -64,6 +163,7 @@ class TestOozieConverter(TestCase):
         converter.renderer.create_workflow_file.assert_called_once_with(
             workflow=workflow, props=converter.props
         )
+        converter.asset_manager.copy_assets.assert_called_once_with()
 
     @mock.patch("o2a.converter.oozie_converter.parser.OozieParser")
     def test_convert_as_subworkflow(self, oozie_parser_mock):
@@ -71,6 +171,7 @@ class TestOozieConverter(TestCase):
         converter = self._create_converter()
         workflow = self._create_workflow()
         converter.workflow = workflow
+        converter.asset_manager = mock.MagicMock()
 
         # When
         converter.convert(as_subworkflow=True)
@@ -81,6 +182,7 @@ class TestOozieConverter(TestCase):
         converter.renderer.create_subworkflow_file.assert_called_once_with(
             workflow=workflow, props=converter.props
         )
+        converter.asset_manager.copy_assets.assert_not_called()
 
     def test_convert_nodes(self):
         converter = self._create_converter()
@@ -141,20 +243,59 @@ class TestOozieConverter(TestCase):
         transformer_1.process_workflow.assert_called_once_with(workflow)
         transformer_2.process_workflow.assert_called_once_with(workflow)
 
+    def test_apply_task_transformers(self):
+        workflow = self._create_workflow()
+
+        transformer_1 = mock.MagicMock()
+        transformer_2 = mock.MagicMock()
+
+        converter = self._create_converter()
+        converter.workflow = workflow
+
+        converter.options = ConversionOptions(task_transformers=(transformer_1, transformer_2))
+
+        converter.apply_task_transformers()
+
+        transformer_1.process_workflow.assert_called_once_with(workflow)
+        transformer_2.process_workflow.assert_called_once_with(workflow)
+
+    def test_apply_relation_transformers(self):
+        workflow = self._create_workflow()
+
+        transformer_1 = mock.MagicMock()
+        transformer_2 = mock.MagicMock()
+
+        converter = self._create_converter()
+        converter.workflow = workflow
+
+        converter.options = ConversionOptions(relation_transformers=(transformer_1, transformer_2))
+
+        converter.apply_relation_transformers()
+
+        transformer_1.process_workflow.assert_called_once_with(workflow)
+        transformer_2.process_workflow.assert_called_once_with(workflow)
+
     def test_copy_extra_assets(self):
         converter = self._create_converter()
 
         mock_1 = mock.MagicMock()
         mock_2 = mock.MagicMock()
 
+        converter.asset_manager = mock.MagicMock()
+
         converter.copy_extra_assets(dict(mock_1=mock_1, mock_2=mock_2))
 
         mock_1.mapper.copy_extra_assets.assert_called_once_with(
-            input_directory_path="/input_directory_path/hdfs", output_directory_path="/tmp"
+            input_directory_path="/input_directory_path/hdfs",
+            output_directory_path="/tmp",
+            asset_manager=converter.asset_manager,
         )
         mock_2.mapper.copy_extra_assets.assert_called_once_with(
-            input_directory_path="/input_directory_path/hdfs", output_directory_path="/tmp"
+            input_directory_path="/input_directory_path/hdfs",
+            output_directory_path="/tmp",
+            asset_manager=converter.asset_manager,
         )
+        converter.asset_manager.copy_assets.assert_not_called()
 
     def test_convert_relations(self):
         oozie_node = ET.Element("dummy")
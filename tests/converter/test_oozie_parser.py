@@ -310,6 +310,22 @@ class TestOozieParser(unittest.TestCase):
         self.parser.parse_node(root, decision)
         decision_mock.assert_called_once_with(decision)
 
+    @parameterized.expand(
+        [
+            ("action", "action"),
+            ("start", "start"),
+            ("kill", "kill"),
+            ("end", "end"),
+            ("fork", "fork"),
+            ("join", "join"),
+            ("decision", "decision"),
+            ("global", None),
+            ("credentials", None),
+        ]
+    )
+    def test_get_node_kind(self, tag, expected_kind):
+        self.assertEqual(expected_kind, parser.get_node_kind(ET.Element(tag)))
+
 
 class WorkflowTestCase(NamedTuple):
     name: str
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests relation"""
+import unittest
+from copy import deepcopy
+
+from o2a.converter.relation import Relation
+
+
+class RelationTestCase(unittest.TestCase):
+    def test_should_intern_task_ids(self):
+        relation = Relation(from_task_id="".join(["task", "_a"]), to_task_id="".join(["task", "_b"]))
+        other = Relation(from_task_id="".join(["task", "_a"]), to_task_id="".join(["task", "_b"]))
+
+        self.assertIs(relation.from_task_id, other.from_task_id)
+        self.assertIs(relation.to_task_id, other.to_task_id)
+
+    def test_should_be_hashable_tuple(self):
+        relation = Relation(from_task_id="task_a", to_task_id="task_b")
+
+        self.assertEqual(("task_a", "task_b", False), relation)
+        self.assertEqual(hash(("task_a", "task_b", False)), hash(relation))
+        self.assertEqual({relation}, {Relation(from_task_id="task_a", to_task_id="task_b", is_error=False)})
+        self.assertNotEqual(relation, Relation(from_task_id="task_a", to_task_id="task_b", is_error=True))
+
+    def test_should_be_immutable(self):
+        relation = Relation(from_task_id="task_a", to_task_id="task_b")
+
+        with self.assertRaises(AttributeError):
+            relation.from_task_id = "task_c"  # type: ignore
+        with self.assertRaises(AttributeError):
+            relation.extra = "value"  # type: ignore
+
+    def test_deepcopy(self):
+        relation = Relation(from_task_id="task_a", to_task_id="task_b", is_error=True)
+
+        self.assertEqual(relation, deepcopy(relation))
+        self.assertIsInstance(deepcopy(relation), Relation)
+
+    def test_repr(self):
+        self.assertEqual(
+            "Relation(from_task_id='task_a', to_task_id='task_b', is_error=False)",
+            repr(Relation(from_task_id="task_a", to_task_id="task_b")),
+        )
@@ -14,7 +14,10 @@
 # limitations under the License.
 """Tests for renderers"""
 # pylint: disable=unused-argument
+import json
+import os
 import sys
+import tempfile
 import unittest
 from unittest import mock
 from pathlib import Path
@@ -22,7 +25,8 @@ from xml.etree.ElementTree import Element
 
 from o2a.converter.parsed_action_node import ParsedActionNode
 from o2a.converter.relation import Relation
-from o2a.converter.renderers import PythonRenderer, AutoflakeArgs, DotRenderer
+from o2a.converter.renderers import PythonRenderer, AutoflakeArgs, DotRenderer, JsonRenderer
+from o2a.converter.task import Task
 from o2a.converter.workflow import Workflow
 from o2a.mappers.dummy_mapper import DummyMapper
 from o2a.o2a_libs.property_utils import PropertySet
@@ -206,3 +210,93 @@ class DotRendererTestCase(unittest.TestCase):
     @staticmethod
     def _create_renderer():
         return DotRenderer(schedule_interval=None, start_days_ago=None, output_directory_path="/tmp/output")
+
+
+class JsonRendererTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.renderer = JsonRenderer(
+            schedule_interval=None, start_days_ago=None, output_directory_path=self.directory.name
+        )
+        self.workflow = _create_workflow()
+        node = self.workflow.nodes["AAA"]
+        node.tasks = [
+            Task(task_id="DAG_NAME_A_prepare", template_name="prepare.tpl"),
+            Task(task_id="DAG_NAME_A", template_name="dummy.tpl", trigger_rule="one_success"),
+        ]
+        node.relations = [Relation(from_task_id="DAG_NAME_A_prepare", to_task_id="DAG_NAME_A")]
+        node.downstream_names = ["BBB"]
+        node.is_ok = True
+        self.props = PropertySet(config=dict(), job_properties=dict())
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _read_records(self, file_name):
+        with open(os.path.join(self.directory.name, file_name)) as file:
+            return [json.loads(line) for line in file]
+
+    def test_create_workflow_file_should_write_records(self):
+        self.renderer.create_workflow_file(self.workflow, props=self.props)
+
+        self.assertEqual(
+            [
+                {
+                    "type": "workflow",
+                    "dag_name": "DAG_NAME",
+                    "is_subworkflow": False,
+                    "dependencies": ["import IMPORT"],
+                },
+                {
+                    "type": "node",
+                    "dag_name": "DAG_NAME",
+                    "name": "DAG_NAME_A",
+                    "mapper_type": "DummyMapper",
+                    "downstream_names": ["BBB"],
+                    "error_downstream_name": None,
+                    "is_ok": True,
+                    "is_error": False,
+                },
+                {
+                    "type": "task",
+                    "dag_name": "DAG_NAME",
+                    "node": "DAG_NAME_A",
+                    "task_id": "DAG_NAME_A_prepare",
+                    "template_name": "prepare.tpl",
+                    "trigger_rule": "all_success",
+                },
+                {
+                    "type": "task",
+                    "dag_name": "DAG_NAME",
+                    "node": "DAG_NAME_A",
+                    "task_id": "DAG_NAME_A",
+                    "template_name": "dummy.tpl",
+                    "trigger_rule": "one_success",
+                },
+                {
+                    "type": "relation",
+                    "dag_name": "DAG_NAME",
+                    "node": "DAG_NAME_A",
+                    "from_task_id": "DAG_NAME_A_prepare",
+                    "to_task_id": "DAG_NAME_A",
+                    "is_error": False,
+                },
+                {
+                    "type": "relation",
+                    "dag_name": "DAG_NAME",
+                    "node": None,
+                    "from_task_id": "DAG_NAME_A",
+                    "to_task_id": "DAG_NAME_B",
+                    "is_error": False,
+                },
+            ],
+            self._read_records("DAG_NAME.ndjson"),
+        )
+
+    def test_create_subworkflow_file_should_write_records(self):
+        self.renderer.create_subworkflow_file(self.workflow, props=self.props)
+
+        records = self._read_records("subdag_DAG_NAME.ndjson")
+        self.assertEqual("workflow", records[0]["type"])
+        self.assertTrue(records[0]["is_subworkflow"])
+        self.assertEqual(6, len(records))
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests snapshots of converted workflows"""
+import io
+import pickle
+import unittest
+from collections import OrderedDict
+from xml.etree.ElementTree import Element
+
+from airflow.utils.trigger_rule import TriggerRule
+
+from o2a.converter import snapshot
+from o2a.converter.exceptions import SnapshotException
+from o2a.converter.parsed_action_node import ParsedActionNode
+from o2a.converter.relation import Relation
+from o2a.converter.renderers import DotRenderer, PythonRenderer
+from o2a.converter.task import Task
+from o2a.converter.workflow import Workflow
+from o2a.mappers.dummy_mapper import DummyMapper
+from o2a.o2a_libs.property_utils import PropertySet
+
+
+def _create_workflow(props: PropertySet) -> Workflow:
+    first_node = ParsedActionNode(
+        DummyMapper(Element("dummy"), name="first", dag_name="DAG_NAME"),
+        tasks=[
+            Task(task_id="first_prepare", template_name="dummy.tpl"),
+            Task(
+                task_id="first",
+                template_name="fs_op.tpl",
+                trigger_rule=TriggerRule.ONE_SUCCESS,
+                template_params=dict(pig_command="fs -ls /", action_node_properties={"key": "value"}),
+            ),
+        ],
+        relations=[Relation(from_task_id="first_prepare", to_task_id="first")],
+    )
+    first_node.downstream_names = ["second"]
+    first_node.error_xml = "second"
+    first_node.is_ok = True
+    second_node = ParsedActionNode(
+        DummyMapper(Element("decision"), name="second", dag_name="DAG_NAME"),
+        tasks=[
+            Task(
+                task_id="second",
+                template_name="decision.tpl",
+                template_params=dict(case_dict=OrderedDict([("{{ True }}", "first"), ("default", "end")])),
+            ),
+            Task(task_id="second_distcp", template_name="dummy.tpl", template_params=dict(props=props)),
+        ],
+    )
+    second_node.is_ok = True
+    second_node.is_error = True
+    return Workflow(
+        dag_name="DAG_NAME",
+        input_directory_path="/tmp/input",
+        output_directory_path="/tmp/output",
+        relations={
+            Relation(from_task_id="first", to_task_id="second"),
+            Relation(from_task_id="first", to_task_id="second", is_error=True),
+        },
+        nodes=OrderedDict(first=first_node, second=second_node),
+        dependencies={"import IMPORT", "from airflow.operators import dummy_operator"},
+    )
+
+
+class SnapshotTestCase(unittest.TestCase):
+    def setUp(self):
+        self.props = PropertySet(
+            job_properties={"user.name": "user"}, config={"key": "value"}, action_node_properties={"a": "b"}
+        )
+        self.workflow = _create_workflow(self.props)
+
+    def test_should_restore_workflow(self):
+        restored = snapshot.loads(snapshot.dumps(self.workflow, self.props))
+
+        self.assertEqual(self.props, restored.props)
+        self.assertEqual(self.workflow.dag_name, restored.workflow.dag_name)
+        self.assertEqual(self.workflow.relations, restored.workflow.relations)
+        self.assertEqual(self.workflow.dependencies, restored.workflow.dependencies)
+        self.assertEqual(list(self.workflow.nodes.keys()), list(restored.workflow.nodes.keys()))
+        for node in self.workflow.nodes.values():
+            restored_node = restored.workflow.nodes[node.name]
+            self.assertEqual(node.tasks, restored_node.tasks)
+            self.assertEqual(node.relations, restored_node.relations)
+            self.assertEqual(node.downstream_names, restored_node.downstream_names)
+            self.assertEqual(node.error_xml, restored_node.error_xml)
+            self.assertEqual(node.is_ok, restored_node.is_ok)
+            self.assertEqual(node.is_error, restored_node.is_error)
+            self.assertEqual("DummyMapper", restored_node.mapper.mapper_type)
+            self.assertEqual((node.tasks, node.relations), restored_node.mapper.to_tasks_and_relations())
+
+    def test_should_render_restored_workflow_in_the_same_way(self):
+        restored = snapshot.loads(snapshot.dumps(self.workflow, self.props))
+
+        # Relations are kept in a set, so they may be rendered in a different order
+        renderer = PythonRenderer("/tmp/output", schedule_interval=1, start_days_ago=1)
+        for template_name in ["workflow.tpl", "subworkflow.tpl"]:
+            self.assertEqual(
+                sorted(renderer._render_content(template_name, self.workflow, self.props).splitlines()),
+                sorted(
+                    renderer._render_content(template_name, restored.workflow, restored.props).splitlines()
+                ),
+            )
+        self.assertEqual(
+            sorted(DotRenderer._render_content("workflow_dot.tpl", self.workflow).splitlines()),
+            sorted(DotRenderer._render_content("workflow_dot.tpl", restored.workflow).splitlines()),
+        )
+
+    def test_should_preserve_shared_property_sets(self):
+        restored = snapshot.loads(snapshot.dumps(self.workflow, self.props))
+
+        second_distcp = restored.workflow.nodes["second"].tasks[1]
+        self.assertIs(restored.props, second_distcp.template_params["props"])
+        self.assertIsInstance(
+            restored.workflow.nodes["second"].tasks[0].template_params["case_dict"], OrderedDict
+        )
+
+    def test_should_use_file(self):
+        file = io.BytesIO()
+        snapshot.dump(self.workflow, self.props, file)
+        file.seek(0)
+
+        self.assertEqual(self.workflow.relations, snapshot.load(file).workflow.relations)
+
+    def test_should_raise_exception_on_invalid_header(self):
+        with self.assertRaisesRegex(SnapshotException, "not a workflow snapshot"):
+            snapshot.loads(b"O2A-IR\x00" + pickle.dumps({}))
+
+    def test_should_raise_exception_on_corrupted_data(self):
+        with self.assertRaisesRegex(SnapshotException, "corrupted"):
+            snapshot.loads(snapshot.dumps(self.workflow, self.props)[:-10])
+
+    def test_should_raise_exception_on_forbidden_type(self):
+        data = snapshot.SNAPSHOT_HEADER + pickle.dumps({"version": 1, "props": Element("dummy")})
+
+        with self.assertRaisesRegex(
+            SnapshotException, "Forbidden type in snapshot: xml.etree.ElementTree.Element"
+        ):
+            snapshot.loads(data)
+
+    def test_should_raise_exception_on_unsupported_version(self):
+        with self.assertRaisesRegex(SnapshotException, "Unsupported snapshot version: 2"):
+            snapshot.workflow_from_ir({"version": 2})
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests task"""
+import unittest
+from copy import deepcopy
+
+from airflow.utils.trigger_rule import TriggerRule
+
+from o2a.converter.task import Task
+
+
+class TaskTestCase(unittest.TestCase):
+    def test_should_intern_task_id_and_template_name(self):
+        task = Task(task_id="".join(["task", "_a"]), template_name="".join(["dummy", ".tpl"]))
+        other = Task(task_id="".join(["task", "_a"]), template_name="".join(["dummy", ".tpl"]))
+
+        self.assertIs(task.task_id, other.task_id)
+        self.assertIs(task.template_name, other.template_name)
+
+    def test_should_not_accept_unknown_attributes(self):
+        task = Task(task_id="task_a", template_name="dummy.tpl")
+
+        with self.assertRaises(AttributeError):
+            task.extra = "value"  # type: ignore
+
+    def test_eq(self):
+        task = Task(task_id="task_a", template_name="dummy.tpl", template_params={"a": "b"})
+
+        self.assertEqual(task, Task(task_id="task_a", template_name="dummy.tpl", template_params={"a": "b"}))
+        self.assertEqual(task, deepcopy(task))
+        self.assertNotEqual(task, Task(task_id="task_a", template_name="dummy.tpl"))
+        self.assertNotEqual(
+            task,
+            Task(
+                task_id="task_a",
+                template_name="dummy.tpl",
+                trigger_rule=TriggerRule.DUMMY,
+                template_params={"a": "b"},
+            ),
+        )
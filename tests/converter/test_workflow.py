@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Workflow tests"""
+import unittest
+from unittest import mock
+
+from o2a.converter.parsed_action_node import ParsedActionNode
+from o2a.converter.relation import Relation
+from o2a.converter.task import Task
+from o2a.converter.workflow import Workflow
+from o2a.mappers.base_mapper import BaseMapper
+
+
+def _create_node(name: str) -> ParsedActionNode:
+    mapper = mock.Mock(spec=BaseMapper)
+    mapper.name = name
+    return ParsedActionNode(mapper=mapper)
+
+
+def _snapshot(workflow: Workflow):
+    return (
+        [
+            (name, list(node.downstream_names), node.error_xml, node.tasks)
+            for name, node in workflow.nodes.items()
+        ],
+        set(workflow.relations),
+    )
+
+
+class WorkflowUndoLogTest(unittest.TestCase):
+    def setUp(self):
+        self.workflow = Workflow(input_directory_path="", output_directory_path="", dag_name="DAG_NAME_B")
+        self.first_node = _create_node("first")
+        self.second_node = _create_node("second")
+        self.third_node = _create_node("third")
+        self.first_node.downstream_names = ["second", "third"]
+        self.first_node.error_xml = "third"
+        self.second_node.downstream_names = ["third"]
+        for node in (self.first_node, self.second_node, self.third_node):
+            self.workflow.nodes[node.name] = node
+        self.workflow.relations.add(Relation(from_task_id="first", to_task_id="second"))
+
+    def test_should_not_record_without_savepoint(self):
+        self.workflow.remove_node(self.second_node)
+
+        self.assertEqual([], self.workflow._undo_log)  # pylint: disable=protected-access
+        with self.assertRaises(ValueError):
+            self.workflow.rollback()
+
+    def test_should_rollback_removed_node(self):
+        expected = _snapshot(self.workflow)
+
+        self.workflow.savepoint()
+        self.workflow.remove_node(self.third_node)
+        self.workflow.remove_node(self.first_node)
+        self.assertEqual(["second"], list(self.workflow.nodes.keys()))
+        self.workflow.rollback()
+
+        self.assertEqual(expected, _snapshot(self.workflow))
+
+    def test_should_rollback_added_nodes(self):
+        expected = _snapshot(self.workflow)
+        replacing_node = _create_node("second")
+
+        self.workflow.savepoint()
+        self.workflow.add_node(replacing_node)
+        self.workflow.add_node(_create_node("fourth"))
+        self.assertIs(replacing_node, self.workflow.nodes["second"])
+        self.workflow.rollback()
+
+        self.assertEqual(expected, _snapshot(self.workflow))
+        self.assertIs(self.second_node, self.workflow.nodes["second"])
+
+    def test_should_rollback_edges_relations_and_tasks(self):
+        expected = _snapshot(self.workflow)
+
+        self.workflow.savepoint()
+        self.workflow.remove_downstream(self.first_node, "second")
+        self.workflow.add_downstream(self.third_node, "first")
+        self.workflow.set_error_downstream(self.second_node, "first")
+        self.workflow.add_node(_create_node("fourth"))
+        self.workflow.add_relation(Relation(from_task_id="second", to_task_id="third"))
+        self.workflow.remove_relation(Relation(from_task_id="first", to_task_id="second"))
+        self.workflow.replace_tasks(self.first_node, [Task(task_id="first", template_name="dummy.tpl")], [])
+        self.workflow.rollback()
+
+        self.assertEqual(expected, _snapshot(self.workflow))
+
+    def test_should_rollback_to_given_savepoint(self):
+        self.workflow.savepoint()
+        self.workflow.remove_downstream(self.first_node, "second")
+        expected = _snapshot(self.workflow)
+        inner_savepoint = self.workflow.savepoint()
+        self.workflow.remove_node(self.third_node)
+        self.workflow.savepoint()
+        self.workflow.remove_node(self.second_node)
+
+        self.workflow.rollback(inner_savepoint)
+
+        self.assertEqual(expected, _snapshot(self.workflow))
+        self.assertEqual([0, inner_savepoint], self.workflow._savepoints)  # pylint: disable=protected-access
+
+    def test_should_commit(self):
+        self.workflow.savepoint()
+        self.workflow.remove_node(self.third_node)
+        self.workflow.commit()
+
+        self.assertEqual(["first", "second"], list(self.workflow.nodes.keys()))
+        with self.assertRaises(ValueError):
+            self.workflow.rollback()
+
+    def test_transaction_should_rollback_on_exception(self):
+        expected = _snapshot(self.workflow)
+
+        with self.assertRaises(KeyError):
+            with self.workflow.transaction():
+                self.workflow.remove_node(self.third_node)
+                raise KeyError("third")
+
+        self.assertEqual(expected, _snapshot(self.workflow))
+        self.assertEqual([], self.workflow._undo_log)  # pylint: disable=protected-access
+
+    def test_transaction_should_keep_changes(self):
+        with self.workflow.transaction():
+            self.workflow.remove_node(self.third_node)
+
+        self.assertEqual(["first", "second"], list(self.workflow.nodes.keys()))
+        self.assertEqual([], self.workflow._undo_log)  # pylint: disable=protected-access
+
+    def test_undo_log_should_not_affect_equality(self):
+        other = Workflow(input_directory_path="", output_directory_path="", dag_name="DAG_NAME_B")
+        for name, node in self.workflow.nodes.items():
+            other.nodes[name] = node
+        other.relations = set(self.workflow.relations)
+
+        self.workflow.savepoint()
+
+        self.assertEqual(other, self.workflow)
@@ -14,6 +14,7 @@
 # limitations under the License.
 """Tests prepare mixin"""
 import unittest
+from unittest import mock
 from xml.etree import ElementTree as ET
 
 
@@ -21,6 +22,7 @@ from o2a.converter.task import Task
 from o2a.mappers.base_mapper import BaseMapper
 from o2a.mappers.extensions.prepare_mapper_extension import PrepareMapperExtension
 from o2a.o2a_libs.property_utils import PropertySet
+from o2a.utils import xml_utils
 
 TEST_MAPPER_NAME = "mapper"
 
@@ -107,3 +109,27 @@ class TestPrepareMapperExtension(unittest.TestCase):
         self.assertFalse(extension.has_prepare())
         prepare_task = extension.get_prepare_task()
         self.assertIsNone(prepare_task)
+
+    def test_should_parse_prepare_once(self):
+        job_properties = {"nameNode": "hdfs://localhost:8020"}
+        # language=XML
+        pig_node_str = """
+<pig>
+    <name-node>hdfs://</name-node>
+    <prepare>
+        <delete path="${nameNode}/examples/output-data/demo/pig-node" />
+    </prepare>
+</pig>
+"""
+        pig_node = ET.fromstring(pig_node_str)
+        extension = self.get_mapper_extension(
+            node=pig_node, props=PropertySet(config={}, job_properties=job_properties)
+        )
+        with mock.patch(
+            "o2a.mappers.extensions.prepare_mapper_extension.xml_utils.find_node_by_tag",
+            wraps=xml_utils.find_node_by_tag,
+        ) as find_node_mock:
+            self.assertTrue(extension.has_prepare())
+            extension.get_prepare_task()
+            self.assertEqual(([self.delete_path1], []), extension.parse_prepare_node())
+        find_node_mock.assert_called_once()
@@ -19,8 +19,11 @@ from collections import OrderedDict
 
 from xml.etree import ElementTree as ET
 
+from parameterized import parameterized
+
 from o2a.converter.task import Task
 from o2a.mappers import decision_mapper
+from o2a.o2a_libs import el_basic_functions, el_operators
 
 
 class TestDecisionMapper(unittest.TestCase):
@@ -42,13 +45,12 @@ class TestDecisionMapper(unittest.TestCase):
         # make sure everything is getting initialized correctly
         self.assertEqual("test_id", mapper.name)
         self.assertEqual(self.decision_node, mapper.oozie_node)
-        # test conversion from Oozie EL to Jinja
-        self.assertEqual("first_not_null('', '')", next(iter(mapper.case_dict)))
+        # test conversion from Oozie EL to Python
+        self.assertEqual(
+            "el_operators.to_boolean(el_basic_functions.first_not_null('', ''))", next(iter(mapper.case_dict))
+        )
 
     def test_to_tasks_and_relations(self):
-        # TODO
-        # decision mapper does not have the required EL parsing to correctly get
-        # parsed, so once that is finished need to redo tests.
         mapper = self._get_decision_mapper()
 
         tasks, relations = mapper.to_tasks_and_relations()
@@ -61,7 +63,14 @@ class TestDecisionMapper(unittest.TestCase):
                     template_name="decision.tpl",
                     template_params={
                         "case_dict": OrderedDict(
-                            [("first_not_null('', '')", "task1"), ("'True'", "task2"), ("default", "task3")]
+                            [
+                                (
+                                    "el_operators.to_boolean(el_basic_functions.first_not_null('', ''))",
+                                    "task1",
+                                ),
+                                ("True", "task2"),
+                                ("default", "task3"),
+                            ]
                         )
                     },
                 )
@@ -69,6 +78,50 @@ class TestDecisionMapper(unittest.TestCase):
         )
         self.assertEqual(relations, [])
 
+    @parameterized.expand(
+        [
+            ("${size gt 10 * KB}", {"size": "20480"}, True),
+            ("${size gt 10 * KB}", {"size": "512"}, False),
+            ("${runStep}", {"runStep": "false"}, False),
+            ("${runStep}", {"runStep": "TRUE"}, True),
+            ("${not empty outputDir and mode eq 'full'}", {"outputDir": "/out", "mode": "full"}, True),
+            ("${wf:conf('mode') == 'full' || retries ge 3}", {"retries": "3"}, True),
+            ("${firstNotNull(mode, 'true')}", {"mode": ""}, True),
+            ("${mapreduce.job.queuename ne 'default'}", {"mapreduce.job.queuename": "default"}, False),
+            ("${count > 1 ? 'true' : 'false'}", {"count": "1"}, False),
+            ("false", {}, False),
+        ]
+    )
+    def test_should_evaluate_cases(self, case, properties, expected):
+        self.decision_node[0][0].text = case
+        mapper = self._get_decision_mapper()
+
+        expression = next(iter(mapper.case_dict))
+
+        result = eval(  # pylint: disable=eval-used
+            expression,
+            {"el_operators": el_operators, "el_basic_functions": el_basic_functions, "props": properties},
+        )
+        self.assertEqual(expected, result)
+
+    def test_should_take_first_of_duplicated_cases(self):
+        self.decision_node[0][1].text = self.decision_node[0][0].text
+        mapper = self._get_decision_mapper()
+
+        self.assertEqual(["task1", "task3"], list(mapper.case_dict.values()))
+
+    @parameterized.expand([("${fs:exists('/tmp')}",), ("${a ==}",), ("prefix ${a}",)])
+    def test_should_fail_on_evaluation_of_untranslatable_case(self, case):
+        self.decision_node[0][0].text = case
+
+        with self.assertLogs(level="WARNING"):
+            mapper = self._get_decision_mapper()
+
+        expression = next(iter(mapper.case_dict))
+        self.assertEqual(f"el_operators.unsupported({case!r})", expression)
+        with self.assertRaisesRegex(NotImplementedError, "is not supported"):
+            eval(expression, {"el_operators": el_operators})  # pylint: disable=eval-used
+
     def test_required_imports(self):
         mapper = self._get_decision_mapper()
         imps = mapper.required_imports()
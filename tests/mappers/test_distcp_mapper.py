@@ -18,7 +18,9 @@ from typing import Dict
 from xml.etree import ElementTree as ET
 from xml.etree.ElementTree import Element
 
+from parameterized import parameterized
 
+from o2a.converter.exceptions import ParseException
 from o2a.converter.relation import Relation
 from o2a.converter.task import Task
 from o2a.mappers.distcp_mapper import DistCpMapper
@@ -163,6 +165,98 @@ class TestDistCpMapperNoPrepare(unittest.TestCase):
         )
 
 
+# language=XML
+PERFORMANCE_XML = """
+<distcp>
+    <arg>-update</arg>
+    <arg>-m</arg>
+    <arg>10</arg>
+    <arg>hdfs:///input</arg>
+    <arg>hdfs:///output</arg>
+    <configuration>
+        <property>
+            <name>mapreduce.job.maps</name>
+            <value>50</value>
+        </property>
+        <property>
+            <name>distcp.dynamic.split.ratio</name>
+            <value>4</value>
+        </property>
+        <property>
+            <name>distcp.map.bandwidth.mb</name>
+            <value>200</value>
+        </property>
+        <property>
+            <name>distcp.liststatus.threads</name>
+            <value>20</value>
+        </property>
+    </configuration>
+</distcp>
+"""
+
+
+class TestDistCpMapperConfigurationOptions(unittest.TestCase):
+    @parameterized.expand(
+        [
+            (
+                {},
+                "-strategy dynamic -bandwidth 200 -numListstatusThreads 20 -update -m 10 "
+                "hdfs:///input hdfs:///output",
+            ),
+            (
+                {"distcp_options_precedence": "arguments"},
+                "-strategy dynamic -bandwidth 200 -numListstatusThreads 20 -update -m 10 "
+                "hdfs:///input hdfs:///output",
+            ),
+            (
+                {"distcp_options_precedence": "configuration"},
+                "-m 50 -strategy dynamic -bandwidth 200 -numListstatusThreads 20 -update "
+                "hdfs:///input hdfs:///output",
+            ),
+            ({"distcp_options_precedence": "ignore"}, "-update -m 10 hdfs:///input hdfs:///output"),
+        ]
+    )
+    def test_should_translate_configuration(self, config, expected_args):
+        mapper, _ = _get_distcp_mapper(
+            ET.fromstring(PERFORMANCE_XML), job_properties={}, config={**EXAMPLE_CONFIG_PROPERTIES, **config}
+        )
+
+        mapper.on_parse_node()
+
+        self.assertEqual(expected_args, mapper.args)
+
+    def test_should_prefer_explicit_strategy_and_max_maps(self):
+        distcp_node = ET.fromstring(PERFORMANCE_XML)
+        configuration = distcp_node.find("configuration")
+        for name, value in [("distcp.copy.strategy", "uniformsize"), ("distcp.max.maps", "30")]:
+            property_node = ET.SubElement(configuration, "property")
+            ET.SubElement(property_node, "name").text = name
+            ET.SubElement(property_node, "value").text = value
+        mapper, _ = _get_distcp_mapper(
+            distcp_node,
+            job_properties={},
+            config={**EXAMPLE_CONFIG_PROPERTIES, "distcp_options_precedence": "configuration"},
+        )
+
+        mapper.on_parse_node()
+
+        self.assertEqual(
+            "-m 30 -strategy uniformsize -bandwidth 200 -numListstatusThreads 20 -update "
+            "hdfs:///input hdfs:///output",
+            mapper.args,
+        )
+
+    def test_should_raise_on_unknown_precedence(self):
+        mapper, _ = _get_distcp_mapper(
+            ET.fromstring(PERFORMANCE_XML),
+            job_properties={},
+            config={**EXAMPLE_CONFIG_PROPERTIES, "distcp_options_precedence": "unknown"},
+        )
+
+        with self.assertRaisesRegex(ParseException, "distcp_options_precedence"):
+            mapper.on_parse_node()
+
+
 def _get_distcp_mapper(distcp_node: Element, job_properties: Dict[str, str], config: Dict[str, str]):
     name = "distcp"
     mapper = DistCpMapper(
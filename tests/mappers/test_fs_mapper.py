@@ -21,6 +21,7 @@ from xml.etree import ElementTree as ET
 
 from parameterized import parameterized
 
+from o2a.converter.conversion_options import ConversionOptions
 from o2a.converter.task import Task
 from o2a.converter.relation import Relation
 from o2a.mappers import fs_mapper
@@ -465,10 +466,60 @@ class FsMapperComplexTestCase(unittest.TestCase):
         self.assertIsNotNone(ast.parse(imp_str))
 
 
-def _get_fs_mapper(oozie_node):
+class FsMapperSingleJobTestCase(unittest.TestCase):
+    def setUp(self):
+        # language=XML
+        node_str = """
+            <fs>
+                <mkdir path='hdfs://localhost:9200/home/pig/test-mkdir-1'/>
+                <delete path='hdfs://localhost:9200/home/pig/test-delete-1'/>
+                <touchz path='hdfs://localhost:9200/home/pig/test-touchz-1' />
+            </fs>"""
+        self.node = ET.fromstring(node_str)
+
+    def test_to_tasks_and_relations(self):
+        mapper = _get_fs_mapper(oozie_node=self.node, options=ConversionOptions(single_fs_job=True))
+        mapper.on_parse_node()
+
+        tasks, relations = mapper.to_tasks_and_relations()
+
+        self.assertEqual(
+            [
+                Task(
+                    task_id="test_id",
+                    template_name="fs_op.tpl",
+                    template_params={
+                        "pig_command": "sh echo test_id_fs_0_mkdir\n"
+                        "fs -mkdir -p /home/pig/test-mkdir-1\n"
+                        "sh echo test_id_fs_1_delete\n"
+                        "fs -rm -f -r /home/pig/test-delete-1\n"
+                        "sh echo test_id_fs_2_touchz\n"
+                        "fs -touchz /home/pig/test-touchz-1",
+                        "action_node_properties": {},
+                    },
+                )
+            ],
+            tasks,
+        )
+        self.assertEqual([], relations)
+
+    def test_should_keep_single_operation(self):
+        node = ET.fromstring("<fs><mkdir path='hdfs://localhost:9200/home/pig/test-mkdir-1'/></fs>")
+        mapper = _get_fs_mapper(oozie_node=node, options=ConversionOptions(single_fs_job=True))
+        mapper.on_parse_node()
+
+        tasks, _ = mapper.to_tasks_and_relations()
+
+        self.assertEqual(
+            ["fs -mkdir -p /home/pig/test-mkdir-1"], [task.template_params["pig_command"] for task in tasks]
+        )
+
+
+def _get_fs_mapper(oozie_node, **kwargs):
     return fs_mapper.FsMapper(
         oozie_node=oozie_node,
         name="test_id",
         dag_name="DAG_NAME_B",
         props=PropertySet(job_properties={"nameNode": "hdfs://"}, config={}),
+        **kwargs,
     )
@@ -17,7 +17,9 @@ import ast
 import unittest
 from xml.etree import ElementTree as ET
 
+from parameterized import parameterized
 
+from o2a.converter.exceptions import ParseException
 from o2a.converter.relation import Relation
 from o2a.converter.task import Task
 from o2a.mappers import git_mapper
@@ -101,6 +103,25 @@ class PrepareGitCommandTestCase(unittest.TestCase):
             command,
         )
 
+    def test_with_clone_options(self):
+        command = prepare_git_command(
+            git_uri="GIT_URI",
+            git_branch="GIT_BRANCH",
+            destination_path="/DEST_PATH/",
+            key_path=None,
+            depth=1,
+            sparse_paths=["src", "docs dir"],
+            mirror_cache_path="/var/cache/git",
+        )
+        self.assertEqual(
+            "$DAGS_FOLDER/../data/git.sh "
+            "--cluster {{params.config['dataproc_cluster']}} "
+            "--region {{params.config['gcp_region']}} "
+            "--git-uri GIT_URI --destination-path /DEST_PATH/ --branch GIT_BRANCH "
+            "--depth 1 --sparse-path src --sparse-path 'docs dir' --mirror-cache /var/cache/git",
+            command,
+        )
+
 
 class TestGitMapper(unittest.TestCase):
     def test_create_mapper(self):
@@ -133,6 +154,9 @@ class TestGitMapper(unittest.TestCase):
                         "git_branch": "my-awesome-branch",
                         "destination_path": "/my_git_repo_directory",
                         "key_path": "/awesome-key/",
+                        "depth": None,
+                        "sparse_paths": [],
+                        "mirror_cache_path": None,
                         "props": PropertySet(
                             config={"dataproc_cluster": "my-cluster", "gcp_region": "europe-west3"},
                             job_properties={
@@ -170,6 +194,9 @@ class TestGitMapper(unittest.TestCase):
                         "git_branch": "my-awesome-branch",
                         "destination_path": "/my_git_repo_directory",
                         "key_path": "/awesome-key/",
+                        "depth": None,
+                        "sparse_paths": [],
+                        "mirror_cache_path": None,
                         "props": PropertySet(
                             config={"dataproc_cluster": "my-cluster", "gcp_region": "europe-west3"},
                             job_properties={
@@ -187,6 +214,35 @@ class TestGitMapper(unittest.TestCase):
         )
         self.assertEqual([], relations)
 
+    def test_should_read_clone_options_from_config(self):
+        git_node = ET.fromstring(EXAMPLE_XML)
+        mapper = self._get_git_mapper(
+            git_node,
+            config={
+                **EXAMPLE_CONFIG,
+                "git_clone_depth": "1",
+                "git_sparse_paths": "src, docs,",
+                "git_mirror_cache_path": "/var/cache/git",
+            },
+        )
+        mapper.on_parse_node()
+
+        tasks, _ = mapper.to_tasks_and_relations()
+
+        template_params = tasks[-1].template_params
+        self.assertEqual(1, template_params["depth"])
+        self.assertEqual(["src", "docs"], template_params["sparse_paths"])
+        self.assertEqual("/var/cache/git", template_params["mirror_cache_path"])
+
+    @parameterized.expand([("shallow",), ("0",)])
+    def test_should_raise_on_incorrect_clone_depth(self, depth):
+        mapper = self._get_git_mapper(
+            ET.fromstring(EXAMPLE_XML), config={**EXAMPLE_CONFIG, "git_clone_depth": depth}
+        )
+
+        with self.assertRaisesRegex(ParseException, "git_clone_depth"):
+            mapper.on_parse_node()
+
     def test_required_imports(self):
         spark_node = ET.fromstring(EXAMPLE_XML)
         mapper = self._get_git_mapper(spark_node)
@@ -195,11 +251,11 @@ class TestGitMapper(unittest.TestCase):
         ast.parse(imp_str)
 
     @staticmethod
-    def _get_git_mapper(spark_node):
+    def _get_git_mapper(spark_node, config=None):
         mapper = git_mapper.GitMapper(
             oozie_node=spark_node,
             name="test_id",
             dag_name="DAG_NAME_B",
-            props=PropertySet(job_properties=EXAMPLE_JOB_PROPS, config=EXAMPLE_CONFIG),
+            props=PropertySet(job_properties=EXAMPLE_JOB_PROPS, config=config or EXAMPLE_CONFIG),
         )
         return mapper
@@ -15,6 +15,7 @@
 """Tests pig mapper"""
 import ast
 import unittest
+from unittest import mock
 from xml.etree import ElementTree as ET
 
 
@@ -149,6 +150,26 @@ class TestPigMapper(unittest.TestCase):
         )
         self.assertEqual([Relation(from_task_id="test_id_prepare", to_task_id="test_id")], relations)
 
+    def test_copy_extra_assets(self):
+        job_properties = {"nameNode": "hdfs://"}
+        config = {}
+        mapper = self._get_pig_mapper(job_properties=job_properties, config=config)
+        asset_manager = mock.MagicMock()
+
+        mapper.copy_extra_assets(
+            input_directory_path="/input/hdfs", output_directory_path="/output", asset_manager=asset_manager
+        )
+
+        asset_manager.add_asset.assert_called_once_with(
+            "/input/hdfs/id.pig",
+            "/output/id.pig",
+            header="set mapred.create.symlink yes;\n"
+            "set mapred.cache.file hdfs:///test_dir/test.txt#test_link.txt,"
+            "hdfs:///user/pig/examples/pig/test_dir/test2.zip#test_link.zip;\n"
+            "set mapred.cache.archives hdfs:///test_dir/test2.zip#test_zip_dir,"
+            "hdfs:///test_dir/test3.zip#test3_zip_dir;\n",
+        )
+
     def test_required_imports(self):
         job_properties = {"nameNode": "hdfs://"}
         config = {}
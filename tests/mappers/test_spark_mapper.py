@@ -17,7 +17,9 @@ import ast
 import unittest
 from xml.etree import ElementTree as ET
 
+from parameterized import parameterized
 
+from o2a.converter.exceptions import ParseException
 from o2a.converter.task import Task
 from o2a.converter.relation import Relation
 from o2a.mappers import spark_mapper
@@ -114,7 +116,9 @@ class TestSparkMapperWithPrepare(unittest.TestCase):
                         "job_name": "Spark Examples",
                         "spark_opts": {
                             "spark.executor.extraJavaOptions": "-XX:+HeapDumpOnOutOfMemoryError "
-                            "-XX:HeapDumpPath=/tmp"
+                            "-XX:HeapDumpPath=/tmp",
+                            "spark.executor.memory": "20G",
+                            "spark.executor.instances": "50",
                         },
                         "dataproc_spark_jars": ["/lib/spark-examples_2.10-1.1.0.jar"],
                     },
@@ -150,7 +154,9 @@ class TestSparkMapperWithPrepare(unittest.TestCase):
                         "job_name": "Spark Examples",
                         "spark_opts": {
                             "spark.executor.extraJavaOptions": "-XX:+HeapDumpOnOutOfMemoryError "
-                            "-XX:HeapDumpPath=/tmp"
+                            "-XX:HeapDumpPath=/tmp",
+                            "spark.executor.memory": "20G",
+                            "spark.executor.instances": "50",
                         },
                         "dataproc_spark_jars": [
                             "/user/test_user/examples/apps/spark/lib/oozie-examples-4.3.0.jar"
@@ -162,6 +168,99 @@ class TestSparkMapperWithPrepare(unittest.TestCase):
         )
         self.assertEqual(relations, [])
 
+    @parameterized.expand(
+        [
+            (
+                "--executor-memory 20G --executor-cores=4 --num-executors 50 "
+                "--driver-memory 8g --driver-cores 2",
+                {
+                    "spark.executor.memory": "20G",
+                    "spark.executor.cores": "4",
+                    "spark.executor.instances": "50",
+                    "spark.driver.memory": "8g",
+                    "spark.driver.cores": "2",
+                },
+            ),
+            (
+                "--conf spark.dynamicAllocation.enabled=true --conf spark.dynamicAllocation.maxExecutors=100 "
+                "--conf spark.shuffle.service.enabled=true",
+                {
+                    "spark.dynamicAllocation.enabled": "true",
+                    "spark.dynamicAllocation.maxExecutors": "100",
+                    "spark.shuffle.service.enabled": "true",
+                },
+            ),
+            ("--conf spark.executor.memory=4G --executor-memory 20G", {"spark.executor.memory": "20G"}),
+            (
+                "--driver-java-options '-Dkey=value -Dother=value' --queue default --supervise --verbose",
+                {
+                    "spark.driver.extraJavaOptions": "-Dkey=value -Dother=value",
+                    "spark.yarn.queue": "default",
+                    "spark.driver.supervise": "true",
+                },
+            ),
+            (
+                "--jars a.jar,b.jar --py-files lib.py --packages org.example:lib:1.0 --files app.conf",
+                {
+                    "spark.jars": "a.jar,b.jar",
+                    "spark.submit.pyFiles": "lib.py",
+                    "spark.jars.packages": "org.example:lib:1.0",
+                    "spark.files": "app.conf",
+                },
+            ),
+        ]
+    )
+    def test_parse_spark_opts(self, spark_opts, expected_properties):
+        mapper = self._get_spark_mapper(ET.fromstring(EXAMPLE_XML_WITHOUT_PREPARE))
+        spark_opts_node = ET.Element("spark-opts")
+        spark_opts_node.text = spark_opts
+
+        properties = mapper._parse_spark_opts(spark_opts_node)  # pylint: disable=protected-access
+
+        self.assertEqual(expected_properties, properties)
+
+    def test_parse_spark_opts_should_warn_about_skipped_options(self):
+        mapper = self._get_spark_mapper(ET.fromstring(EXAMPLE_XML_WITHOUT_PREPARE))
+        spark_opts_node = ET.Element("spark-opts")
+        spark_opts_node.text = "--master yarn --unknown-flag --unknown value"
+
+        with self.assertLogs(level="WARNING") as logs:
+            properties = mapper._parse_spark_opts(spark_opts_node)  # pylint: disable=protected-access
+
+        self.assertEqual({}, properties)
+        self.assertEqual(4, len(logs.output))
+        self.assertIn("--master", logs.output[0])
+        self.assertIn("--unknown-flag", logs.output[1])
+        self.assertIn("--unknown", logs.output[2])
+        self.assertIn("value", logs.output[3])
+
+    def test_parse_spark_opts_should_not_take_value_of_unknown_option(self):
+        mapper = self._get_spark_mapper(ET.fromstring(EXAMPLE_XML_WITHOUT_PREPARE))
+        spark_opts_node = ET.Element("spark-opts")
+        spark_opts_node.text = "--unknown-flag --verbose --executor-memory=20G"
+
+        with self.assertLogs(level="WARNING"):
+            properties = mapper._parse_spark_opts(spark_opts_node)  # pylint: disable=protected-access
+
+        self.assertEqual({"spark.executor.memory": "20G"}, properties)
+
+    @parameterized.expand(
+        [
+            ("--executor-memory",),
+            ("--executor-memory=",),
+            ("--queue --supervise",),
+            ("--conf spark.executor.memory",),
+            ("--conf 'spark.executor.memory=4G",),
+        ]
+    )
+    def test_parse_incorrect_spark_opts(self, spark_opts):
+        mapper = self._get_spark_mapper(ET.fromstring(EXAMPLE_XML_WITHOUT_PREPARE))
+        spark_opts_node = ET.Element("spark-opts")
+        spark_opts_node.text = spark_opts
+
+        with self.assertRaises(ParseException):
+            mapper._parse_spark_opts(spark_opts_node)  # pylint: disable=protected-access
+
     def test_required_imports(self):
         spark_node = ET.fromstring(EXAMPLE_XML_WITHOUT_PREPARE)
         mapper = self._get_spark_mapper(spark_node)
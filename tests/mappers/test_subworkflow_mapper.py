@@ -20,9 +20,10 @@ from unittest import mock, TestCase
 from xml.etree import ElementTree as ET
 
 
+from o2a.converter.conversion_options import ConversionOptions
 from o2a.converter.mappers import ACTION_MAP
 from o2a.converter.task import Task
-from o2a.definitions import EXAMPLE_SUBWORKFLOW_PATH
+from o2a.definitions import EXAMPLE_PIG_PATH, EXAMPLE_SUBWORKFLOW_PATH
 from o2a.mappers import subworkflow_mapper
 from o2a.o2a_libs.property_utils import PropertySet
 
@@ -115,13 +116,40 @@ class TestSubworkflowMapper(TestCase):
         )
         self.assertEqual([], relations)
 
+    @mock.patch("o2a.utils.el_utils.parse_els")
+    def test_subworkflow_app_paths(self, parse_els):
+        # Given
+        parse_els.side_effect = [self.subworkflow_properties, self.config]
+        # When
+        mapper = self._get_subwf_mapper()
+        # Then
+        self.assertEqual([EXAMPLE_PIG_PATH], mapper.subworkflow_app_paths)
+
     def test_required_imports(self):
         mapper = self._get_subwf_mapper()
         imps = mapper.required_imports()
         imp_str = "\n".join(imps)
         ast.parse(imp_str)
 
-    def _get_subwf_mapper(self):
+    @mock.patch("o2a.utils.el_utils.parse_els")
+    def test_inline_subworkflow(self, parse_els):
+        # Given
+        parse_els.side_effect = [self.subworkflow_properties, self.config]
+        # When
+        mapper = self._get_subwf_mapper(options=ConversionOptions(inline_subworkflows=True))
+        tasks, relations = mapper.to_tasks_and_relations()
+
+        # Then
+        mapper.renderer.create_subworkflow_file.assert_not_called()
+        self.assertEqual("pig", mapper.subworkflow.dag_name)
+        self.assertIn("pig-node", mapper.subworkflow.nodes)
+        self.assertTrue(mapper.subworkflow.nodes["pig-node"].tasks)
+        self.assertEqual([Task(task_id="test_id", template_name="dummy.tpl")], tasks)
+        self.assertEqual([], relations)
+        self.assertNotIn("import subdag_pig", mapper.required_imports())
+        self.assertTrue(mapper.subworkflow.dependencies.issubset(mapper.required_imports()))
+
+    def _get_subwf_mapper(self, **kwargs):
         return subworkflow_mapper.SubworkflowMapper(
             input_directory_path=EXAMPLE_SUBWORKFLOW_PATH,
             output_directory_path="/tmp",
@@ -131,4 +159,5 @@ class TestSubworkflowMapper(TestCase):
             action_mapper=ACTION_MAP,
             props=PropertySet(job_properties=self.main_properties, config=self.config),
             renderer=mock.MagicMock(),
+            **kwargs,
         )
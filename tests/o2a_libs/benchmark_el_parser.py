@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmarks the translation of EL expressions to Jinja
+
+Compares the translator with the recursive one it replaced, kept in the tests as the reference.
+Only the translation of parsed trees is timed. Run it from the root of the repository with:
+
+    python -m tests.o2a_libs.benchmark_el_parser
+"""
+import timeit
+from typing import Callable, List, Tuple
+
+from lark import Tree
+
+from o2a.o2a_libs.el_parser import _get_lark, _parser, _translate_jinja
+from tests.o2a_libs.test_el_parser import _reference_translate
+
+EXPRESSIONS: List[Tuple[str, str]] = [
+    ("${a + a + ...} with 200 terms", "${" + " + ".join(["a"] * 200) + "}"),
+    ("40 nested parentheses", "${" + "(" * 40 + "a" + ")" * 40 + "}"),
+    ("typical path template", "${nameNode}/user/${wf:user()}/${examplesRoot}/apps/${wf:conf('app')}"),
+    ("500 nested parentheses", "${" + "(" * 500 + "a" + ")" * 500 + "}"),
+]
+
+
+def _time_ms(translate: Callable[[Tree], str], tree: Tree, number: int) -> str:
+    try:
+        seconds = min(timeit.repeat(lambda: translate(tree), number=number, repeat=5)) / number
+    except RecursionError:
+        return "RecursionError"
+    return f"{seconds * 1000:.2f}ms"
+
+
+def main(number: int = 100) -> None:
+    print(f"{'expression':<35}{'recursive':>16}{'iterative':>16}")
+    for name, expression in EXPRESSIONS:
+        tree = _parser(expression)
+        reference = _time_ms(_reference_translate, tree, number)
+        translation = _time_ms(_translate_jinja, tree, number)
+        print(f"{name:<35}{reference:>16}{translation:>16}")
+
+    _get_lark.cache_clear()
+    seconds = timeit.timeit(_get_lark, number=1)
+    print(f"Building the Lark parser once: {seconds * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests the operators submitting the Dataproc jobs and the sensors waiting for them"""
+import unittest
+from unittest import mock
+
+from airflow.exceptions import AirflowException
+from parameterized import parameterized
+
+try:
+    from o2a.o2a_libs import dataproc_jobs
+except ImportError:
+    # The Dataproc hook is in the contrib package of Airflow 1.10
+    dataproc_jobs = None
+
+
+def _get_jobs_mock(hook_mock):
+    return hook_mock.return_value.get_conn.return_value.projects.return_value.regions.return_value.jobs
+
+
+@unittest.skipIf(dataproc_jobs is None, "The Dataproc hook is not available")
+class DataProcJobSubmitOperatorTestCase(unittest.TestCase):
+    @mock.patch("uuid.uuid4")
+    @mock.patch("o2a.o2a_libs.dataproc_jobs.DataProcHook")
+    def test_execute_should_submit_job_without_waiting(self, hook_mock, uuid_mock):
+        uuid_mock.return_value.hex = "0123456789abcdef"
+        hook_mock.return_value.project_id = "PROJECT"
+        jobs_mock = _get_jobs_mock(hook_mock)
+        jobs_mock.return_value.submit.return_value.execute.return_value = {
+            "reference": {"projectId": "PROJECT", "jobId": "pig_01234567"}
+        }
+        operator = dataproc_jobs.DataProcJobSubmitOperator(
+            task_id="pig",
+            job_type="pigJob",
+            job={"queryFileUri": "gs://bucket/id.pig"},
+            cluster_name="CLUSTER",
+            region="REGION",
+            gcp_conn_id="CONN_ID",
+        )
+
+        job_id = operator.execute(context={})
+
+        self.assertEqual("pig_01234567", job_id)
+        hook_mock.assert_called_once_with(gcp_conn_id="CONN_ID")
+        jobs_mock.return_value.submit.assert_called_once_with(
+            projectId="PROJECT",
+            region="REGION",
+            body={
+                "job": {
+                    "reference": {"projectId": "PROJECT", "jobId": "pig_01234567"},
+                    "placement": {"clusterName": "CLUSTER"},
+                    "pigJob": {"queryFileUri": "gs://bucket/id.pig"},
+                }
+            },
+        )
+        jobs_mock.return_value.get.assert_not_called()
+
+
+@unittest.skipIf(dataproc_jobs is None, "The Dataproc hook is not available")
+class DataProcJobSensorTestCase(unittest.TestCase):
+    def setUp(self):
+        self.sensor = dataproc_jobs.DataProcJobSensor(
+            task_id="pig_sensor", job_id="pig_01234567", region="REGION", gcp_conn_id="CONN_ID"
+        )
+
+    def _poke(self, hook_mock, state):
+        hook_mock.return_value.project_id = "PROJECT"
+        jobs_mock = _get_jobs_mock(hook_mock)
+        jobs_mock.return_value.get.return_value.execute.return_value = {
+            "status": {"state": state, "details": "DETAILS"}
+        }
+        result = self.sensor.poke(context={})
+        jobs_mock.return_value.get.assert_called_once_with(
+            projectId="PROJECT", region="REGION", jobId="pig_01234567"
+        )
+        return result
+
+    @mock.patch("o2a.o2a_libs.dataproc_jobs.DataProcHook")
+    def test_poke_should_finish_when_job_is_done(self, hook_mock):
+        self.assertTrue(self._poke(hook_mock, "DONE"))
+
+    @parameterized.expand([("PENDING",), ("RUNNING",)])
+    @mock.patch("o2a.o2a_libs.dataproc_jobs.DataProcHook")
+    def test_poke_should_wait_while_job_runs(self, state, hook_mock):
+        self.assertFalse(self._poke(hook_mock, state))
+
+    @parameterized.expand([("ERROR",), ("CANCELLED",)])
+    @mock.patch("o2a.o2a_libs.dataproc_jobs.DataProcHook")
+    def test_poke_should_fail_when_job_fails(self, state, hook_mock):
+        with self.assertRaisesRegex(AirflowException, f"ended in the {state} state: DETAILS"):
+            self._poke(hook_mock, state)
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the EL operators"""
+import unittest
+
+from parameterized import parameterized
+
+from o2a.o2a_libs import el_operators
+
+
+class TestElOperators(unittest.TestCase):
+    @parameterized.expand(
+        [
+            (None, False),
+            ("", False),
+            ("true", True),
+            ("TRUE", True),
+            ("false", False),
+            ("yes", False),
+            (True, True),
+            (False, False),
+        ]
+    )
+    def test_to_boolean(self, value, expected):
+        self.assertEqual(expected, el_operators.to_boolean(value))
+
+    def test_to_boolean_should_not_coerce_numbers(self):
+        with self.assertRaises(TypeError):
+            el_operators.to_boolean(1)
+
+    @parameterized.expand(
+        [(None, True), ("", True), ([], True), ({}, True), ("a", False), ([1], False), (0, False)]
+    )
+    def test_empty(self, value, expected):
+        self.assertEqual(expected, el_operators.empty(value))
+
+    @parameterized.expand(
+        [
+            ("add", "1", 2, 3),
+            ("add", "1.5", 2, 3.5),
+            ("add", None, None, 0),
+            ("sub", "10", "4", 6),
+            ("mul", "3", 1024, 3072),
+            ("div", "3", 2, 1.5),
+            ("mod", "7", 3, 1),
+            ("mod", -7, 3, -1),
+        ]
+    )
+    def test_arithmetic(self, operator, first, second, expected):
+        self.assertEqual(expected, getattr(el_operators, operator)(first, second))
+
+    @parameterized.expand(
+        [
+            ("eq", "1", 1, True),
+            ("eq", "1.0", 1.0, True),
+            ("eq", "false", False, True),
+            ("eq", True, "TRUE", True),
+            ("eq", "a", "a", True),
+            ("eq", None, "", False),
+            ("eq", None, None, True),
+            ("ne", "a", "b", True),
+            ("gt", "20", 10, True),
+            ("gt", "abc", "abd", False),
+            ("gt", None, 1, False),
+            ("lt", "2", "10", False),
+            ("lt", "2", 10, True),
+            ("le", "1.5", 1.5, True),
+            ("ge", None, None, True),
+            ("ge", "b", "a", True),
+            ("eq", "1.5", 1, False),
+            ("eq", "1.0", 1, True),
+            ("eq", "1e3", 1000, True),
+            ("eq", "abc", 1, False),
+            ("lt", "apple", "banana", True),
+            ("gt", "Test", "abc", False),
+            ("gt", "a.b", "a", True),
+            ("gt", "prod", "dev", True),
+            ("le", "1.5", "1.25", False),
+            ("lt", "1.5", 2, True),
+            ("gt", "abc", 1, True),
+        ]
+    )
+    def test_comparison(self, operator, first, second, expected):
+        self.assertEqual(expected, getattr(el_operators, operator)(first, second))
+
+    def test_unary(self):
+        self.assertEqual(-3, el_operators.neg("3"))
+        self.assertEqual(-1.5, el_operators.neg("1.5"))
+        self.assertTrue(el_operators.not_("false"))
+        self.assertFalse(el_operators.not_(True))
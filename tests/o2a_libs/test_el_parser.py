@@ -13,12 +13,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Tests for all EL to Jinjia parser"""
-
+import random
+import re
 import unittest
+from copy import deepcopy
+from typing import Optional, Union
 
+from lark import Tree, Token
 from parameterized import parameterized
 
-from o2a.o2a_libs.el_parser import translate
+from o2a.o2a_libs.el_parser import (
+    translate,
+    translate_to_python,
+    _camel_to_snake,
+    _parser,
+    _purify,
+    _translate_jinja,
+)
 
 
 class TestElParser(unittest.TestCase):
@@ -128,3 +139,285 @@ class TestElParser(unittest.TestCase):
         translation = translate(input_sentence)
         output_sentence = output_sentence
         self.assertEqual(translation, output_sentence)
+
+    def test_should_translate_deeply_nested_expression(self):
+        depth = 500
+        self.assertEqual(
+            "{{" + "(" * depth + "a" + ")" * depth + "}}",
+            translate("${" + "(" * depth + "a" + ")" * depth + "}"),
+        )
+
+    def test_should_not_modify_tree(self):
+        tree = _parser("${a gt b ? c : d} and ${wf:conf('x') eq null}")
+        original_tree = deepcopy(tree)
+
+        first_translation = _translate_jinja(tree)
+
+        self.assertEqual(original_tree, tree)
+        self.assertEqual(first_translation, _translate_jinja(tree))
+
+    @parameterized.expand(
+        [
+            ("  a   b  ",),
+            ("{{a}} / {{b}}",),
+            ("{{a}}   /   {{b}}",),
+            ("{{a}} /b/ {{c}}",),
+            ("{{a}} / / {{b}}",),
+            ("a / b",),
+        ]
+    )
+    def test_purify_should_match_reference(self, sentence):
+        self.assertEqual(_reference_purify(sentence), _purify(sentence))
+
+
+# The recursive translator replaced by _translate_jinja, kept as the reference for the fuzz test
+def _reference_binary_operator(tree: Tree) -> str:
+    """
+    Translates non-python binary operators to python equivalents.
+    """
+    # Binary op will have only one child and it will be a Token
+    operator = tree.children[0]
+
+    if operator.value == "gt":
+        operator.value = ">"
+
+    if operator.value == "lt":
+        operator.value = "<"
+
+    if operator.value == "ge":
+        operator.value = ">="
+
+    if operator.value == "le":
+        operator.value = "<="
+
+    if operator.value == "ne":
+        operator.value = "!="
+
+    if operator.value == "eq":
+        operator.value = "=="
+
+    if operator.value == "||":
+        operator.value = "or"
+
+    if operator.value == "&&":
+        operator.value = "and"
+
+    if operator.value == "mod":
+        operator.value = "%"
+
+    if operator.value == "div":
+        operator.value = "/"
+
+    operator.value = " " + operator.value + " "
+
+    return str(operator.value)
+
+
+def _reference_ternary(tree: Tree) -> Optional[str]:
+    """
+    Translates ternary expression.
+    """
+    if tree.data == "expression" and "ternary" in [ch.data for ch in tree.children]:
+        # Case of `f() ? true : false`
+        condition, ternary = tree.children
+        _, if_true, _, if_false = ternary.children
+        translation = f"{_reference_el(if_true)} if {_reference_el(condition)} else {_reference_el(if_false)}"
+        return translation
+
+    if tree.data == "expression1" and "ternary" in [ch.data for ch in tree.children[-1].children]:
+        # Case of `x op y ? true : false`
+        first = _reference_el(tree.children[0])
+        operator = _reference_el(tree.children[1])
+
+        # expression | ternary
+        expression, ternary = tree.children[2].children
+
+        # ? | expression | : | expression
+        _, if_true, _, if_false = ternary.children
+
+        second = _reference_el(expression)
+
+        condition = f"{first}{operator}{second}"
+        translation = f"{_reference_el(if_true)} if {condition} else {_reference_el(if_false)}"
+        return translation
+
+    return None
+
+
+def _reference_token(token: Token) -> str:
+    """
+    Translates non-python values to python equivalents.
+    """
+    if token.type == "BEGIN":
+        token.value = " {{"
+
+    if token.type == "END":
+        token.value = "}} "
+
+    if token.type == "INVOCATION_COLON":
+        token.value = "_"
+
+    if token.type == "NULL":
+        token.value = None
+
+    if token.type == "BOOL":
+        if token.value == "true":
+            token.value = True
+        else:
+            token.value = False
+
+    if token.type == "JAVA":
+        token.value = _camel_to_snake(token.value)
+
+    return str(token.value)
+
+
+def _reference_el(tree: Union[Tree, Token]) -> str:
+    """
+    Translates el expression to jinjia equivalent.
+    """
+
+    if isinstance(tree, Token):
+        return _reference_token(tree)
+
+    if tree.data == "binary_op":
+        return _reference_binary_operator(tree)
+
+    ternary = _reference_ternary(tree)
+    if ternary is not None:
+        return ternary
+
+    output = "".join([_reference_el(ch) for ch in tree.children])
+    return output
+
+
+def _reference_purify(sentence: str) -> str:
+    sentence = sentence.strip()
+    sentence = re.sub("[ ]+", " ", sentence)
+    sentence = sentence.replace("}} / {{", "}}/{{")
+    sentence = sentence.replace("}} /", "}}/")
+    sentence = sentence.replace("/ {{", "/{{")
+
+    return sentence
+
+
+def _reference_translate(tree: Tree) -> str:
+    return _reference_purify(_reference_el(tree))
+
+
+class ElExpressionGenerator:
+    """Generates random EL templates covering the grammar"""
+
+    IDENTIFIERS = ["a", "nameNode", "userName", "examples_root", "outputDir"]
+    FUNCTIONS = ["concat", "firstNotNull", "wf:id", "wf:actionData", "fs:exists", "hadoop:counters"]
+    LITERALS = ["1", "23", "1.5", "'text'", '"a b"', "'a  b'", "'/'", "true", "false", "null"]
+    BINARY_OPERATORS = ["and", "&&", "or", "||", "+", "-", "*", "/", "div", "%", "mod", ">", "gt", "<", "lt"]
+    BINARY_OPERATORS += [">=", "ge", "<=", "le", "==", "eq", "!=", "ne"]
+    UNARY_OPERATORS = ["-", "!", "not ", "empty "]
+    TEXTS = ["/", "/user/", "text", " ", "a b", "  ", "-"]
+
+    def __init__(self, seed: int):
+        self.random = random.Random(seed)
+
+    def template(self) -> str:
+        parts = []
+        for _ in range(self.random.randint(1, 4)):
+            if self.random.random() < 0.3:
+                parts.append(self.random.choice(self.TEXTS))
+            else:
+                parts.append(self.random.choice(["${", "#{"]) + self.expression(depth=3) + "}")
+        return "".join(parts)
+
+    def expression(self, depth: int) -> str:
+        kind = self.random.choice(
+            ["value", "binary", "unary", "ternary", "parenthesis"] if depth else ["value"]
+        )
+        if kind == "binary":
+            operator = self.random.choice(self.BINARY_OPERATORS)
+            return f"{self.expression(depth - 1)} {operator} {self.expression(depth - 1)}"
+        if kind == "unary":
+            return self.random.choice(self.UNARY_OPERATORS) + self.expression(depth - 1)
+        if kind == "ternary":
+            return " ? ".join(
+                [self.expression(depth - 1), f"{self.value(depth - 1)} : {self.value(depth - 1)}"]
+            )
+        if kind == "parenthesis":
+            return f"({self.expression(depth - 1)})"
+        return self.value(depth)
+
+    def value(self, depth: int) -> str:
+        kind = self.random.choice(
+            ["literal", "identifier", "function"] if depth else ["literal", "identifier"]
+        )
+        if kind == "literal":
+            return self.random.choice(self.LITERALS)
+        if kind == "function":
+            arguments = [self.expression(depth - 1) for _ in range(self.random.randint(0, 2))]
+            return f"{self.random.choice(self.FUNCTIONS)}({', '.join(arguments)})"
+        value = self.random.choice(self.IDENTIFIERS)
+        for _ in range(self.random.randint(0, 2)):
+            value += self.random.choice([f".{self.random.choice(self.IDENTIFIERS)}", f"[{self.value(0)}]"])
+        return value
+
+
+class TestElParserEquivalence(unittest.TestCase):
+    def test_should_translate_as_recursive_translator(self):
+        generator = ElExpressionGenerator(seed=2019)
+        compared = 0
+        for _ in range(300):
+            template = generator.template()
+            try:
+                tree = _parser(template)
+            except Exception:  # pylint: disable=broad-except
+                # The grammar does not accept some of the generated templates
+                continue
+            translation = _translate_jinja(tree)
+            self.assertEqual(_reference_translate(tree), translation, template)
+            compared += 1
+        self.assertGreater(compared, 250)
+
+
+class TestElParserPython(unittest.TestCase):
+    @parameterized.expand(
+        [
+            ("${a}", "props['a']"),
+            ("${a.b.c}", "props['a.b.c']"),
+            ("${a[1].b}", "props['a'][1]['b']"),
+            ("${10 * GB}", "el_operators.mul(10, 1073741824)"),
+            ("${'x' eq \"y\"}", "el_operators.eq('x', 'y')"),
+            ("${true != null}", "el_operators.ne(True, None)"),
+            ("${1 + 2 * 3}", "el_operators.add(1, el_operators.mul(2, 3))"),
+            ("${(1 + 2) * 3}", "el_operators.mul(el_operators.add(1, 2), 3)"),
+            ("${1 - 2 - 3}", "el_operators.sub(el_operators.sub(1, 2), 3)"),
+            ("${8 div 4 mod 3}", "el_operators.mod(el_operators.div(8, 4), 3)"),
+            ("${-a lt 1.5}", "el_operators.lt(el_operators.neg(props['a']), 1.5)"),
+            (
+                "${a gt 1 && !b || empty c}",
+                "(el_operators.to_boolean((el_operators.to_boolean(el_operators.gt(props['a'], 1)) and "
+                "el_operators.to_boolean(el_operators.not_(props['b'])))) or "
+                "el_operators.to_boolean(el_operators.empty(props['c'])))",
+            ),
+            (
+                "${a == 1 ? 'x' : b ? 'y' : 'z'}",
+                "('x' if el_operators.to_boolean(el_operators.eq(props['a'], 1)) else "
+                "('y' if el_operators.to_boolean(props['b']) else 'z'))",
+            ),
+            ("${wf:conf('a.b')}", "props.get('a.b', '')"),
+            ("${wf:user()}", "props['user.name']"),
+            (
+                "#{concat(firstNotNull(a, 'b'), trim(c))}",
+                "el_basic_functions.concat(el_basic_functions.first_not_null(props['a'], 'b'), "
+                "el_basic_functions.trim(props['c']))",
+            ),
+        ]
+    )
+    def test_translations(self, input_sentence, output_sentence):
+        self.assertEqual(output_sentence, translate_to_python(input_sentence))
+
+    def test_should_use_properties_variable(self):
+        self.assertEqual("job_props['a']", translate_to_python("${a}", properties="job_props"))
+
+    @parameterized.expand([("${hadoop:counters('job')}",), ("text",), ("${a}${b}",), ("a ${b}",)])
+    def test_should_raise_on_unsupported_expressions(self, input_sentence):
+        with self.assertRaises(ValueError):
+            translate_to_python(input_sentence)
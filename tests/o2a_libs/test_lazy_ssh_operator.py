@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests the SSH operator creating its hook when it is executed"""
+import unittest
+from unittest import mock
+
+try:
+    from o2a.o2a_libs import lazy_ssh_operator
+except ImportError:
+    # The SSH hook is in the contrib package of Airflow 1.10
+    lazy_ssh_operator = None
+
+
+@unittest.skipIf(lazy_ssh_operator is None, "The SSH hook is not available")
+class LazySSHOperatorTestCase(unittest.TestCase):
+    @mock.patch("o2a.o2a_libs.lazy_ssh_operator.SSHOperator.execute", return_value="OUTPUT")
+    @mock.patch("o2a.o2a_libs.lazy_ssh_operator.SSHHook")
+    def test_should_create_hook_when_executed(self, hook_mock, execute_mock):
+        operator = lazy_ssh_operator.LazySSHOperator(
+            task_id="ssh",
+            ssh_conn_id="ssh_default",
+            username="user",
+            remote_host="example.com",
+            command="ls",
+            timeout=30,
+        )
+        hook_mock.assert_not_called()
+        self.assertIsNone(operator.ssh_hook)
+
+        result = operator.execute(context={})
+
+        self.assertEqual("OUTPUT", result)
+        hook_mock.assert_called_once_with(
+            ssh_conn_id="ssh_default", username="user", remote_host="example.com", timeout=30
+        )
+        self.assertIs(hook_mock.return_value, operator.ssh_hook)
+        execute_mock.assert_called_once_with({})
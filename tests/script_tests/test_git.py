@@ -19,17 +19,21 @@ Tests the external applications. Replaces the "gcloud" external app with a "mock
 This script saves all its calls along with script name and arguments to the log file specified by the
 environment variable "COMMAND_EXECUTION_LOG".
 This allows checking the validity of the external program call by analyzing the log file.
+
+The clones are also tested with the "local_gcloud" script, which runs the submitted commands on the local
+filesystem, and a local bare repository in place of the remote one.
 """
 
 import shutil
 import tempfile
 import unittest
 import subprocess
-from os import environ, symlink, path, remove
+from os import environ, listdir, makedirs, symlink, path, remove
 
 from parameterized import parameterized
 
 MOCK_APP_PATH = path.abspath(path.join(path.dirname(__file__), "mock"))
+LOCAL_GCLOUD_PATH = path.abspath(path.join(path.dirname(__file__), "local_gcloud"))
 GIT_SH_FILE = path.abspath(
     path.join(path.dirname(__file__), path.pardir, path.pardir, "o2a", "scripts", "git.sh")
 )
@@ -47,10 +51,10 @@ class mock_app:
     After the context manager is done, the environment variable "PATH" is restored to the original state.
     """
 
-    def __init__(self, command):
+    def __init__(self, command, mock_app_path=MOCK_APP_PATH):
         self.app_mock_dir = tempfile.mkdtemp(prefix="app-mock")
         self.old_path = environ["PATH"]
-        symlink(MOCK_APP_PATH, path.join(self.app_mock_dir, command))
+        symlink(mock_app_path, path.join(self.app_mock_dir, command))
         environ["PATH"] = f"{self.app_mock_dir}:{self.old_path}"
 
     def __enter__(self):
@@ -199,3 +203,91 @@ class GitTestCase(ShellScriptTestCase):
             return_code = self.run_bash_command(command)
 
         self.assertEqual(1, return_code)
+
+
+class GitLocalRepositoryTestCase(ShellScriptTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.mkdtemp(prefix="o2a-git-test")
+        self.repository_path = path.join(self.tmp_dir, "repository.git")
+        self.work_path = path.join(self.tmp_dir, "work")
+        self.git("init", "--quiet", "--bare", self.repository_path)
+        self.git("init", "--quiet", self.work_path)
+        self.git("-C", self.work_path, "checkout", "--quiet", "-b", "master")
+        self.commit({"src/main.py": "first", "docs/index.md": "first"})
+        self.commit({"src/main.py": "second"})
+
+    def tearDown(self):
+        super().tearDown()
+        shutil.rmtree(self.tmp_dir)
+
+    @staticmethod
+    def git(*args):
+        env = {
+            **environ,
+            "GIT_AUTHOR_NAME": "o2a",
+            "GIT_AUTHOR_EMAIL": "o2a@example.com",
+            "GIT_COMMITTER_NAME": "o2a",
+            "GIT_COMMITTER_EMAIL": "o2a@example.com",
+        }
+        process = subprocess.run(
+            args=["git", *args], env=env, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        return process.stdout.decode()
+
+    def commit(self, files):
+        for file_path, content in files.items():
+            full_path = path.join(self.work_path, file_path)
+            makedirs(path.dirname(full_path), exist_ok=True)
+            with open(full_path, "w") as file:
+                file.write(content)
+        self.git("-C", self.work_path, "add", ".")
+        self.git("-C", self.work_path, "commit", "--quiet", "-m", "commit")
+        self.git("-C", self.work_path, "push", "--quiet", self.repository_path, "master")
+
+    def clone(self, destination_name, options=""):
+        destination_path = path.join(self.tmp_dir, destination_name)
+        with mock_app("gcloud", mock_app_path=LOCAL_GCLOUD_PATH):
+            return_code = self.run_bash_command(
+                f"{GIT_SH_FILE} --git-uri file://{self.repository_path} "
+                f"--destination-path {destination_path} --region REGION --cluster CLUSTER {options}"
+            )
+        self.assertEqual(0, return_code)
+        return destination_path
+
+    def get_commit_count(self, repository_path):
+        return len(self.git("-C", repository_path, "log", "--oneline").splitlines())
+
+    def test_full_clone(self):
+        destination_path = self.clone("full")
+
+        self.assertEqual(2, self.get_commit_count(destination_path))
+        self.assertTrue(path.isfile(path.join(destination_path, "src", "main.py")))
+        self.assertTrue(path.isfile(path.join(destination_path, "docs", "index.md")))
+
+    def test_shallow_clone(self):
+        destination_path = self.clone("shallow", "--depth 1")
+
+        self.assertEqual(1, self.get_commit_count(destination_path))
+        with open(path.join(destination_path, "src", "main.py")) as file:
+            self.assertEqual("second", file.read())
+
+    def test_sparse_checkout(self):
+        destination_path = self.clone("sparse", "--sparse-path src")
+
+        self.assertTrue(path.isfile(path.join(destination_path, "src", "main.py")))
+        self.assertFalse(path.exists(path.join(destination_path, "docs")))
+
+    def test_mirror_cache(self):
+        cache_path = path.join(self.tmp_dir, "cache")
+        self.clone("first", f"--mirror-cache {cache_path}")
+        self.commit({"src/main.py": "third"})
+
+        destination_path = self.clone("second", f"--mirror-cache {cache_path} --depth 1")
+
+        mirror_names = [name for name in listdir(cache_path) if name.endswith(".git")]
+        self.assertEqual(1, len(mirror_names))
+        self.assertEqual(3, self.get_commit_count(path.join(cache_path, mirror_names[0])))
+        self.assertEqual(1, self.get_commit_count(destination_path))
+        with open(path.join(destination_path, "src", "main.py")) as file:
+            self.assertEqual("third", file.read())
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests conversion server"""
+import http.client
+import os
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from parameterized import parameterized
+
+from o2a import o2a, server
+from o2a.converter.exceptions import O2AException, ParseException
+
+
+class RunConversionTestCase(unittest.TestCase):
+    def test_options_to_args(self):
+        self.assertEqual(
+            ["--input-directory-path", "in", "--dot", "--start-days-ago", "2"],
+            server.options_to_args(
+                {"input_directory_path": "in", "dot": True, "json": False, "user": None, "start_days_ago": 2}
+            ),
+        )
+
+    @mock.patch("o2a.server.cli.convert")
+    def test_run_conversion(self, convert_mock):
+        result = server.run_conversion({"input_directory_path": "/in/demo", "output_directory_path": "/out"})
+
+        convert_mock.assert_called_once()
+        args = convert_mock.call_args[0][0]
+        self.assertEqual("/in/demo", args.input_directory_path)
+        self.assertEqual("/out", args.output_directory_path)
+        self.assertEqual("demo", result["dag_name"])
+        self.assertEqual("/out", result["output_directory_path"])
+
+    @mock.patch("o2a.server.cli.convert")
+    def test_run_conversion_should_reject_invalid_options(self, convert_mock):
+        with self.assertRaisesRegex(server.BadRequestException, "output-directory-path"):
+            server.run_conversion({"input_directory_path": "/in/demo"})
+        with self.assertRaisesRegex(server.BadRequestException, "unrecognized arguments: --unknown"):
+            server.run_conversion(
+                {"input_directory_path": "/in", "output_directory_path": "/out", "unknown": 1}
+            )
+        convert_mock.assert_not_called()
+
+    @mock.patch("o2a.server.cli.convert")
+    def test_run_conversion_should_reject_help(self, convert_mock):
+        with self.assertRaisesRegex(server.BadRequestException, "Invalid conversion options"):
+            server.run_conversion({"help": True})
+        convert_mock.assert_not_called()
+
+    @mock.patch("o2a.server.cli.convert")
+    def test_run_conversion_should_reject_watch_mode(self, convert_mock):
+        with self.assertRaisesRegex(server.BadRequestException, "watch mode is not supported"):
+            server.run_conversion(
+                {"input_directory_path": "/in", "output_directory_path": "/out", "watch": True}
+            )
+        convert_mock.assert_not_called()
+
+    @mock.patch("o2a.server.cli.convert", side_effect=SystemExit(1))
+    def test_run_conversion_should_not_exit_worker(self, _):
+        with self.assertRaisesRegex(O2AException, "exited with code 1"):
+            server.run_conversion({"input_directory_path": "/in", "output_directory_path": "/out"})
+
+
+def _slow_conversion(options):
+    time.sleep(options.get("sleep", 0))
+    if options.get("fail"):
+        raise ParseException("Invalid workflow")
+    if options.get("marker"):
+        open(options["marker"], "w").close()
+    result = {"dag_name": options["dag_name"], "output_directory_path": options.get("output_directory_path")}
+    if options.get("pid"):
+        result["pid"] = os.getpid()
+    return result
+
+
+class ConversionServerTestCase(unittest.TestCase):
+    def setUp(self):
+        # The worker processes are forked when the service is created
+        patcher = mock.patch("o2a.server.run_conversion", _slow_conversion)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.output_root = tempfile.TemporaryDirectory()
+        self.addCleanup(self.output_root.cleanup)
+        self.service = server.ConversionService(workers=4, timeout=5, output_root=self.output_root.name)
+        self.addCleanup(self.service.close)
+        self.server = server.create_server(self.service, host="127.0.0.1", port=0)
+        self.client = server.ConversionClient(port=self.server.server_address[1])
+        self._serve()
+
+    def _serve(self):
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.start()
+
+        def stop():
+            self.server.shutdown()
+            self.server.server_close()
+            thread.join()
+
+        self.addCleanup(stop)
+
+    def test_health(self):
+        self.assertEqual({"status": "ok"}, self.client.health())
+
+    def test_convert(self):
+        self.assertEqual(
+            {"status": "ok", "dag_name": "demo", "output_directory_path": None},
+            self.client.convert(dag_name="demo"),
+        )
+
+        metrics = self.client.metrics()
+        self.assertEqual(1, metrics["requests_total"])
+        self.assertEqual(1, metrics["requests_succeeded"])
+        self.assertEqual(0, metrics["requests_in_progress"])
+
+    def test_convert_concurrently(self):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(lambda i: self.client.convert(dag_name=f"dag_{i}", sleep=0.2), range(4))
+            )
+
+        self.assertEqual([f"dag_{i}" for i in range(4)], [result["dag_name"] for result in results])
+        metrics = self.client.metrics()
+        self.assertEqual(4, metrics["requests_succeeded"])
+        self.assertLess(metrics["conversion_seconds_max"], 0.2 * 4)
+
+    def test_convert_should_reuse_worker_processes(self):
+        pids = {self.client.convert(dag_name="demo", pid=True)["pid"] for _ in range(8)}
+
+        self.assertLessEqual(len(pids), 4)
+        self.assertNotIn(os.getpid(), pids)
+
+    def test_convert_should_time_out(self):
+        marker = os.path.join(self.output_root.name, "finished")
+        with self.assertRaises(server.ServerException) as context:
+            self.client.convert(dag_name="demo", sleep=0.5, marker=marker, timeout=0.05)
+
+        self.assertEqual(504, context.exception.status)
+        self.assertEqual(1, self.client.metrics()["requests_timed_out"])
+        # The worker process is killed and replaced
+        time.sleep(1)
+        self.assertFalse(os.path.exists(marker))
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda i: self.client.convert(dag_name=f"dag_{i}"), range(4)))
+        self.assertEqual(4, len(results))
+
+    @parameterized.expand([("soon",), (0,), (-1,), ("nan",), (None,)])
+    def test_convert_should_reject_invalid_timeout(self, timeout):
+        with self.assertRaisesRegex(server.ServerException, "timeout must be") as context:
+            self.client.convert(dag_name="demo", timeout=timeout)
+
+        self.assertEqual(400, context.exception.status)
+        self.assertEqual(1, self.client.metrics()["requests_rejected"])
+
+    def test_convert_should_resolve_output_directory_in_output_root(self):
+        result = self.client.convert(dag_name="demo", output_directory_path="output/demo")
+
+        self.assertEqual(
+            os.path.join(os.path.realpath(self.output_root.name), "output", "demo"),
+            result["output_directory_path"],
+        )
+
+    @parameterized.expand([("../outside",), ("/tmp",), (".",)])
+    def test_convert_should_reject_output_directory_outside_output_root(self, output_directory_path):
+        with self.assertRaisesRegex(server.ServerException, "must be inside") as context:
+            self.client.convert(dag_name="demo", output_directory_path=output_directory_path)
+
+        self.assertEqual(400, context.exception.status)
+        self.assertEqual(1, self.client.metrics()["requests_rejected"])
+
+    def test_convert_should_report_failure(self):
+        with self.assertRaisesRegex(server.ServerException, "ParseException: Invalid workflow") as context:
+            self.client.convert(dag_name="demo", fail=True)
+
+        self.assertEqual(500, context.exception.status)
+        self.assertEqual(1, self.client.metrics()["requests_failed"])
+
+    def test_convert_should_reject_invalid_request(self):
+        connection = http.client.HTTPConnection("127.0.0.1", self.server.server_address[1])
+        connection.request("POST", "/convert", body=b"[1, 2]")
+        response = connection.getresponse()
+        response.read()
+        connection.close()
+
+        self.assertEqual(400, response.status)
+
+    def test_unknown_path(self):
+        with self.assertRaises(server.ServerException) as context:
+            self.client._request("GET", "/unknown")
+
+        self.assertEqual(404, context.exception.status)
+
+
+@mock.patch("o2a.server.run_conversion", _slow_conversion)
+class UnixConversionServerTestCase(unittest.TestCase):
+    def test_convert(self):
+        with tempfile.TemporaryDirectory() as directory:
+            socket_path = os.path.join(directory, "o2a.sock")
+            service = server.ConversionService(workers=1)
+            self.addCleanup(service.close)
+            unix_server = server.create_server(service, socket_path=socket_path)
+            thread = threading.Thread(target=unix_server.serve_forever)
+            thread.start()
+            try:
+                client = server.ConversionClient(socket_path=socket_path)
+                self.assertEqual("demo", client.convert(dag_name="demo")["dag_name"])
+            finally:
+                unix_server.shutdown()
+                unix_server.server_close()
+                thread.join()
+
+            self.assertFalse(os.path.exists(socket_path))
+
+
+class ServeCommandTestCase(unittest.TestCase):
+    @mock.patch("o2a.server.main")
+    def test_o2a_serve_should_start_server(self, main_mock):
+        with mock.patch("sys.argv", ["o2a", "serve", "--port", "1234"]):
+            o2a.main()
+
+        main_mock.assert_called_once_with(["--port", "1234"])
+
+    def test_parse_args(self):
+        args = server.parse_args(["-S", "/tmp/o2a.sock", "-w", "2", "-t", "10", "-o", "/tmp/output"])
+
+        self.assertEqual("/tmp/o2a.sock", args.socket)
+        self.assertEqual(2, args.workers)
+        self.assertEqual(10.0, args.timeout)
+        self.assertEqual("/tmp/output", args.output_root)
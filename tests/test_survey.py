@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests the survey of the workflow applications"""
+import contextlib
+import csv
+import io
+import json
+import os
+import tempfile
+import textwrap
+import unittest
+
+from parameterized import parameterized
+
+from o2a import survey
+
+# language=XML
+NESTED_FORKS_WORKFLOW = """
+<workflow-app xmlns="uri:oozie:workflow:1.0" name="nested">
+    <parameters>
+        <property><name>queue</name><value>default</value></property>
+    </parameters>
+    <start to="outer-fork"/>
+    <fork name="outer-fork">
+        <path start="inner-fork"/>
+        <path start="mail"/>
+    </fork>
+    <fork name="inner-fork">
+        <path start="shell"/>
+        <path start="decide"/>
+    </fork>
+    <action name="shell">
+        <shell xmlns="uri:oozie:shell-action:1.0">
+            <configuration>
+                <property><name>size</name><value>${fs:fileSize('/a') gt 10 * MB}</value></property>
+            </configuration>
+            <exec>echo</exec>
+            <argument>${concat(wf:conf('a'), 'concat(b)')}</argument>
+        </shell>
+        <ok to="inner-join"/>
+        <error to="fail"/>
+    </action>
+    <decision name="decide">
+        <switch>
+            <case to="inner-join">${firstNotNull(wf:conf('x'), '') eq 'y'}</case>
+            <default to="inner-join"/>
+        </switch>
+    </decision>
+    <join name="inner-join" to="outer-join"/>
+    <action name="mail">
+        <email xmlns="uri:oozie:email-action:0.2">
+            <to>user@example.com</to>
+        </email>
+        <ok to="outer-join"/>
+        <error to="fail"/>
+    </action>
+    <join name="outer-join" to="end"/>
+    <kill name="fail">
+        <message>${wf:errorMessage(wf:lastErrorNode())}</message>
+    </kill>
+    <end name="end"/>
+</workflow-app>
+"""
+
+# language=XML
+SIMPLE_WORKFLOW = """
+<workflow-app xmlns="uri:oozie:workflow:1.0" name="simple">
+    <start to="end"/>
+    <end name="end"/>
+</workflow-app>
+"""
+
+
+class SurveyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = self.directory.name
+        self._write("apps/nested/hdfs/workflow.xml", NESTED_FORKS_WORKFLOW)
+        self._write("apps/nested/job.properties", "# comment\nnameNode=hdfs://\nqueue=default\n")
+        self._write("apps/nested/configuration.properties", "dataproc_cluster=cluster\n")
+        self._write("apps/simple/hdfs/workflow.xml", SIMPLE_WORKFLOW)
+        self._write("broken/hdfs/workflow.xml", "<workflow-app>")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _write(self, name, content):
+        path = os.path.join(self.path, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as file:
+            file.write(textwrap.dedent(content))
+
+    def _path(self, name):
+        return os.path.join(self.path, name)
+
+    def test_find_apps(self):
+        self.assertEqual(
+            [self._path("apps/nested"), self._path("apps/simple"), self._path("broken")],
+            list(survey.find_apps([self.path])),
+        )
+
+    def test_survey_app(self):
+        report = survey.survey_app(self._path("apps/nested"))
+
+        self.assertEqual(
+            {"start": 1, "fork": 2, "action": 2, "decision": 1, "join": 2, "kill": 1, "end": 1},
+            report.node_kinds,
+        )
+        self.assertEqual({"shell": 1, "email": 1}, report.action_types)
+        self.assertEqual(
+            {
+                "fs:fileSize": 1,
+                "concat": 1,
+                "wf:conf": 2,
+                "firstNotNull": 1,
+                "wf:errorMessage": 1,
+                "wf:lastErrorNode": 1,
+            },
+            report.el_functions,
+        )
+        self.assertEqual(2, report.max_fork_depth)
+        # Three in the property files, one in the parameters and one in the configuration
+        self.assertEqual(5, report.property_count)
+        self.assertEqual(
+            {"action:email": 1, "element:parameters": 1, "el:fs:fileSize": 1}, report.unsupported
+        )
+        # 10 nodes, 1 decision, 2 levels of forks, 1 action, 1 EL function and 1 element
+        self.assertEqual(10 + 2 + 4 + 8 + 3 + 5, report.cost)
+        self.assertIsNone(report.error)
+
+    @parameterized.expand(
+        [
+            ("concat", True),
+            ("toPropertiesStr", True),
+            ("wf:conf", True),
+            ("wf:lastErrorNode", True),
+            ("wf:actionExternalId", True),
+            ("fs:fileSize", False),
+            ("unknown", False),
+        ]
+    )
+    def test_is_supported_el_function(self, name, expected):
+        self.assertEqual(expected, survey.is_supported_el_function(name))
+
+    def test_survey_app_should_report_error(self):
+        report = survey.survey_app(self._path("broken"))
+
+        self.assertIn("no element found", report.error)
+        self.assertEqual(0, report.cost)
+
+    def test_survey_apps(self):
+        paths = [self._path("apps/nested"), self._path("apps/simple"), self._path("broken")]
+
+        reports = list(survey.survey_apps(paths, workers=2, chunk_size=1))
+
+        self.assertEqual(paths, [report.path for report in reports])
+        self.assertEqual([None, None, True], [report.error and True for report in reports])
+
+    def test_summarize(self):
+        reports = [survey.survey_app(self._path(name)) for name in ("apps/nested", "apps/simple", "broken")]
+
+        summary = survey.summarize(reports)
+
+        self.assertEqual(
+            {"start": 2, "fork": 2, "action": 2, "decision": 1, "join": 2, "kill": 1, "end": 2},
+            summary.node_kinds,
+        )
+        self.assertEqual(2, summary.max_fork_depth)
+        self.assertEqual(reports[0].cost + 2, summary.cost)
+        self.assertEqual("1 errors", summary.error)
+
+    def test_write_csv_should_write_rows_as_reports_arrive(self):
+        reports = [survey.survey_app(self._path(name)) for name in ("apps/nested", "broken")]
+        output = io.StringIO()
+        written_rows = []
+
+        def generate_reports():
+            for report in reports:
+                written_rows.append(output.getvalue().count("\n"))
+                yield report
+
+        summary = survey.write_csv(generate_reports(), output)
+
+        self.assertEqual([1, 2], written_rows)
+        self.assertEqual(survey.summarize(reports), summary)
+        self.assertEqual(4, len(list(csv.reader(io.StringIO(output.getvalue())))))
+
+    def test_main_csv(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            exit_code = survey.main([self._path("apps"), "--workers", "2"])
+
+        self.assertEqual(0, exit_code)
+        rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+        self.assertEqual(
+            [self._path("apps/nested"), self._path("apps/simple"), "TOTAL"], [row["path"] for row in rows]
+        )
+        self.assertEqual("action=2 decision=1 end=2 fork=2 join=2 kill=1 start=2", rows[2]["node_kinds"])
+        self.assertEqual("email=1 shell=1", rows[2]["action_types"])
+
+    def test_main_json_should_fail_on_errors(self):
+        output_path = self._path("survey.json")
+
+        exit_code = survey.main([self.path, "--format", "json", "--output", output_path])
+
+        self.assertEqual(1, exit_code)
+        with open(output_path) as output:
+            result = json.load(output)
+        self.assertEqual(3, len(result["apps"]))
+        self.assertEqual(2, result["summary"]["max_fork_depth"])
+        self.assertEqual("1 errors", result["summary"]["error"])
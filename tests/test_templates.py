@@ -178,12 +178,18 @@ class DecisionTemplateTestCase(TestCase, TemplateTestMixin):
     DEFAULT_TEMPLATE_PARAMS = dict(
         task_id="DAG_NAME_A",
         trigger_rule=TriggerRule.DUMMY,
-        case_dict={"first_not_null('', '')": "task1", "'True'": "task2", "default": "task3"},
+        case_dict={
+            "el_operators.to_boolean(el_basic_functions.first_not_null('', ''))": "task1",
+            "el_operators.to_boolean(el_operators.gt(props['size'], 10))": "task2",
+            "default": "task3",
+        },
     )
 
     def test_minimal_green_path(self):
         res = render_template(self.TEMPLATE_NAME, **self.DEFAULT_TEMPLATE_PARAMS)
         self.assertValidPython(res)
+        self.assertIn("props = DAG_NAME_A_props", res)
+        self.assertIn("elif el_operators.to_boolean(el_operators.gt(props['size'], 10)):", res)
 
     @parameterized.expand(
         [({"task_id": 'AA"AA"\''},), ({"trigger_rule": 'AA"AA"\''},), ({"case_dict": {"default": 'tas"k3'}},)]
@@ -194,6 +200,31 @@ class DecisionTemplateTestCase(TestCase, TemplateTestMixin):
         self.assertValidPython(res)
 
 
+class DataProcJobSensorTemplateTestCase(TestCase, TemplateTestMixin):
+    TEMPLATE_NAME = "dataproc_job_sensor.tpl"
+
+    DEFAULT_TEMPLATE_PARAMS = dict(
+        task_id="AA_sensor",
+        trigger_rule=TriggerRule.DUMMY,
+        job_id="{{ task_instance.xcom_pull(task_ids='AA') }}",
+        poke_interval=300,
+    )
+
+    def test_minimal_green_path(self):
+        res = render_template(self.TEMPLATE_NAME, **self.DEFAULT_TEMPLATE_PARAMS)
+        self.assertValidPython(res)
+        self.assertIn("AA_sensor = dataproc_jobs_lib.DataProcJobSensor(", res)
+        self.assertIn("mode='reschedule'", res)
+
+    @parameterized.expand(
+        [({"task_id": 'AA"AA"\''},), ({"trigger_rule": 'AA"AA"\''},), ({"job_id": 'AA"AA"\''},)]
+    )
+    def test_escape_character(self, mutation):
+        template_params = mutate(self.DEFAULT_TEMPLATE_PARAMS, mutations=mutation)
+        res = render_template(self.TEMPLATE_NAME, **template_params)
+        self.assertValidPython(res)
+
+
 class DummyTemplateTestCase(TestCase, TemplateTestMixin):
     TEMPLATE_NAME = "dummy.tpl"
 
@@ -237,6 +268,19 @@ class FsOpTempalteTestCase(TestCase, TemplateTestMixin):
         res = render_template(self.TEMPLATE_NAME, **template_params)
         self.assertValidPython(res)
 
+    def test_async_submit(self):
+        template_params = mutate(self.DEFAULT_TEMPLATE_PARAMS, {"async_submit": True})
+        res = render_template(self.TEMPLATE_NAME, **template_params)
+        self.assertValidPython(res)
+        self.assertIn("--async --format='value(reference.jobId)'", res)
+        self.assertIn("xcom_push=True", res)
+
+    def test_should_keep_lines_of_pig_script(self):
+        template_params = mutate(self.DEFAULT_TEMPLATE_PARAMS, {"pig_command": "sh echo a\nfs -mkdir -p /a"})
+        res = render_template(self.TEMPLATE_NAME, **template_params)
+        self.assertValidPython(res)
+        self.assertIn("shlex.quote('sh echo a\\nfs -mkdir -p /a')", res)
+
 
 class GitTemplateTestCase(TestCase, TemplateTestMixin):
     TEMPLATE_NAME = "git.tpl"
@@ -262,6 +306,9 @@ class GitTemplateTestCase(TestCase, TemplateTestMixin):
             ({"destination_path": None},),
             ({"key_path_uri": None},),
             ({"key_path": None},),
+            ({"depth": 1},),
+            ({"sparse_paths": ["src", "docs"]},),
+            ({"mirror_cache_path": "/var/cache/git"},),
         ]
     )
     def test_optional_parameters(self, mutation):
@@ -269,6 +316,18 @@ class GitTemplateTestCase(TestCase, TemplateTestMixin):
         res = render_template(self.TEMPLATE_NAME, **template_params)
         self.assertValidPython(res)
 
+    def test_clone_options(self):
+        template_params = mutate(
+            self.DEFAULT_TEMPLATE_PARAMS,
+            {"depth": 1, "sparse_paths": ["src", "docs"], "mirror_cache_path": "/var/cache/git"},
+        )
+        res = render_template(self.TEMPLATE_NAME, **template_params)
+        self.assertValidPython(res)
+        self.assertIn('"--key-path %s "', res)
+        self.assertIn('"--depth %s "', res)
+        self.assertEqual(2, res.count('"--sparse-path %s "'))
+        self.assertIn("shlex.quote('/var/cache/git')", res)
+
     @parameterized.expand([({"task_id": 'AA"AA"\''},), ({"trigger_rule": 'AA"AA"\''},)])
     def test_escape_character(self, mutation):
         template_params = mutate(self.DEFAULT_TEMPLATE_PARAMS, mutations=mutation)
@@ -318,6 +377,13 @@ class HiveTemplateTestCase(TestCase, TemplateTestMixin):
         res = render_template(self.TEMPLATE_NAME, **template_params)
         self.assertValidPython(res)
 
+    def test_async_submit(self):
+        template_params = mutate(self.DEFAULT_TEMPLATE_PARAMS, {"async_submit": True})
+        res = render_template(self.TEMPLATE_NAME, **template_params)
+        self.assertValidPython(res)
+        self.assertIn("AA = dataproc_jobs_lib.DataProcJobSubmitOperator(", res)
+        self.assertIn('job_type="hiveJob"', res)
+
 
 class KillTemplateTestCase(TestCase, TemplateTestMixin):
     TEMPLATE_NAME = "kill.tpl"
@@ -380,6 +446,13 @@ class MapReduceTemplateTestCase(TestCase, TemplateTestMixin):
         res = render_template(self.TEMPLATE_NAME, **template_params)
         self.assertValidPython(res)
 
+    def test_async_submit(self):
+        template_params = mutate(self.DEFAULT_TEMPLATE_PARAMS, {"async_submit": True})
+        res = render_template(self.TEMPLATE_NAME, **template_params)
+        self.assertValidPython(res)
+        self.assertIn("dataproc_jobs_lib.DataProcJobSubmitOperator(", res)
+        self.assertIn('job_type="hadoopJob"', res)
+
 
 class PigTemplateTestCase(TestCase, TemplateTestMixin):
     TEMPLATE_NAME = "pig.tpl"
@@ -421,6 +494,13 @@ class PigTemplateTestCase(TestCase, TemplateTestMixin):
         res = render_template("pig.tpl", **template_params)
         self.assertValidPython(res)
 
+    def test_async_submit(self):
+        template_params = mutate(self.DEFAULT_TEMPLATE_PARAMS, {"async_submit": True})
+        res = render_template(self.TEMPLATE_NAME, **template_params)
+        self.assertValidPython(res)
+        self.assertIn("AA = dataproc_jobs_lib.DataProcJobSubmitOperator(", res)
+        self.assertIn('job_type="pigJob"', res)
+
 
 class PrepareTemplateTestCase(TestCase, TemplateTestMixin):
     TEMPLATE_NAME = "prepare.tpl"
@@ -473,6 +553,21 @@ class ShellTemplateTestCase(TestCase, TemplateTestMixin):
         res = render_template(self.TEMPLATE_NAME, **template_params)
         self.assertValidPython(res)
 
+    def test_should_use_given_properties(self):
+        template_params = {
+            **self.DEFAULT_TEMPLATE_PARAMS,
+            "config_var": "subwf_config",
+            "job_properties_var": "subwf_job_props",
+        }
+
+        res = render_template(self.TEMPLATE_NAME, **template_params)
+
+        self.assertIn("subwf_config['dataproc_cluster']", res)
+        self.assertIn("config=subwf_config,", res)
+        self.assertIn("job_properties=subwf_job_props,", res)
+        self.assertNotIn("CONFIG", res)
+        self.assertNotIn("JOB_PROPS", res)
+
 
 class SparkTemplateTestCase(TestCase, TemplateTestMixin):
     TEMPLATE_NAME = "spark.tpl"
@@ -528,6 +623,13 @@ class SparkTemplateTestCase(TestCase, TemplateTestMixin):
         res = render_template(self.TEMPLATE_NAME, **template_params)
         self.assertValidPython(res)
 
+    def test_async_submit(self):
+        template_params = mutate(self.DEFAULT_TEMPLATE_PARAMS, {"async_submit": True})
+        res = render_template(self.TEMPLATE_NAME, **template_params)
+        self.assertValidPython(res)
+        self.assertIn("AA = dataproc_jobs_lib.DataProcJobSubmitOperator(", res)
+        self.assertIn('job_type="sparkJob"', res)
+
 
 class SshTemplateTestCase(TestCase, TemplateTestMixin):
     TEMPLATE_NAME = "ssh.tpl"
@@ -545,6 +647,7 @@ class SshTemplateTestCase(TestCase, TemplateTestMixin):
     def test_minimal_green_path(self):
         res = render_template(self.TEMPLATE_NAME, **self.DEFAULT_TEMPLATE_PARAMS)
         self.assertValidPython(res)
+        self.assertIn("lazy_ssh_operator.LazySSHOperator(", res)
 
     @parameterized.expand([({"action_node_properties": {}},)])
     def test_optional_parameters(self, mutation):
@@ -587,6 +690,54 @@ class SubwfTemplateTestCase(TestCase, TemplateTestMixin):
         self.assertValidPython(res)
 
 
+class SubwfInlineStartTemplateTestCase(TestCase, TemplateTestMixin):
+    TEMPLATE_NAME = "subwf_inline_start.tpl"
+
+    DEFAULT_TEMPLATE_PARAMS = {
+        "task_id": "test_id",
+        "trigger_rule": "dummy",
+        "config": {"dataproc_cluster": "test_cluster"},
+        "job_properties": {"nameNode": "hdfs://", "queues": ["a", "b"]},
+        "config_var": "test_id_config",
+        "job_properties_var": "test_id_job_props",
+    }
+
+    def test_green_path(self):
+        res = render_template(self.TEMPLATE_NAME, **self.DEFAULT_TEMPLATE_PARAMS)
+        self.assertValidPython(res)
+        self.assertIn("test_id_config = {'dataproc_cluster': 'test_cluster'}", res)
+        self.assertNotIn("CONFIG", res)
+
+    @parameterized.expand(
+        [
+            ({"task_id": 'AA"AA"\''},),
+            ({"trigger_rule": 'AA"AA"\''},),
+            ({"config": {"key": "VAL\"UE'"}},),
+            ({"job_properties": {"key": "VAL\"UE'"}},),
+        ]
+    )
+    def test_escape_character(self, mutation):
+        template_params = mutate(self.DEFAULT_TEMPLATE_PARAMS, mutation)
+        res = render_template(self.TEMPLATE_NAME, **template_params)
+        self.assertValidPython(res)
+
+
+class SubwfInlineEndTemplateTestCase(TestCase, TemplateTestMixin):
+    TEMPLATE_NAME = "subwf_inline_end.tpl"
+
+    DEFAULT_TEMPLATE_PARAMS = {"task_id": "test_id", "trigger_rule": "dummy"}
+
+    def test_green_path(self):
+        res = render_template(self.TEMPLATE_NAME, **self.DEFAULT_TEMPLATE_PARAMS)
+        self.assertValidPython(res)
+
+    @parameterized.expand([({"task_id": 'AA"AA"\''},), ({"trigger_rule": 'AA"AA"\''},)])
+    def test_escape_character(self, mutation):
+        template_params = mutate(self.DEFAULT_TEMPLATE_PARAMS, mutation)
+        res = render_template(self.TEMPLATE_NAME, **template_params)
+        self.assertValidPython(res)
+
+
 class WorkflowTemplateTestCase(TestCase, TemplateTestMixin):
     TEMPLATE_NAME = "workflow.tpl"
 
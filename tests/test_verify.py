@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests DAG verification"""
+import contextlib
+import io
+import json
+import os
+import tempfile
+import textwrap
+import unittest
+
+from o2a import verify
+
+DAG_FILE = """
+from airflow import models
+from airflow.operators import dummy_operator
+from airflow.utils import dates
+
+import subdag_child
+
+with models.DAG("{dag_id}", schedule_interval=None, start_date=dates.days_ago(0)) as dag:
+    for i in range(subdag_child.TASK_COUNT):
+        dummy_operator.DummyOperator(task_id=f"task_{{i}}")
+"""
+
+SUBDAG_FILE = """
+TASK_COUNT = {task_count}
+"""
+
+
+class VerifyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = self.directory.name
+        self._write("first/first.py", DAG_FILE.format(dag_id="first"))
+        self._write("first/subdag_child.py", SUBDAG_FILE.format(task_count=2))
+        self._write("second/second.py", DAG_FILE.format(dag_id="second"))
+        self._write("second/subdag_child.py", SUBDAG_FILE.format(task_count=3))
+        self._write("broken/broken.py", "import not_existing_module\n")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _write(self, name, content):
+        path = os.path.join(self.path, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as file:
+            file.write(textwrap.dedent(content))
+
+    def _path(self, name):
+        return os.path.join(self.path, name)
+
+    def test_find_dag_files(self):
+        self.assertEqual(
+            [self._path("broken/broken.py"), self._path("first/first.py"), self._path("second/second.py")],
+            sorted(verify.find_dag_files([self.path])),
+        )
+        self.assertEqual(
+            [self._path("first/subdag_child.py")],
+            verify.find_dag_files([self._path("first/subdag_child.py")]),
+        )
+
+    def test_verify_files(self):
+        reports = verify.verify_files(
+            [self._path("first/first.py"), self._path("second/second.py"), self._path("broken/broken.py")],
+            workers=1,
+        )
+
+        first, second, broken = reports
+        self.assertEqual((["first"], 2, {}), (first.dag_ids, first.task_count, first.import_errors))
+        # The sub-DAG modules with the same name are not mixed up
+        self.assertEqual((["second"], 3, {}), (second.dag_ids, second.task_count, second.import_errors))
+        self.assertEqual([], broken.dag_ids)
+        self.assertIn("not_existing_module", broken.import_errors[self._path("broken/broken.py")])
+        self.assertTrue(all(report.parse_time > 0 for report in reports))
+
+    def test_main(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            exit_code = verify.main([self._path("first"), self._path("second"), "--workers", "2"])
+
+        self.assertEqual(0, exit_code)
+        self.assertIn("2 files, 0 with import errors", output.getvalue())
+
+    def test_main_should_fail_on_import_errors(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            exit_code = verify.main([self.path, "--json"])
+
+        self.assertEqual(1, exit_code)
+        reports = json.loads(output.getvalue())
+        self.assertEqual(
+            {
+                self._path("broken/broken.py"): True,
+                self._path("first/first.py"): False,
+                self._path("second/second.py"): False,
+            },
+            {report["path"]: bool(report["import_errors"]) for report in reports},
+        )
+
+    def test_main_should_fail_on_slow_files(self):
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()) as stderr:
+            exit_code = verify.main([self._path("first"), "--max-parse-time", "0"])
+
+        self.assertEqual(1, exit_code)
+        self.assertIn("first.py took", stderr.getvalue())
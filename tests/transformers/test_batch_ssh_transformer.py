@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Batch SSH Transformer tests
+"""
+import unittest
+
+from airflow.utils.trigger_rule import TriggerRule
+
+from o2a.converter.parsed_action_node import ParsedActionNode
+from o2a.converter.relation import Relation
+from o2a.converter.task import Task
+from o2a.converter.workflow import Workflow
+from o2a.transformers.batch_ssh_transformer import BatchSshTransformer
+from tests.transformers.utils import add_node, get_relations
+
+
+def _add_node(workflow: Workflow, task: Task) -> ParsedActionNode:
+    return add_node(workflow, task.task_id, [task])
+
+
+def _ssh_task(task_id: str, command: str, host: str = "apache.org", trigger_rule=TriggerRule.ALL_SUCCESS):
+    return Task(
+        task_id=task_id,
+        template_name="ssh.tpl",
+        trigger_rule=trigger_rule,
+        template_params={"command": command, "user": "user", "host": host},
+    )
+
+
+class BatchSshTransformerTest(unittest.TestCase):
+    def setUp(self):
+        self.workflow = Workflow(input_directory_path="", output_directory_path="", dag_name="DAG_NAME_B")
+        _add_node(self.workflow, _ssh_task("first", "ls", trigger_rule=TriggerRule.DUMMY))
+        _add_node(self.workflow, _ssh_task("second", "pwd"))
+        _add_node(self.workflow, _ssh_task("third", "whoami"))
+        _add_node(self.workflow, _ssh_task("other_host", "date", host="example.com"))
+        _add_node(self.workflow, Task(task_id="fail", template_name="kill.tpl"))
+        self.workflow.relations.update(
+            {
+                Relation(from_task_id="first", to_task_id="second"),
+                Relation(from_task_id="second", to_task_id="third"),
+                Relation(from_task_id="third", to_task_id="other_host"),
+                Relation(from_task_id="first", to_task_id="fail", is_error=True),
+                Relation(from_task_id="second", to_task_id="fail", is_error=True),
+                Relation(from_task_id="third", to_task_id="fail", is_error=True),
+                Relation(from_task_id="other_host", to_task_id="fail", is_error=True),
+            }
+        )
+
+    def test_should_merge_commands_sent_to_same_host(self):
+        BatchSshTransformer().process_workflow(self.workflow)
+
+        self.assertEqual({"first", "other_host", "fail"}, set(self.workflow.nodes))
+        self.assertEqual(
+            _ssh_task("first", "( ls ) && ( pwd ) && ( whoami )", trigger_rule=TriggerRule.DUMMY),
+            self.workflow.nodes["first"].tasks[0],
+        )
+        self.assertEqual(
+            {"first>other_host", "first>fail", "other_host>fail"}, get_relations(self.workflow.relations)
+        )
+
+    def test_should_not_merge_commands_with_different_error_handling(self):
+        self.workflow.relations.remove(Relation(from_task_id="second", to_task_id="fail", is_error=True))
+        self.workflow.relations.remove(Relation(from_task_id="third", to_task_id="fail", is_error=True))
+
+        BatchSshTransformer().process_workflow(self.workflow)
+
+        self.assertEqual({"first", "second", "other_host", "fail"}, set(self.workflow.nodes))
+        self.assertEqual(
+            "( pwd ) && ( whoami )", self.workflow.nodes["second"].tasks[0].template_params["command"]
+        )
+
+    def test_should_not_merge_task_with_more_upstream_tasks(self):
+        _add_node(self.workflow, _ssh_task("fork", "echo"))
+        self.workflow.relations.add(Relation(from_task_id="fork", to_task_id="second"))
+
+        BatchSshTransformer().process_workflow(self.workflow)
+
+        self.assertEqual("ls", self.workflow.nodes["first"].tasks[0].template_params["command"])
+        self.assertEqual(
+            "( pwd ) && ( whoami )", self.workflow.nodes["second"].tasks[0].template_params["command"]
+        )
+
+    def test_should_run_commands_in_subshells(self):
+        self.workflow.nodes["first"].tasks[0].template_params["command"] = "cd /tmp; ls"
+        self.workflow.nodes["second"].tasks[0].template_params["command"] = "false || pwd"
+
+        BatchSshTransformer().process_workflow(self.workflow)
+
+        self.assertEqual(
+            "( cd /tmp; ls ) && ( false || pwd ) && ( whoami )",
+            self.workflow.nodes["first"].tasks[0].template_params["command"],
+        )
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Collapse Dummy Transformer tests
+"""
+import unittest
+from typing import Type
+from xml.etree import ElementTree as ET
+
+from airflow.utils.trigger_rule import TriggerRule
+
+from o2a.converter.relation import Relation
+from o2a.converter.task import Task
+from o2a.converter.workflow import Workflow
+from o2a.mappers.base_mapper import BaseMapper
+from o2a.mappers.dummy_mapper import DummyMapper
+from o2a.mappers.kill_mapper import KillMapper
+from o2a.transformers.collapse_dummy_transformer import CollapseDummyTransformer
+from tests.transformers.utils import add_node, add_relations, get_relations
+
+
+class CollapseDummyTransformerTest(unittest.TestCase):
+    def setUp(self):
+        self.workflow = Workflow(input_directory_path="", output_directory_path="", dag_name="DAG_NAME_B")
+
+    def _add_node(
+        self,
+        name: str,
+        trigger_rule: str = TriggerRule.ALL_SUCCESS,
+        mapper_class: Type[BaseMapper] = DummyMapper,
+        template_name: str = "dummy.tpl",
+    ):
+        mapper = mapper_class(oozie_node=ET.Element("action"), name=name, dag_name="DAG_NAME_B")
+        task = Task(task_id=name, template_name=template_name, trigger_rule=trigger_rule)
+        add_node(self.workflow, name, [task], mapper=mapper)
+
+    def _add_action(self, name: str, trigger_rule: str = TriggerRule.ALL_SUCCESS):
+        self._add_node(name, trigger_rule=trigger_rule, template_name="shell.tpl")
+
+    def _add_relations(self, *relations: str):
+        add_relations(self.workflow, *relations)
+
+    def _get_relations(self):
+        return get_relations(self.workflow.relations)
+
+    def test_should_collapse_fork_and_join(self):
+        self._add_action("first")
+        self._add_node("fork")
+        self._add_action("a")
+        self._add_action("b")
+        self._add_node("join")
+        self._add_action("last")
+        self._add_relations("first>fork", "fork>a", "fork>b", "a>join", "b>join", "join>last")
+
+        CollapseDummyTransformer().process_workflow(self.workflow)
+
+        self.assertEqual(["first", "a", "b", "last"], list(self.workflow.nodes.keys()))
+        self.assertEqual({"first>a", "first>b", "a>last", "b>last"}, self._get_relations())
+
+    def test_should_collapse_root_and_end(self):
+        self._add_node("start", trigger_rule=TriggerRule.DUMMY)
+        self._add_action("action")
+        self._add_node("end")
+        self._add_relations("start>action", "action>end")
+
+        CollapseDummyTransformer().process_workflow(self.workflow)
+
+        self.assertEqual(["action"], list(self.workflow.nodes.keys()))
+        self.assertEqual(set(), self._get_relations())
+
+    def test_should_not_collapse_root_before_error_handler(self):
+        self._add_node("start", trigger_rule=TriggerRule.DUMMY)
+        self._add_action("handler", trigger_rule=TriggerRule.ONE_FAILED)
+        self._add_relations("start>handler")
+
+        CollapseDummyTransformer().process_workflow(self.workflow)
+
+        self.assertEqual({"start>handler"}, self._get_relations())
+
+    def test_should_not_collapse_end_of_node_with_error_handler(self):
+        self._add_action("action")
+        self._add_node("end")
+        self._add_action("handler", trigger_rule=TriggerRule.ONE_FAILED)
+        self._add_relations("action>end", "action>handler")
+
+        CollapseDummyTransformer().process_workflow(self.workflow)
+
+        self.assertEqual({"action>end", "action>handler"}, self._get_relations())
+
+    def test_should_not_collapse_join_before_one_success(self):
+        self._add_action("a")
+        self._add_action("b")
+        self._add_node("join")
+        self._add_action("last", trigger_rule=TriggerRule.ONE_SUCCESS)
+        self._add_relations("a>join", "b>join", "join>last")
+
+        CollapseDummyTransformer().process_workflow(self.workflow)
+
+        self.assertEqual({"a>join", "b>join", "join>last"}, self._get_relations())
+
+    def test_should_not_collapse_dummy_after_decision_or_kill(self):
+        self._add_node("decision", template_name="decision.tpl")
+        self._add_node("branch")
+        self._add_action("action")
+        self._add_node("kill", mapper_class=KillMapper)
+        self._add_action("last")
+        self._add_relations("decision>branch", "branch>action", "action>kill", "kill>last")
+
+        CollapseDummyTransformer().process_workflow(self.workflow)
+
+        self.assertEqual(
+            {"decision>branch", "branch>action", "action>kill", "kill>last"}, self._get_relations()
+        )
+
+    def test_should_not_add_implied_relations(self):
+        self._add_action("first")
+        self._add_node("join")
+        self._add_action("second")
+        self._add_action("last")
+        self._add_relations("first>join", "first>second", "second>join", "join>last", "second>last")
+
+        CollapseDummyTransformer().process_workflow(self.workflow)
+
+        self.assertEqual({"first>second", "second>last"}, self._get_relations())
+
+    def test_should_merge_duplicated_dummies(self):
+        self._add_action("a")
+        self._add_action("b")
+        self._add_node("join_1")
+        self._add_node("join_2")
+        self._add_action("c", trigger_rule=TriggerRule.ONE_SUCCESS)
+        self._add_action("d", trigger_rule=TriggerRule.ONE_SUCCESS)
+        self._add_relations("a>join_1", "b>join_1", "a>join_2", "b>join_2", "join_1>c", "join_2>d")
+
+        CollapseDummyTransformer().process_workflow(self.workflow)
+
+        self.assertEqual(["a", "b", "join_1", "c", "d"], list(self.workflow.nodes.keys()))
+        self.assertEqual({"a>join_1", "b>join_1", "join_1>c", "join_1>d"}, self._get_relations())
+
+    def test_should_keep_relations_inside_node(self):
+        self._add_node("fork", trigger_rule=TriggerRule.DUMMY)
+        fork_node = self.workflow.nodes["fork"]
+        fork_node.tasks.append(Task(task_id="fork_prepare", template_name="prepare.tpl"))
+        fork_node.relations.append(Relation(from_task_id="fork", to_task_id="fork_prepare"))
+        self._add_action("action")
+        self._add_relations("fork_prepare>action")
+
+        CollapseDummyTransformer().process_workflow(self.workflow)
+
+        self.assertEqual(["fork_prepare"], [task.task_id for task in fork_node.tasks])
+        self.assertEqual([], fork_node.relations)
+        self.assertEqual({"fork_prepare>action"}, self._get_relations())
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Inline Subworkflow Transformer tests
+"""
+import unittest
+from unittest import mock
+
+from airflow.utils.trigger_rule import TriggerRule
+
+from o2a.converter.parsed_action_node import ParsedActionNode
+from o2a.converter.relation import Relation
+from o2a.converter.task import Task
+from o2a.converter.workflow import Workflow
+from o2a.mappers.subworkflow_mapper import SubworkflowMapper
+from o2a.o2a_libs.property_utils import PropertySet
+from o2a.transformers.inline_subworkflow_transformer import InlineSubworkflowTransformer
+from tests.transformers.utils import add_node, get_relations
+
+
+def _add_subworkflow_node(workflow: Workflow, name: str, subworkflow: Workflow) -> ParsedActionNode:
+    mapper = mock.Mock(spec=SubworkflowMapper)
+    mapper.name = name
+    mapper.subworkflow = subworkflow
+    mapper.props = PropertySet(config={"dataproc_cluster": "parent"}, job_properties={"parent": "a,b"})
+    mapper.subworkflow_props = PropertySet(
+        config={"dataproc_cluster": "child"}, job_properties={"child": "c"}
+    )
+    return add_node(workflow, name, [Task(task_id=name, template_name="dummy.tpl")], mapper=mapper)
+
+
+class InlineSubworkflowTransformerTest(unittest.TestCase):
+    def setUp(self):
+        self.subworkflow = Workflow(input_directory_path="", output_directory_path="", dag_name="child")
+        add_node(
+            self.subworkflow,
+            "first",
+            [
+                Task(task_id="first_prepare", template_name="prepare.tpl", trigger_rule=TriggerRule.DUMMY),
+                Task(task_id="first", template_name="shell.tpl", trigger_rule=TriggerRule.DUMMY),
+            ],
+        ).relations.append(Relation(from_task_id="first_prepare", to_task_id="first"))
+        add_node(
+            self.subworkflow,
+            "decision",
+            [
+                Task(
+                    task_id="decision",
+                    template_name="decision.tpl",
+                    template_params={"case_dict": {"'True'": "second", "default": "fail"}},
+                )
+            ],
+        )
+        add_node(self.subworkflow, "second", [Task(task_id="second", template_name="shell.tpl")])
+        add_node(
+            self.subworkflow,
+            "fail",
+            [Task(task_id="fail", template_name="dummy.tpl", trigger_rule=TriggerRule.ONE_FAILED)],
+        )
+        self.subworkflow.relations.update(
+            {
+                Relation(from_task_id="first", to_task_id="decision"),
+                Relation(from_task_id="decision", to_task_id="second"),
+                Relation(from_task_id="first", to_task_id="fail", is_error=True),
+            }
+        )
+
+        self.workflow = Workflow(input_directory_path="", output_directory_path="", dag_name="parent")
+        add_node(self.workflow, "before", [Task(task_id="before", template_name="shell.tpl")])
+        self.subworkflow_node = _add_subworkflow_node(self.workflow, "subwf", self.subworkflow)
+        add_node(self.workflow, "after", [Task(task_id="after", template_name="shell.tpl")])
+        self.workflow.relations.update(
+            {
+                Relation(from_task_id="before", to_task_id="subwf"),
+                Relation(from_task_id="subwf", to_task_id="after"),
+            }
+        )
+
+    def test_should_inline_tasks_and_relations(self):
+        InlineSubworkflowTransformer().process_workflow(self.workflow)
+
+        self.assertEqual(
+            [
+                "subwf",
+                "subwf.first_prepare",
+                "subwf.first",
+                "subwf.decision",
+                "subwf.second",
+                "subwf.fail",
+                "subwf.subworkflow_end",
+            ],
+            [task.task_id for task in self.subworkflow_node.tasks],
+        )
+        self.assertEqual(
+            {
+                "subwf>subwf.first_prepare",
+                "subwf.first_prepare>subwf.first",
+                "subwf.first>subwf.decision",
+                "subwf.decision>subwf.second",
+                "subwf.first>subwf.fail",
+                "subwf.second>subwf.subworkflow_end",
+            },
+            get_relations(self.subworkflow_node.relations),
+        )
+        self.assertEqual(
+            {"before>subwf", "subwf.subworkflow_end>after"}, get_relations(self.workflow.relations)
+        )
+
+    def test_should_update_trigger_rules_and_decisions(self):
+        InlineSubworkflowTransformer().process_workflow(self.workflow)
+
+        tasks = {task.task_id: task for task in self.subworkflow_node.tasks}
+        self.assertEqual(TriggerRule.ALL_SUCCESS, tasks["subwf.first_prepare"].trigger_rule)
+        self.assertEqual(TriggerRule.DUMMY, tasks["subwf.first"].trigger_rule)
+        self.assertEqual(TriggerRule.ONE_FAILED, tasks["subwf.fail"].trigger_rule)
+        self.assertEqual(
+            {"'True'": "subwf.second", "default": "subwf.fail"},
+            dict(tasks["subwf.decision"].template_params["case_dict"]),
+        )
+
+    def test_should_pass_subworkflow_properties_to_its_tasks(self):
+        InlineSubworkflowTransformer().process_workflow(self.workflow)
+
+        start_task, end_task = self.subworkflow_node.tasks[0], self.subworkflow_node.tasks[-1]
+        self.assertEqual("subwf_inline_start.tpl", start_task.template_name)
+        self.assertEqual(
+            {
+                "config": {"dataproc_cluster": "child"},
+                "job_properties": {"child": "c"},
+                "props_task_id": "subwf",
+                "config_var": "subwf_config",
+                "job_properties_var": "subwf_job_props",
+            },
+            start_task.template_params,
+        )
+        self.assertEqual("subwf_inline_end.tpl", end_task.template_name)
+        self.assertEqual({}, end_task.template_params)
+        for task in self.subworkflow_node.tasks[1:-1]:
+            self.assertEqual("subwf_config", task.template_params["config_var"])
+            self.assertEqual("subwf_job_props", task.template_params["job_properties_var"])
+        # The tasks of the subworkflow are not changed
+        for node in self.subworkflow.nodes.values():
+            for task in node.tasks:
+                self.assertNotIn("config_var", task.template_params)
+
+    def test_should_inline_nested_subworkflows(self):
+        nested_subworkflow = Workflow(input_directory_path="", output_directory_path="", dag_name="nested")
+        add_node(nested_subworkflow, "action", [Task(task_id="action", template_name="shell.tpl")])
+        _add_subworkflow_node(self.subworkflow, "nested", nested_subworkflow)
+
+        InlineSubworkflowTransformer().process_workflow(self.workflow)
+
+        tasks = {task.task_id: task for task in self.subworkflow_node.tasks}
+        self.assertEqual("subwf_nested_config", tasks["subwf.nested"].template_params["config_var"])
+        self.assertEqual("subwf_nested_config", tasks["subwf.nested.action"].template_params["config_var"])
+        self.assertEqual("subwf_config", tasks["subwf.first"].template_params["config_var"])
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Merge Prepare Transformer tests
+"""
+import unittest
+from xml.etree import ElementTree as ET
+
+from o2a.converter.parsed_action_node import ParsedActionNode
+from o2a.converter.relation import Relation
+from o2a.converter.task import Task
+from o2a.converter.workflow import Workflow
+from o2a.mappers.dummy_mapper import DummyMapper
+from o2a.mappers.shell_mapper import ShellMapper
+from o2a.o2a_libs.property_utils import PropertySet
+from o2a.transformers.merge_prepare_transformer import MergePrepareTransformer
+
+PROPS = PropertySet(config={}, job_properties={"nameNode": "hdfs://"})
+
+
+def _create_fork_node(workflow: Workflow, tag: str = "fork") -> ParsedActionNode:
+    mapper = DummyMapper(oozie_node=ET.Element(tag), name=tag, dag_name="DAG_NAME_B")
+    node = ParsedActionNode(mapper, *mapper.to_tasks_and_relations())
+    workflow.nodes[node.name] = node
+    return node
+
+
+def _create_shell_node(workflow: Workflow, name: str, delete_path: str, mkdir_path: str) -> ParsedActionNode:
+    # language=XML
+    shell_node_str = f"""
+<shell>
+    <resource-manager>localhost:8032</resource-manager>
+    <name-node>hdfs://</name-node>
+    <prepare>
+        <delete path="${{nameNode}}{delete_path}"/>
+        <mkdir path="${{nameNode}}{mkdir_path}"/>
+    </prepare>
+    <exec>echo</exec>
+</shell>
+"""
+    mapper = ShellMapper(
+        oozie_node=ET.fromstring(shell_node_str), name=name, dag_name="DAG_NAME_B", props=PROPS
+    )
+    node = ParsedActionNode(mapper, *mapper.to_tasks_and_relations())
+    workflow.nodes[node.name] = node
+    return node
+
+
+class MergePrepareTransformerTest(unittest.TestCase):
+    def setUp(self):
+        self.workflow = Workflow(input_directory_path="", output_directory_path="", dag_name="DAG_NAME_B")
+        self.fork_node = _create_fork_node(self.workflow)
+        self.first_node = _create_shell_node(self.workflow, "first", "/out/first", "/in/shared")
+        self.second_node = _create_shell_node(self.workflow, "second", "/out/second", "/in/shared")
+        self.fork_node.downstream_names = ["first", "second"]
+
+    def test_should_merge_prepare_tasks_after_fork(self):
+        MergePrepareTransformer().process_workflow(self.workflow)
+
+        self.assertEqual(
+            [
+                Task(task_id="fork", template_name="dummy.tpl"),
+                Task(
+                    task_id="fork_prepare",
+                    template_name="prepare.tpl",
+                    template_params={"delete": "/out/first /out/second", "mkdir": "/in/shared"},
+                ),
+            ],
+            self.fork_node.tasks,
+        )
+        self.assertEqual([Relation(from_task_id="fork", to_task_id="fork_prepare")], self.fork_node.relations)
+        self.assertEqual(["first"], [task.task_id for task in self.first_node.tasks])
+        self.assertEqual([], self.first_node.relations)
+        self.assertEqual(["second"], [task.task_id for task in self.second_node.tasks])
+        self.assertEqual([], self.second_node.relations)
+
+    def test_should_not_merge_prepare_of_node_reachable_from_other_node(self):
+        other_node = _create_fork_node(self.workflow, tag="join")
+        other_node.downstream_names = ["second"]
+
+        MergePrepareTransformer().process_workflow(self.workflow)
+
+        self.assertEqual(["fork"], [task.task_id for task in self.fork_node.tasks])
+        self.assertEqual(["first_prepare", "first"], [task.task_id for task in self.first_node.tasks])
+        self.assertEqual(["second_prepare", "second"], [task.task_id for task in self.second_node.tasks])
+
+    def test_should_not_merge_prepare_after_other_nodes(self):
+        self.workflow.nodes["fork"].mapper.oozie_node.tag = "decision"
+
+        MergePrepareTransformer().process_workflow(self.workflow)
+
+        self.assertEqual(["fork"], [task.task_id for task in self.fork_node.tasks])
+        self.assertEqual(["first_prepare", "first"], [task.task_id for task in self.first_node.tasks])
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Reschedule Job Transformer tests
+"""
+import unittest
+
+from airflow.utils.trigger_rule import TriggerRule
+
+from o2a.converter.relation import Relation
+from o2a.converter.task import Task
+from o2a.converter.workflow import Workflow
+from o2a.transformers.reschedule_job_transformer import RescheduleJobTransformer
+from tests.transformers.utils import add_node, get_relations
+
+
+class RescheduleJobTransformerTest(unittest.TestCase):
+    def setUp(self):
+        self.workflow = Workflow(input_directory_path="", output_directory_path="", dag_name="DAG_NAME_B")
+        add_node(
+            self.workflow,
+            "pig",
+            [
+                Task(task_id="pig_prepare", template_name="prepare.tpl"),
+                Task(
+                    task_id="pig",
+                    template_name="pig.tpl",
+                    trigger_rule=TriggerRule.ONE_SUCCESS,
+                    template_params={"script_file_name": "id.pig"},
+                ),
+            ],
+        ).relations.append(Relation(from_task_id="pig_prepare", to_task_id="pig"))
+        add_node(
+            self.workflow,
+            "fs",
+            [
+                Task(task_id="fs_fs_0_mkdir", template_name="fs_op.tpl"),
+                Task(task_id="fs_fs_1_delete", template_name="fs_op.tpl"),
+            ],
+        ).relations.append(Relation(from_task_id="fs_fs_0_mkdir", to_task_id="fs_fs_1_delete"))
+        add_node(self.workflow, "end", [Task(task_id="end", template_name="dummy.tpl")])
+        add_node(self.workflow, "fail", [Task(task_id="fail", template_name="kill.tpl")])
+        self.workflow.relations.update(
+            {
+                Relation(from_task_id="pig", to_task_id="fs_fs_0_mkdir"),
+                Relation(from_task_id="pig", to_task_id="fail", is_error=True),
+                Relation(from_task_id="fs_fs_1_delete", to_task_id="end"),
+            }
+        )
+
+    def test_should_add_sensors(self):
+        RescheduleJobTransformer(poke_interval=30).process_workflow(self.workflow)
+
+        pig_node = self.workflow.nodes["pig"]
+        self.assertEqual(["pig_prepare", "pig", "pig_sensor"], [task.task_id for task in pig_node.tasks])
+        pig_task = pig_node.tasks[1]
+        self.assertEqual(TriggerRule.ONE_SUCCESS, pig_task.trigger_rule)
+        self.assertEqual({"script_file_name": "id.pig", "async_submit": True}, pig_task.template_params)
+        self.assertEqual(
+            Task(
+                task_id="pig_sensor",
+                template_name="dataproc_job_sensor.tpl",
+                template_params={
+                    "job_id": "{{ task_instance.xcom_pull(task_ids='pig') }}",
+                    "poke_interval": 30,
+                },
+            ),
+            pig_node.tasks[2],
+        )
+        self.assertEqual({"pig_prepare>pig", "pig>pig_sensor"}, get_relations(pig_node.relations))
+        self.assertEqual(
+            ["fs_fs_0_mkdir", "fs_fs_0_mkdir_sensor", "fs_fs_1_delete", "fs_fs_1_delete_sensor"],
+            [task.task_id for task in self.workflow.nodes["fs"].tasks],
+        )
+        self.assertEqual(
+            {
+                "fs_fs_0_mkdir>fs_fs_0_mkdir_sensor",
+                "fs_fs_0_mkdir_sensor>fs_fs_1_delete",
+                "fs_fs_1_delete>fs_fs_1_delete_sensor",
+            },
+            get_relations(self.workflow.nodes["fs"].relations),
+        )
+        self.assertEqual(
+            {
+                Relation(from_task_id="pig_sensor", to_task_id="fs_fs_0_mkdir"),
+                Relation(from_task_id="pig_sensor", to_task_id="fail", is_error=True),
+                Relation(from_task_id="fs_fs_1_delete_sensor", to_task_id="end"),
+            },
+            self.workflow.relations,
+        )
+        self.assertIn(
+            "from o2a.o2a_libs import dataproc_jobs as dataproc_jobs_lib", self.workflow.dependencies
+        )
+
+    def test_sensor_should_use_properties_of_job(self):
+        pig_task = self.workflow.nodes["pig"].tasks[1]
+        pig_task.template_params.update(config_var="subwf_config", job_properties_var="subwf_job_props")
+
+        RescheduleJobTransformer().process_workflow(self.workflow)
+
+        sensor_params = self.workflow.nodes["pig"].tasks[2].template_params
+        self.assertEqual("subwf_config", sensor_params["config_var"])
+        self.assertEqual("subwf_job_props", sensor_params["job_properties_var"])
+
+    def test_should_not_change_workflow_without_jobs(self):
+        workflow = Workflow(input_directory_path="", output_directory_path="", dag_name="DAG_NAME_B")
+        add_node(workflow, "end", [Task(task_id="end", template_name="dummy.tpl")])
+        dependencies = set(workflow.dependencies)
+
+        RescheduleJobTransformer().process_workflow(workflow)
+
+        self.assertEqual(["end"], [task.task_id for task in workflow.nodes["end"].tasks])
+        self.assertEqual(dependencies, workflow.dependencies)
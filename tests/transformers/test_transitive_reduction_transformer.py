@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Transitive Reduction Transformer tests
+"""
+import unittest
+from xml.etree import ElementTree as ET
+
+from airflow.utils.trigger_rule import TriggerRule
+
+from o2a.converter.exceptions import O2AException
+from o2a.converter.task import Task
+from o2a.converter.workflow import Workflow
+from o2a.mappers.dummy_mapper import DummyMapper
+from o2a.transformers.transitive_reduction_transformer import TransitiveReductionTransformer
+from tests.transformers.utils import add_node, add_relations, get_relations
+
+
+class TransitiveReductionTransformerTest(unittest.TestCase):
+    def setUp(self):
+        self.workflow = Workflow(input_directory_path="", output_directory_path="", dag_name="DAG_NAME_B")
+
+    def _add_task(self, name: str, trigger_rule: str = TriggerRule.ALL_SUCCESS, template_name="shell.tpl"):
+        mapper = DummyMapper(oozie_node=ET.Element("action"), name=name, dag_name="DAG_NAME_B")
+        task = Task(task_id=name, template_name=template_name, trigger_rule=trigger_rule)
+        add_node(self.workflow, name, [task], mapper=mapper)
+
+    def _add_relations(self, *relations: str):
+        add_relations(self.workflow, *relations)
+
+    def _get_relations(self):
+        return get_relations(self.workflow.relations)
+
+    def test_should_remove_implied_relations(self):
+        for name in "abcde":
+            self._add_task(name)
+        self._add_relations("a>b", "b>c", "c>d", "a>c", "a>d", "b>d", "a>e", "d>e")
+        transformer = TransitiveReductionTransformer()
+
+        transformer.process_workflow(self.workflow)
+
+        self.assertEqual({"a>b", "b>c", "c>d", "d>e"}, self._get_relations())
+        self.assertEqual({"DAG_NAME_B": 4}, transformer.removed_relations)
+
+    def test_should_keep_relations_to_tasks_with_other_trigger_rules(self):
+        self._add_task("a")
+        self._add_task("b")
+        self._add_task("c", trigger_rule=TriggerRule.ONE_SUCCESS)
+        self._add_relations("a>b", "b>c", "a>c")
+
+        TransitiveReductionTransformer().process_workflow(self.workflow)
+
+        self.assertEqual({"a>b", "b>c", "a>c"}, self._get_relations())
+
+    def test_should_keep_relations_implied_through_tasks_with_other_trigger_rules(self):
+        self._add_task("a")
+        self._add_task("b", trigger_rule=TriggerRule.ONE_FAILED)
+        self._add_task("c")
+        self._add_relations("a>b", "b>c", "a>c")
+
+        TransitiveReductionTransformer().process_workflow(self.workflow)
+
+        self.assertEqual({"a>b", "b>c", "a>c"}, self._get_relations())
+
+    def test_should_keep_relations_from_decision(self):
+        self._add_task("decision", template_name="decision.tpl")
+        self._add_task("b")
+        self._add_task("c")
+        self._add_relations("decision>b", "b>c", "decision>c")
+
+        TransitiveReductionTransformer().process_workflow(self.workflow)
+
+        self.assertEqual({"decision>b", "b>c", "decision>c"}, self._get_relations())
+
+    def test_should_fail_on_cycle(self):
+        self._add_task("a")
+        self._add_task("b")
+        self._add_relations("a>b", "b>a")
+
+        with self.assertRaises(O2AException):
+            TransitiveReductionTransformer().process_workflow(self.workflow)
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Helpers building the workflows in the tests of the transformers"""
+from typing import Iterable, List, Set
+from unittest import mock
+
+from o2a.converter.parsed_action_node import ParsedActionNode
+from o2a.converter.relation import Relation
+from o2a.converter.task import Task
+from o2a.converter.workflow import Workflow
+from o2a.mappers.base_mapper import BaseMapper
+
+
+def add_node(workflow: Workflow, name: str, tasks: List[Task], mapper: BaseMapper = None) -> ParsedActionNode:
+    """
+    Adds the node with the tasks to the workflow. The mapper is mocked unless it is given.
+    """
+    if mapper is None:
+        mapper = mock.Mock(spec=BaseMapper)
+        mapper.name = name
+    node = ParsedActionNode(mapper, tasks=tasks)
+    workflow.nodes[name] = node
+    return node
+
+
+def add_relations(workflow: Workflow, *relations: str) -> None:
+    """
+    Adds the relations written as "from_task_id>to_task_id" to the workflow.
+    """
+    for relation in relations:
+        from_task_id, to_task_id = relation.split(">")
+        workflow.relations.add(Relation(from_task_id=from_task_id, to_task_id=to_task_id))
+
+
+def get_relations(relations: Iterable[Relation]) -> Set[str]:
+    """
+    Returns the relations written as "from_task_id>to_task_id".
+    """
+    return {f"{relation.from_task_id}>{relation.to_task_id}" for relation in relations}
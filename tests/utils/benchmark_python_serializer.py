@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmarks the serialization of the property sets to Python code
+
+Compares the serializer with the recursive one it replaced, kept here as the reference.
+Run it from the root of the repository with:
+
+    python -m tests.utils.benchmark_python_serializer
+"""
+import timeit
+from typing import Any, Callable, Dict, List, Set, Tuple
+
+from o2a.utils import python_serializer
+from o2a.utils.el_utils import escape_string_with_python_escapes
+
+PROPERTY_COUNT = 10000
+
+OBJECTS: List[Tuple[str, Any]] = [
+    ("flat dict of 10k properties", {f"key.{i}": f"value {i}" for i in range(PROPERTY_COUNT)}),
+    ("flat list of 10k strings", [f"value {i}" for i in range(PROPERTY_COUNT)]),
+    (
+        "nested dict of 1k lists",
+        {f"key.{i}": [f"value {i}", True, {"nested": (None,)}] for i in range(PROPERTY_COUNT // 10)},
+    ),
+]
+
+
+def _reference_serialize(serializable_obj: Any) -> str:
+    def serialize_recursively(target: Any, markers: Set[int]) -> str:
+        marker_id = id(target)
+        if marker_id in markers:
+            raise ValueError("Circular reference detected")
+        markers.add(marker_id)
+        if isinstance(target, str):
+            buf = f"{escape_string_with_python_escapes(target)}"
+        elif isinstance(target, dict):
+            buf = (
+                "{"
+                + ", ".join(
+                    f"{serialize_recursively(key, markers)}: {serialize_recursively(value, markers)}"
+                    for key, value in target.items()
+                )
+                + "}"
+            )
+        elif isinstance(target, list):
+            buf = "[" + ", ".join(serialize_recursively(item, markers) for item in target) + "]"
+        elif isinstance(target, set):
+            items = ", ".join(serialize_recursively(item, markers) for item in target)
+            buf = "{" + items + "}" if target else "set()"
+        elif isinstance(target, tuple):
+            buf = "(" + ", ".join(serialize_recursively(item, markers) for item in target) + ")"
+        else:
+            buf = {True: "True", False: "False", None: "None"}[target]
+        markers.remove(marker_id)
+        return buf
+
+    return serialize_recursively(serializable_obj, set())
+
+
+def _time_ms(serialize: Callable[[Any], str], target: Any, number: int, cold: bool = False) -> str:
+    def run():
+        if cold:
+            python_serializer._serialize_str.cache_clear()  # pylint: disable=protected-access
+        serialize(target)
+
+    seconds = min(timeit.repeat(run, number=number, repeat=5)) / number
+    return f"{seconds * 1000:.2f}ms"
+
+
+def main(number: int = 20) -> None:
+    results: Dict[str, List[str]] = {}
+    for name, target in OBJECTS:
+        assert python_serializer.serialize(target) == _reference_serialize(target)
+        results[name] = [
+            _time_ms(_reference_serialize, target, number),
+            _time_ms(python_serializer.serialize, target, number, cold=True),
+            _time_ms(python_serializer.serialize, target, number),
+        ]
+    print(f"{'object':<30}{'recursive':>14}{'cold cache':>14}{'warm cache':>14}")
+    for name, timings in results.items():
+        print(f"{name:<30}" + "".join(f"{timing:>14}" for timing in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -80,6 +80,34 @@ class TestELUtils(unittest.TestCase):
         replaced = el_utils.replace_el_with_var(el_var, props=props)
         self.assertEqual(replaced, expected)
 
+    def test_replace_el_with_var_multiple_vars(self):
+        job_properties = {"user": "airflow", "host": "apache.org"}
+        props = PropertySet(job_properties=job_properties, config={}, action_node_properties={})
+        el_var = "${user}@${host} ${user} ${missing}"
+        expected = "airflow@apache.org airflow ${missing}"
+
+        replaced = el_utils.replace_el_with_var(el_var, props=props, quote=False)
+        self.assertEqual(replaced, expected)
+
+    def test_replace_el_with_var_nested_references(self):
+        job_properties = {"nameNode": "hdfs://${host}:8020", "host": "localhost", "root": "${nameNode}/user"}
+        action_node_properties = {"host": "remotehost"}
+        props = PropertySet(
+            job_properties=job_properties, config={}, action_node_properties=action_node_properties
+        )
+        el_var = "${root}/${host}"
+        expected = "hdfs://remotehost:8020/user/remotehost"
+
+        replaced = el_utils.replace_el_with_var(el_var, props=props, quote=False)
+        self.assertEqual(replaced, expected)
+
+    def test_replace_el_with_var_cyclic_references(self):
+        job_properties = {"first": "a${second}", "second": "b${first}", "self": "${self}"}
+        props = PropertySet(job_properties=job_properties, config={}, action_node_properties={})
+
+        replaced = el_utils.replace_el_with_var("${first} ${self}", props=props, quote=False)
+        self.assertEqual(replaced, "a${second} ${self}")
+
     def test_parse_el_func(self):
         test_module = unittest.mock.Mock()
         test_module.__name__ = "test"
@@ -165,7 +193,7 @@ class TestELUtils(unittest.TestCase):
         expected = {"key": "value,value2,answer"}
         self.assertEqual(expected, el_utils.parse_els(prop_file.name, props=props))
 
-    def test_parse_els_multiple_line_with_back_references(self):
+    def test_parse_els_multiple_line_with_references(self):
         # Should remain unchanged, as the conversion from a comma-separated string to a List will
         # occur before writing to file.
         prop_file = tempfile.NamedTemporaryFile("w", delete=False)
@@ -187,11 +215,78 @@ key5=test
             "key": "value,value2,answer",
             "key2": "value",
             "key3": "refervalue",
-            "key4": "refer${key5}",  # no forward-references
+            "key4": "refertest",
             "key5": "test",
         }
         self.assertEqual(expected, el_utils.parse_els(prop_file.name, props=props))
 
+    def test_property_resolver_memoizes_values(self):
+        properties = {f"key{i}": f"${{key{i - 1}}}." for i in range(1, 5000)}
+        properties["key0"] = "value"
+        resolver = el_utils.PropertyResolver(properties)
+
+        self.assertEqual("value" + "." * 4999, resolver.resolve("key4999"))
+        self.assertEqual("value" + "." * 10, resolver.resolve("key10"))
+        with self.assertRaises(KeyError):
+            resolver.resolve("missing")
+
+    def test_property_resolver_keeps_raw_values_in_cycles(self):
+        properties = {
+            "start": "${first}/${end}",
+            "first": "${second}",
+            "second": "${end}${first}",
+            "end": "x",
+        }
+        resolver = el_utils.PropertyResolver(properties)
+
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual("${second}/x", resolver.resolve("start"))
+        self.assertEqual("${end}${first}", resolver.resolve("second"))
+        self.assertEqual("x", resolver.resolve("end"))
+
+    def test_parse_els_file_overrides_properties(self):
+        prop_file = tempfile.NamedTemporaryFile("w", delete=False)
+        prop_file.write("test=overridden\n" "key=${test}\n")
+        prop_file.close()
+
+        props = PropertySet(config={}, job_properties={"test": "answer"}, action_node_properties={})
+        expected = {"test": "overridden", "key": "overridden"}
+        self.assertEqual(expected, el_utils.parse_els(prop_file.name, props=props))
+        self.assertEqual({"test": "answer"}, props.job_properties)
+
+    def test_parse_els_cyclic_references(self):
+        prop_file = tempfile.NamedTemporaryFile("w", delete=False)
+        prop_file.write("first=${second}\n" "second=${first}\n" "third=value\n")
+        prop_file.close()
+
+        props = PropertySet(config={}, job_properties={}, action_node_properties={})
+        with self.assertLogs(level="WARNING"):
+            result = el_utils.parse_els(prop_file.name, props=props)
+        self.assertEqual({"first": "${second}", "second": "${first}", "third": "value"}, result)
+
+    def test_parse_els_extends_properties(self):
+        prop_file = tempfile.NamedTemporaryFile("w", delete=False)
+        prop_file.write("PATH=${PATH}:/x\n" "bin=${PATH}/bin\n" "self=${self}\n")
+        prop_file.close()
+
+        props = PropertySet(config={}, job_properties={"PATH": "/usr"}, action_node_properties={})
+        with self.assertLogs(level="WARNING") as logs:
+            result = el_utils.parse_els(prop_file.name, props=props)
+        self.assertEqual({"PATH": "/usr:/x", "bin": "/usr:/x/bin", "self": "${self}"}, result)
+        self.assertEqual(1, len(logs.output))
+        self.assertIn("self", logs.output[0])
+
+    def test_parse_els_long_chain_of_forward_references(self):
+        prop_file = tempfile.NamedTemporaryFile("w", delete=False)
+        prop_file.writelines(f"key{i}=${{key{i + 1}}}\n" for i in range(20000))
+        prop_file.write("key20000=value\n")
+        prop_file.close()
+
+        props = PropertySet(config={}, job_properties={}, action_node_properties={})
+        result = el_utils.parse_els(prop_file.name, props=props)
+        self.assertEqual(20001, len(result))
+        self.assertEqual({"value"}, set(result.values()))
+
     @parameterized.expand(
         [
             ("${nameNode}/examples/output-data/demo/pig-node", "/examples/output-data/demo/pig-node"),
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests file watcher"""
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from o2a.utils import file_watcher
+
+
+class FileWatcherTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = self.directory.name
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _write(self, name, content="content"):
+        path = os.path.join(self.path, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as file:
+            file.write(content)
+        return path
+
+    def test_compare_snapshots(self):
+        modified = self._write("modified.xml")
+        deleted = self._write("deleted.xml")
+        unchanged = self._write("hdfs/unchanged.xml")
+        old_snapshot = file_watcher.take_snapshot([self.path])
+
+        self._write("modified.xml", "new content")
+        os.remove(deleted)
+        created = self._write("hdfs/created.xml")
+        new_snapshot = file_watcher.take_snapshot([self.path])
+
+        self.assertIn(unchanged, new_snapshot)
+        self.assertEqual(
+            {modified, deleted, created}, file_watcher.compare_snapshots(old_snapshot, new_snapshot)
+        )
+
+    def test_polling_watcher(self):
+        watcher = file_watcher.PollingWatcher([self.path], interval=0.01)
+
+        self.assertEqual(set(), watcher.wait_for_changes(timeout=0.05))
+        created = self._write("workflow.xml")
+        self.assertEqual({created}, watcher.wait_for_changes(timeout=1))
+
+    @unittest.skipIf(file_watcher._load_libc() is None, "inotify is not available")
+    def test_inotify_watcher(self):
+        os.makedirs(os.path.join(self.path, "hdfs"))
+        watcher = file_watcher.InotifyWatcher([self.path])
+        try:
+            self.assertEqual(set(), watcher.wait_for_changes(timeout=0.05))
+            created = self._write("hdfs/workflow.xml")
+            self.assertIn(created, self._collect_changes(watcher))
+
+            # Files in the new directories are watched as well
+            os.makedirs(os.path.join(self.path, "new"))
+            self._collect_changes(watcher)
+            created = self._write("new/script.pig")
+            self.assertIn(created, self._collect_changes(watcher))
+        finally:
+            watcher.close()
+
+    @staticmethod
+    def _collect_changes(watcher):
+        changes = set()
+        while True:
+            new_changes = watcher.wait_for_changes(timeout=0.1)
+            if not new_changes:
+                return changes
+            changes.update(new_changes)
+
+    @mock.patch("o2a.utils.file_watcher.InotifyWatcher", side_effect=OSError("inotify is not available"))
+    def test_create_watcher_should_fall_back_to_polling(self, _):
+        watcher = file_watcher.create_watcher([self.path], polling_interval=0.5)
+
+        self.assertIsInstance(watcher, file_watcher.PollingWatcher)
+        self.assertEqual(0.5, watcher.interval)
+
+    @mock.patch("o2a.utils.file_watcher.STOP_CHECK_INTERVAL", 0.05)
+    def test_watch_should_debounce_changes(self):
+        os.makedirs(os.path.join(self.path, "output"))
+        stop_event = threading.Event()
+        calls = []
+
+        def on_change(changed):
+            calls.append(changed)
+            stop_event.set()
+
+        def edit():
+            time.sleep(0.2)
+            self._write("output/ignored.py")
+            for name in ["workflow.xml", "job.properties", "hdfs/script.pig"]:
+                self._write(name)
+                time.sleep(0.02)
+
+        editor = threading.Thread(target=edit)
+        editor.start()
+        file_watcher.watch(
+            get_directories=lambda: [self.path],
+            on_change=on_change,
+            debounce=0.2,
+            polling_interval=0.01,
+            excluded_directories=[os.path.join(self.path, "output")],
+            stop_event=stop_event,
+        )
+        editor.join()
+
+        self.assertEqual(1, len(calls))
+        changed_files = {path for path in calls[0] if os.path.isfile(path)}
+        self.assertEqual(
+            {os.path.join(self.path, name) for name in ["workflow.xml", "job.properties", "hdfs/script.pig"]},
+            changed_files,
+        )
+
+    @mock.patch("o2a.utils.file_watcher.STOP_CHECK_INTERVAL", 0.05)
+    def test_watch_should_not_lose_changes_made_while_converting(self):
+        stop_event = threading.Event()
+        # Fails instead of waiting forever for the lost changes
+        timeout = threading.Timer(5, stop_event.set)
+        timeout.start()
+        calls = []
+
+        def on_change(changed):
+            calls.append({path for path in changed if os.path.isfile(path)})
+            if len(calls) == 1:
+                # The file is saved while the workflow is converted
+                self._write("job.properties")
+            else:
+                stop_event.set()
+
+        editor = threading.Timer(0.2, self._write, args=["workflow.xml"])
+        editor.start()
+        file_watcher.watch(
+            get_directories=lambda: [self.path],
+            on_change=on_change,
+            debounce=0.1,
+            polling_interval=0.01,
+            stop_event=stop_event,
+        )
+        editor.join()
+        timeout.cancel()
+
+        self.assertEqual(
+            [{os.path.join(self.path, "workflow.xml")}, {os.path.join(self.path, "job.properties")}], calls
+        )
+
+    @mock.patch("o2a.utils.file_watcher.InotifyWatcher", side_effect=OSError("inotify is not available"))
+    @mock.patch("o2a.utils.file_watcher.STOP_CHECK_INTERVAL", 0.05)
+    def test_watch_should_watch_new_directories(self, _):
+        os.makedirs(os.path.join(self.path, "parent"))
+        os.makedirs(os.path.join(self.path, "child"))
+        directories = [os.path.join(self.path, "parent")]
+        stop_event = threading.Event()
+        # Fails instead of waiting forever for the lost changes
+        timeout = threading.Timer(5, stop_event.set)
+        timeout.start()
+        calls = []
+
+        def on_change(changed):
+            calls.append(changed)
+            if len(calls) == 1:
+                # The parent workflow starts using the child workflow
+                directories.append(os.path.join(self.path, "child"))
+            else:
+                stop_event.set()
+
+        def edit():
+            time.sleep(0.2)
+            self._write("parent/workflow.xml")
+            time.sleep(0.5)
+            self._write("child/workflow.xml")
+
+        editor = threading.Thread(target=edit)
+        editor.start()
+        file_watcher.watch(
+            get_directories=lambda: list(directories),
+            on_change=on_change,
+            debounce=0.1,
+            polling_interval=0.01,
+            stop_event=stop_event,
+        )
+        editor.join()
+        timeout.cancel()
+
+        self.assertEqual(
+            [
+                {os.path.join(self.path, "parent/workflow.xml")},
+                {os.path.join(self.path, "child/workflow.xml")},
+            ],
+            calls,
+        )
@@ -14,6 +14,7 @@
 # limitations under the License.
 """Tests Python serializer"""
 
+import ast
 import unittest
 
 from o2a.utils import python_serializer
@@ -95,3 +96,35 @@ class PythonSerializerModule(unittest.TestCase):
     def test_should_raise_exception_on_invalid_type(self):
         with self.assertRaisesRegex(ValueError, "Type '<class 'type'>' is not serializable"):
             python_serializer.serialize([unittest.TestCase])
+
+    def test_should_serialize_large_flat_dict(self):
+        properties = {f"key.{i}": f"value '{i}'\n" for i in range(10000)}
+        self.assertEqual(properties, ast.literal_eval(python_serializer.serialize(properties)))
+
+    def test_should_serialize_large_nested_dict(self):
+        properties = {f"key.{i}": [f"value {i}", True, {"nested": (None,)}] for i in range(1000)}
+        text = python_serializer.serialize(properties)
+        self.assertTrue(text.startswith("{'key.0': ['value 0', True, {'nested': (None)}], 'key.1': "))
+        self.assertTrue(text.endswith("'key.999': ['value 999', True, {'nested': (None)}]}"))
+
+    def test_should_serialize_deeply_nested_list(self):
+        root: list = []
+        current = root
+        for _ in range(5000):
+            child: list = []
+            current.append(child)
+            current = child
+        self.assertEqual("[" * 5001 + "]" * 5001, python_serializer.serialize(root))
+
+    def test_should_serialize_tuple_key(self):
+        self.assertEqual("{('A'): 'B', 'C': ['D']}", python_serializer.serialize({("A",): "B", "C": ["D"]}))
+
+    def test_should_detect_circular_reference_in_dict(self):
+        first = {"A": "B"}
+        first["C"] = [first]
+        with self.assertRaisesRegex(ValueError, "Circular reference detected"):
+            python_serializer.serialize(first)
+
+    def test_should_allow_repeated_reference(self):
+        shared = ["A"]
+        self.assertEqual("[['A'], ['A']]", python_serializer.serialize([shared, shared]))
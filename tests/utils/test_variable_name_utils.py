@@ -38,3 +38,7 @@ class ConvertToPythonVariableTestCase(TestCase):
 
     def test_should_remove_leading_invalid_characters(self):
         self.assertEqual(convert_to_python_variable("123123TEST'TEST"), "TEST_TEST")
+
+    def test_should_keep_leading_underscores(self):
+        self.assertEqual(convert_to_python_variable("_a"), "_a")
+        self.assertEqual(convert_to_python_variable("_1"), "_1")